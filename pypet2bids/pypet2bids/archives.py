@@ -0,0 +1,249 @@
+"""
+Reads PET data straight out of zip and tar archives so that whole archives don't need to be extracted before they're
+converted. The headers of the members of an archive are read in place and only the members that are needed, PET dicoms
+or a single ECAT, are written out.
+
+Example:
+
+.. code-block:: python
+
+    from pypet2bids.archives import extract_pet_dicoms
+
+    extract_pet_dicoms("incoming/sub-01.zip", "/tmp/sub-01_dicoms")
+
+| *Authors: Anthony Galassi*
+| *Copyright OpenNeuroPET team*
+"""
+
+import gzip
+import io
+import os
+import shutil
+import tarfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+
+import pydicom
+
+try:
+    import helper_functions
+    import read_ecat
+except ModuleNotFoundError:
+    import pypet2bids.helper_functions as helper_functions
+    import pypet2bids.read_ecat as read_ecat
+
+logger = helper_functions.logger("pypet2bids")
+
+
+def is_archive(path) -> bool:
+    """
+    Checks whether a path is a zip or tar archive (compressed or not).
+
+    :param path: path to check
+    :return: True if path is a file that can be opened as a zip or tar archive
+    """
+    path = Path(path)
+    if not path.is_file():
+        return False
+    return zipfile.is_zipfile(path) or tarfile.is_tarfile(path)
+
+
+def member_destination(destination, member_name: str) -> Path:
+    """
+    Maps the name of an archive member to a path inside the destination folder, absolute paths and parent directory
+    references in the member name are dropped so members can't be written outside of the destination.
+
+    :param destination: folder members are extracted into
+    :param member_name: the name of the member in the archive
+    :return: the path to extract the member to
+    """
+    parts = [
+        part
+        for part in PurePosixPath(member_name.replace("\\", "/")).parts
+        if part not in ("/", "..", ".") and not part.endswith(":")
+    ]
+    return Path(destination).joinpath(*parts)
+
+
+def _dicom_modality(file_object):
+    try:
+        header = pydicom.dcmread(
+            file_object, stop_before_pixels=True, specific_tags=["Modality"]
+        )
+    except (pydicom.errors.InvalidDicomError, EOFError, OSError, ValueError):
+        return None
+    return header.get("Modality", None)
+
+
+def _write_member(data: bytes, path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as outfile:
+        outfile.write(data)
+    return path
+
+
+def _extract_pet_dicoms_from_zip(archive_path, destination, n_jobs):
+    local = threading.local()
+    opened = []
+
+    def open_archive():
+        # zip files aren't safe to share between threads, each thread opens its own
+        if not hasattr(local, "archive"):
+            local.archive = zipfile.ZipFile(archive_path)
+            opened.append(local.archive)
+        return local.archive
+
+    def member_modality(info):
+        with open_archive().open(info) as member:
+            return _dicom_modality(member)
+
+    def extract(info):
+        path = member_destination(destination, info.filename)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open_archive().open(info) as member, open(path, "wb") as outfile:
+            shutil.copyfileobj(member, outfile)
+        return path
+
+    with zipfile.ZipFile(archive_path) as archive:
+        members = [info for info in archive.infolist() if not info.is_dir()]
+    try:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            modalities = list(executor.map(member_modality, members))
+            pet_members = [
+                info for info, modality in zip(members, modalities) if modality == "PT"
+            ]
+            return list(executor.map(extract, pet_members))
+    finally:
+        for archive in opened:
+            archive.close()
+
+
+def _extract_pet_dicoms_from_tar(archive_path, destination, n_jobs):
+    # members of a compressed tar can only be read in order, so each is read once and PET members are written out by
+    # a pool of threads while the archive is read
+    writes = []
+    with tarfile.open(archive_path, "r:*") as archive, ThreadPoolExecutor(
+        max_workers=n_jobs
+    ) as executor:
+        for member in archive:
+            if not member.isfile():
+                continue
+            data = archive.extractfile(member).read()
+            if _dicom_modality(io.BytesIO(data)) == "PT":
+                writes.append(
+                    executor.submit(
+                        _write_member,
+                        data,
+                        member_destination(destination, member.name),
+                    )
+                )
+        return [write.result() for write in writes]
+
+
+def extract_pet_dicoms(archive_path, destination, n_jobs: int = None) -> list:
+    """
+    Extracts only the PET dicoms from a zip or tar archive. The header of each member is read from the archive to
+    determine its modality, members that aren't PET dicoms are never written to disk. Zip members are checked and
+    extracted in parallel.
+
+    :param archive_path: path to a zip or tar archive
+    :param destination: folder to extract the PET dicoms to, the folder structure of the archive is kept
+    :param n_jobs: the number of threads to use, defaults to the number of cpus + 4 up to 32
+    :return: a list of the paths of the extracted dicoms
+    """
+    n_jobs = n_jobs or min(32, (os.cpu_count() or 1) + 4)
+    Path(destination).mkdir(parents=True, exist_ok=True)
+    if zipfile.is_zipfile(archive_path):
+        extracted = _extract_pet_dicoms_from_zip(archive_path, destination, n_jobs)
+    elif tarfile.is_tarfile(archive_path):
+        extracted = _extract_pet_dicoms_from_tar(archive_path, destination, n_jobs)
+    else:
+        raise ValueError(f"{archive_path} is not a zip or tar archive")
+    if not extracted:
+        raise FileNotFoundError(f"No PET dicoms found in {archive_path}")
+    logger.info(f"Extracted {len(extracted)} PET dicoms from {archive_path}")
+    return extracted
+
+
+def _is_ecat(file_object) -> bool:
+    try:
+        read_ecat.determine_ecat_version(file_object.read(read_ecat.MAIN_HEADER_SIZE))
+    except Exception:
+        return False
+    return True
+
+
+def _open_member(archive, name):
+    # gzipped members are decompressed as they're read
+    if isinstance(archive, zipfile.ZipFile):
+        member = archive.open(name)
+    else:
+        member = archive.extractfile(name)
+    if name.endswith(".gz"):
+        return gzip.GzipFile(fileobj=member)
+    return member
+
+
+def _open_archive(archive_path):
+    if zipfile.is_zipfile(archive_path):
+        return zipfile.ZipFile(archive_path)
+    return tarfile.open(archive_path, "r:*")
+
+
+def _member_names(archive) -> list:
+    if isinstance(archive, zipfile.ZipFile):
+        return [info.filename for info in archive.infolist() if not info.is_dir()]
+    return [member.name for member in archive.getmembers() if member.isfile()]
+
+
+def find_ecat_members(archive_path) -> list:
+    """
+    Lists the ECAT files in an archive, a member is an ECAT if its 512 byte main header can be read, gzipped ECATs are
+    included.
+
+    :param archive_path: path to a zip or tar archive
+    :return: the names of the ECAT members
+    """
+    ecat_members = []
+    with _open_archive(archive_path) as archive:
+        for name in _member_names(archive):
+            try:
+                with _open_member(archive, name) as member:
+                    if _is_ecat(member):
+                        ecat_members.append(name)
+            except (OSError, EOFError):
+                continue
+    return ecat_members
+
+
+def extract_ecat(archive_path, destination, member: str = None) -> Path:
+    """
+    Streams a single ECAT out of an archive, a gzipped ECAT is decompressed as it's written so it's written to disk
+    only once. The ECAT readers need to seek within the file, so it can't be read from the archive directly.
+
+    :param archive_path: path to a zip or tar archive
+    :param destination: folder to write the ECAT to
+    :param member: name of the ECAT in the archive, only required if the archive contains more than one ECAT
+    :return: the path of the extracted ECAT
+    """
+    if member is None:
+        ecat_members = find_ecat_members(archive_path)
+        if not ecat_members:
+            raise FileNotFoundError(f"No ECAT files found in {archive_path}")
+        if len(ecat_members) > 1:
+            raise ValueError(
+                f"{archive_path} contains more than one ECAT, choose one of {', '.join(ecat_members)}"
+            )
+        member = ecat_members[0]
+
+    path = member_destination(destination, member)
+    if path.name.endswith(".gz"):
+        path = path.with_name(path.name[: -len(".gz")])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _open_archive(archive_path) as archive, _open_member(
+        archive, member
+    ) as infile, open(path, "wb") as outfile:
+        shutil.copyfileobj(infile, outfile)
+    return path
@@ -0,0 +1,547 @@
+"""
+Compares two BIDS trees, e.g. the outputs of two releases of pypet2bids run on the same data. Files are paired by
+their BIDS entities rather than by their exact path so that differences in entity order or in subject/session folder
+names don't prevent a comparison. Paired files are then compared in a pool of processes:
+
+- JSON sidecars key by key with a numeric tolerance
+- NIfTI images by streaming both images in chunks, chunks with identical bytes are skipped and the remaining
+  chunks are compared voxel by voxel (or on a sample of voxels) against a numeric tolerance
+- TSV files cell by cell with the same numeric tolerance
+- anything else by checksum
+
+The results are written out as a machine-readable json report.
+
+Example:
+
+.. code-block:: bash
+
+    bidsdiff /data/bids_release_1 /data/bids_release_2 --report diff.json --njobs 8
+
+| *Authors: Anthony Galassi*
+| *Copyright OpenNeuroPET team*
+"""
+
+import argparse
+import csv
+import gzip
+import hashlib
+import json
+import logging
+import math
+import os
+import pathlib
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import nibabel
+import numpy
+
+try:
+    import helper_functions
+except ModuleNotFoundError:
+    import pypet2bids.helper_functions as helper_functions
+
+logger = helper_functions.logger("pypet2bids")
+
+# number of voxels read from each image at a time when comparing NIfTI files
+NIFTI_CHUNK_VOXELS = 1 << 20
+
+
+def split_bids_name(file_name: str):
+    """
+    Splits a BIDS file name into its entities, suffix, and extension.
+
+    >>> split_bids_name("sub-01_ses-baseline_rec-acdyn_pet.nii.gz")
+    ({'sub': '01', 'ses': 'baseline', 'rec': 'acdyn'}, 'pet', '.nii.gz')
+
+    :param file_name: name of the file, without any leading directories
+    :return: a dictionary of entities, the suffix, and the extension (all extensions for .nii.gz and the like)
+    """
+    stem, dot, extension = file_name.partition(".")
+    entities, suffix = {}, ""
+    for part in stem.split("_"):
+        key, dash, value = part.partition("-")
+        if dash:
+            entities[key] = value
+        else:
+            suffix = part
+    return entities, suffix, dot + extension
+
+
+def bids_key(path: pathlib.Path, root: pathlib.Path) -> str:
+    """
+    Creates a key to pair files in two BIDS trees. The key is made from the sorted entities, suffix, and extension of
+    the file along with any folders it is in that aren't subject or session folders (e.g. pet, anat, or
+    derivatives/pipeline). Files without entities such as dataset_description.json are keyed on their relative path.
+
+    :param path: path to a file in the BIDS tree
+    :param root: the root of the BIDS tree
+    :return: a string key
+    """
+    relative = path.relative_to(root)
+    entities, suffix, extension = split_bids_name(relative.name)
+    if not entities:
+        return relative.as_posix()
+    folders = [
+        part
+        for part in relative.parent.parts
+        if not (part.startswith("sub-") or part.startswith("ses-"))
+    ]
+    entity_string = "_".join(
+        f"{key}-{value}" for key, value in sorted(entities.items())
+    )
+    return "/".join(folders + [f"{entity_string}_{suffix}{extension}"])
+
+
+def collect_bids_files(root, extensions: list = None) -> dict:
+    """
+    Walks a BIDS tree collecting every file keyed by bids_key.
+
+    :param root: root of the BIDS tree
+    :param extensions: only collect files with these extensions (e.g. ['.json', '.nii.gz']), collects all if None
+    :return: a dictionary of {bids_key: path}
+    """
+    root = pathlib.Path(root)
+    collected = {}
+    for folder, _, files in os.walk(root):
+        for file_name in files:
+            if file_name.startswith("."):
+                continue
+            if extensions and split_bids_name(file_name)[2] not in extensions:
+                continue
+            path = pathlib.Path(folder) / file_name
+            key = bids_key(path, root)
+            if key in collected:
+                logger.warning(
+                    f"{path} and {collected[key]} have the same BIDS entities, only comparing the first"
+                )
+                continue
+            collected[key] = path
+    return collected
+
+
+def values_match(left, right, rtol: float, atol: float) -> bool:
+    """
+    Compares two json values, numbers are compared with a tolerance and lists and dictionaries are compared element by
+    element.
+    """
+    if isinstance(left, bool) or isinstance(right, bool):
+        return left == right
+    if isinstance(left, (int, float)) and isinstance(right, (int, float)):
+        if math.isnan(left) and math.isnan(right):
+            return True
+        return math.isclose(left, right, rel_tol=rtol, abs_tol=atol)
+    if isinstance(left, list) and isinstance(right, list):
+        return len(left) == len(right) and all(
+            values_match(l, r, rtol, atol) for l, r in zip(left, right)
+        )
+    if isinstance(left, dict) and isinstance(right, dict):
+        return left.keys() == right.keys() and all(
+            values_match(left[k], right[k], rtol, atol) for k in left
+        )
+    return left == right
+
+
+def compare_json_files(left_path, right_path, rtol: float = 1e-6, atol: float = 0.0):
+    """
+    Compares two json sidecars key by key. Strings that differ only in case or word order are recorded as approximate
+    matches rather than differences.
+
+    :return: a dictionary recording keys only present in one file, keys whose values differ, and approximate matches
+    """
+    with open(left_path) as left_file:
+        left = json.load(left_file)
+    with open(right_path) as right_file:
+        right = json.load(right_file)
+
+    result = {
+        "only_in_left": sorted(set(left) - set(right)),
+        "only_in_right": sorted(set(right) - set(left)),
+        "different": {},
+        "approximate": {},
+    }
+    for key in sorted(set(left) & set(right)):
+        left_value, right_value = left[key], right[key]
+        if values_match(left_value, right_value, rtol, atol):
+            continue
+        if (
+            isinstance(left_value, str)
+            and isinstance(right_value, str)
+            and set(left_value.lower().split()) == set(right_value.lower().split())
+        ):
+            result["approximate"][key] = [left_value, right_value]
+        else:
+            result["different"][key] = [left_value, right_value]
+
+    result["match"] = not (
+        result["only_in_left"] or result["only_in_right"] or result["different"]
+    )
+    return result
+
+
+def compare_tsv_files(left_path, right_path, rtol: float = 1e-6, atol: float = 0.0):
+    """
+    Compares two tsv files cell by cell, cells that can be read as numbers are compared with a tolerance.
+
+    :return: a dictionary recording differences in the header and the first differing cells
+    """
+    with open(left_path, newline="") as left_file, open(
+        right_path, newline=""
+    ) as right_file:
+        left = list(csv.reader(left_file, delimiter="\t"))
+        right = list(csv.reader(right_file, delimiter="\t"))
+
+    result = {"different": [], "rows": [len(left), len(right)]}
+    if not left or not right or left[0] != right[0] or len(left) != len(right):
+        result["header"] = [left[0] if left else [], right[0] if right else []]
+        result["match"] = False
+        return result
+
+    for row_index, (left_row, right_row) in enumerate(zip(left, right)):
+        for column, (left_cell, right_cell) in enumerate(zip(left_row, right_row)):
+            if left_cell == right_cell:
+                continue
+            try:
+                if math.isclose(
+                    float(left_cell), float(right_cell), rel_tol=rtol, abs_tol=atol
+                ):
+                    continue
+            except ValueError:
+                pass
+            result["different"].append(
+                {
+                    "row": row_index,
+                    "column": left[0][column] if column < len(left[0]) else column,
+                    "left": left_cell,
+                    "right": right_cell,
+                }
+            )
+        if len(left_row) != len(right_row):
+            result["different"].append(
+                {"row": row_index, "left": left_row, "right": right_row}
+            )
+
+    result["match"] = not result["different"]
+    # keep the report readable on very different files
+    result["different"] = result["different"][:100]
+    return result
+
+
+def file_checksum(path, block_size: int = 1 << 20) -> str:
+    """
+    sha256 of a file read in blocks
+    """
+    checksum = hashlib.sha256()
+    with open(path, "rb") as infile:
+        for block in iter(lambda: infile.read(block_size), b""):
+            checksum.update(block)
+    return checksum.hexdigest()
+
+
+def iter_nifti_chunks(nifti_file, chunk_voxels: int = NIFTI_CHUNK_VOXELS):
+    """
+    Streams the voxel data of a NIfTI in chunks of raw bytes, gzipped images are decompressed as they're read.
+
+    :return: the array proxy of the image (holding its dtype, shape, and scaling) and a generator of byte chunks
+    """
+    proxy = nibabel.load(nifti_file).dataobj
+    chunk_bytes = chunk_voxels * proxy.dtype.itemsize
+    total_bytes = int(numpy.prod(proxy.shape)) * proxy.dtype.itemsize
+
+    def chunks():
+        opener = gzip.open if str(nifti_file).endswith(".gz") else open
+        with opener(nifti_file, "rb") as infile:
+            infile.seek(int(proxy.offset))
+            remaining = total_bytes
+            while remaining > 0:
+                chunk = infile.read(min(chunk_bytes, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+    return proxy, chunks()
+
+
+def compare_nifti_files(
+    left_path,
+    right_path,
+    rtol: float = 1e-6,
+    atol: float = 0.0,
+    sample_stride: int = 1,
+    chunk_voxels: int = NIFTI_CHUNK_VOXELS,
+):
+    """
+    Compares the affines and voxel data of two NIfTI images, voxel data is compared in chunks. A checksum of each
+    image's voxel data is computed along the way, when both images store their data the same way (same dtype,
+    scl_slope, scl_inter, and offset) chunks with identical bytes aren't examined further, all other chunks are compared
+    numerically after applying scl_slope and scl_inter. Setting sample_stride above 1 only compares every nth voxel of
+    differing chunks.
+
+    :return: a dictionary holding whether the affine, qform, and sform match, the checksums, max absolute difference,
+        and number of voxels outside of tolerance
+    """
+    left_header = nibabel.load(left_path).header
+    right_header = nibabel.load(right_path).header
+    left_proxy, left_chunks = iter_nifti_chunks(left_path, chunk_voxels)
+    right_proxy, right_chunks = iter_nifti_chunks(right_path, chunk_voxels)
+
+    def same_transform(left_transform, right_transform):
+        return bool(
+            numpy.allclose(
+                left_transform, right_transform, rtol=rtol, atol=atol, equal_nan=True
+            )
+        )
+
+    left_qform, left_qform_code = left_header.get_qform(coded=True)
+    right_qform, right_qform_code = right_header.get_qform(coded=True)
+    left_sform, left_sform_code = left_header.get_sform(coded=True)
+    right_sform, right_sform_code = right_header.get_sform(coded=True)
+    result = {
+        "shape": [list(left_proxy.shape), list(right_proxy.shape)],
+        "dtype": [str(left_proxy.dtype), str(right_proxy.dtype)],
+        "affine_match": same_transform(
+            left_header.get_best_affine(), right_header.get_best_affine()
+        ),
+        "qform_match": int(left_qform_code) == int(right_qform_code)
+        and (left_qform is None or same_transform(left_qform, right_qform)),
+        "sform_match": int(left_sform_code) == int(right_sform_code)
+        and (left_sform is None or same_transform(left_sform, right_sform)),
+    }
+    if left_proxy.shape != right_proxy.shape:
+        result["match"] = False
+        return result
+
+    # identical bytes only mean identical values when both images scale and store them identically
+    same_storage = (
+        left_proxy.dtype == right_proxy.dtype
+        and float(left_proxy.slope) == float(right_proxy.slope)
+        and float(left_proxy.inter) == float(right_proxy.inter)
+        and int(left_proxy.offset) == int(right_proxy.offset)
+    )
+
+    left_checksum, right_checksum = hashlib.sha256(), hashlib.sha256()
+    max_difference, mismatched_voxels, differing_chunks = 0.0, 0, 0
+    for left_chunk, right_chunk in zip(left_chunks, right_chunks):
+        left_checksum.update(left_chunk)
+        right_checksum.update(right_chunk)
+        if same_storage and left_chunk == right_chunk:
+            continue
+        left_values = numpy.frombuffer(left_chunk, dtype=left_proxy.dtype)[
+            ::sample_stride
+        ] * float(left_proxy.slope) + float(left_proxy.inter)
+        right_values = numpy.frombuffer(right_chunk, dtype=right_proxy.dtype)[
+            ::sample_stride
+        ] * float(right_proxy.slope) + float(right_proxy.inter)
+        difference = numpy.abs(left_values - right_values)
+        outside_tolerance = difference > atol + rtol * numpy.abs(right_values)
+        # two nans are considered equal
+        outside_tolerance &= ~(numpy.isnan(left_values) & numpy.isnan(right_values))
+        if outside_tolerance.any():
+            differing_chunks += 1
+            mismatched_voxels += int(outside_tolerance.sum())
+            max_difference = max(max_difference, float(numpy.nanmax(difference)))
+
+    result.update(
+        {
+            "checksum": [left_checksum.hexdigest(), right_checksum.hexdigest()],
+            "max_absolute_difference": max_difference,
+            "mismatched_voxels": mismatched_voxels,
+            "differing_chunks": differing_chunks,
+            "sample_stride": sample_stride,
+        }
+    )
+    result["match"] = (
+        mismatched_voxels == 0
+        and result["affine_match"]
+        and result["qform_match"]
+        and result["sform_match"]
+    )
+    return result
+
+
+def compare_pair(pair: tuple) -> dict:
+    """
+    Compares a single pair of files, used as the unit of work for the process pool in compare_bids_trees.
+
+    :param pair: (key, left path, right path, options dictionary)
+    :return: a dictionary with the comparison result for the pair
+    """
+    key, left_path, right_path, options = pair
+    extension = split_bids_name(pathlib.Path(left_path).name)[2]
+    result = {"key": key, "left": str(left_path), "right": str(right_path)}
+    tolerance = {"rtol": options["rtol"], "atol": options["atol"]}
+    try:
+        if extension == ".json":
+            result.update(compare_json_files(left_path, right_path, **tolerance))
+        elif extension in (".nii", ".nii.gz"):
+            result.update(
+                compare_nifti_files(
+                    left_path,
+                    right_path,
+                    sample_stride=options["sample_stride"],
+                    **tolerance,
+                )
+            )
+        elif extension == ".tsv":
+            result.update(compare_tsv_files(left_path, right_path, **tolerance))
+        else:
+            checksums = [file_checksum(left_path), file_checksum(right_path)]
+            result.update(
+                {"checksum": checksums, "match": checksums[0] == checksums[1]}
+            )
+    except Exception as err:
+        result.update({"match": False, "error": f"{type(err).__name__}: {err}"})
+    return result
+
+
+def compare_bids_trees(
+    left_root,
+    right_root,
+    extensions: list = None,
+    rtol: float = 1e-6,
+    atol: float = 0.0,
+    sample_stride: int = 1,
+    n_jobs: int = None,
+) -> dict:
+    """
+    Pairs the files of two BIDS trees by their entities and compares every pair in a pool of processes.
+
+    :param left_root: root of the first BIDS tree
+    :param right_root: root of the second BIDS tree
+    :param extensions: only compare files with these extensions, compares all files if None
+    :param rtol: relative tolerance for numeric values in json, tsv, and nifti files
+    :param atol: absolute tolerance for numeric values in json, tsv, and nifti files
+    :param sample_stride: compare every nth voxel of nifti chunks that differ
+    :param n_jobs: number of processes to use, defaults to the number of cpus
+    :return: a report dictionary
+    """
+    left_files = collect_bids_files(left_root, extensions)
+    right_files = collect_bids_files(right_root, extensions)
+
+    options = {"rtol": rtol, "atol": atol, "sample_stride": sample_stride}
+    pairs = [
+        (key, str(left_files[key]), str(right_files[key]), options)
+        for key in sorted(left_files.keys() & right_files.keys())
+    ]
+
+    if n_jobs == 1:
+        results = [compare_pair(pair) for pair in pairs]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(
+                executor.map(compare_pair, pairs, chunksize=max(1, len(pairs) // 256))
+            )
+
+    differing = [result for result in results if not result["match"]]
+    return {
+        "left": str(left_root),
+        "right": str(right_root),
+        "options": options,
+        "summary": {
+            "compared": len(results),
+            "matching": len(results) - len(differing),
+            "differing": len(differing),
+            "only_in_left": len(left_files.keys() - right_files.keys()),
+            "only_in_right": len(right_files.keys() - left_files.keys()),
+        },
+        "only_in_left": sorted(
+            str(left_files[k]) for k in left_files.keys() - right_files.keys()
+        ),
+        "only_in_right": sorted(
+            str(right_files[k]) for k in right_files.keys() - left_files.keys()
+        ),
+        "differing": differing,
+        "matching": [result["key"] for result in results if result["match"]],
+    }
+
+
+def cli(args=None):
+    parser = argparse.ArgumentParser(
+        description="Compare two BIDS trees file by file, files are paired by their BIDS entities. Exits with a "
+        "non-zero status if any paired files differ or a file is only present in one tree."
+    )
+    parser.add_argument("left_path", type=pathlib.Path, help="the first BIDS tree")
+    parser.add_argument("right_path", type=pathlib.Path, help="the second BIDS tree")
+    parser.add_argument(
+        "--report",
+        type=str,
+        default=None,
+        help="path to write the json report to, the report is printed if not supplied",
+    )
+    parser.add_argument(
+        "--extensions",
+        nargs="*",
+        default=None,
+        help="only compare files with these extensions, e.g. --extensions .json .nii.gz",
+    )
+    parser.add_argument(
+        "--rtol",
+        type=float,
+        default=1e-6,
+        help="relative tolerance for numeric values, default is 1e-6",
+    )
+    parser.add_argument(
+        "--atol",
+        type=float,
+        default=0.0,
+        help="absolute tolerance for numeric values, default is 0",
+    )
+    parser.add_argument(
+        "--sample-stride",
+        type=int,
+        default=1,
+        help="compare every nth voxel of nifti chunks whose bytes differ, default is 1 (every voxel)",
+    )
+    parser.add_argument(
+        "--njobs",
+        "-j",
+        type=int,
+        default=None,
+        help="number of processes to use, defaults to the number of cpus",
+    )
+    args = parser.parse_args(args)
+
+    # the pypet2bids logger writes to stdout, keep stdout to the report alone so it can be piped
+    redirected = []
+    if not args.report:
+        redirected = [
+            handler
+            for handler in logger.handlers
+            if isinstance(handler, logging.StreamHandler)
+            and handler.stream is sys.stdout
+        ]
+    for handler in redirected:
+        handler.setStream(sys.stderr)
+    try:
+        report = compare_bids_trees(
+            args.left_path,
+            args.right_path,
+            extensions=args.extensions,
+            rtol=args.rtol,
+            atol=args.atol,
+            sample_stride=args.sample_stride,
+            n_jobs=args.njobs,
+        )
+
+        if args.report:
+            with open(args.report, "w") as outfile:
+                json.dump(report, outfile, indent=4)
+        else:
+            print(json.dumps(report, indent=4))
+
+        summary = report["summary"]
+        logger.info(
+            f"compared {summary['compared']} files: {summary['matching']} matching, {summary['differing']} "
+            f"differing, {summary['only_in_left']} only in {args.left_path}, {summary['only_in_right']} only in "
+            f"{args.right_path}"
+        )
+    finally:
+        for handler in redirected:
+            handler.setStream(sys.stdout)
+    if summary["differing"] or summary["only_in_left"] or summary["only_in_right"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    cli()
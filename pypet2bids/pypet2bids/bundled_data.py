@@ -0,0 +1,127 @@
+"""
+Lazily loaded read-only views of the json data bundled with pypet2bids (the BIDS schema, the PET metadata field lists,
+and the ECAT header maps). Nothing is read from disk until a value is first accessed and every file is read at most
+once per process, so importing a module that depends on this data costs next to nothing.
+
+A folder snapshot is a directory with a ``__keys__.json`` file listing its keys in order, each key is stored either as
+``<key>.json`` or as a nested folder snapshot of its own, that way large parts (e.g. schema["objects"]) are loaded
+without materializing their siblings. Snapshots are written by :func:`write_snapshot` (see scripts/schema_json_to_py).
+
+| *Authors: Anthony Galassi*
+| *Copyright OpenNeuroPET team*
+"""
+
+import json
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+
+keys_file = "__keys__.json"
+
+
+def load_json(path: Path):
+    with open(path, "r", encoding="utf-8") as infile:
+        return json.load(infile)
+
+
+class LazyJson(Mapping):
+    """
+    A read-only mapping of the contents of a json file, the file is read on first access.
+
+    :param path: path to a json file containing an object
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._data = None
+        self._lock = threading.Lock()
+
+    def _contents(self) -> dict:
+        if self._data is None:
+            with self._lock:
+                if self._data is None:
+                    self._data = load_json(self.path)
+        return self._data
+
+    def __getitem__(self, key):
+        return self._contents()[key]
+
+    def __iter__(self):
+        return iter(self._contents())
+
+    def __len__(self):
+        return len(self._contents())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({str(self.path)!r})"
+
+
+class LazyMapping(Mapping):
+    """
+    A read-only mapping of a folder snapshot (see the module documentation), each key is read on first access.
+
+    :param folder: path to a folder snapshot
+    """
+
+    def __init__(self, folder):
+        self.folder = Path(folder)
+        self._keys = load_json(self.folder / keys_file)
+        self._loaded = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        try:
+            return self._loaded[key]
+        except KeyError:
+            pass
+        if key not in self._keys:
+            raise KeyError(key)
+        with self._lock:
+            if key not in self._loaded:
+                if (self.folder / key).is_dir():
+                    self._loaded[key] = LazyMapping(self.folder / key)
+                else:
+                    self._loaded[key] = load_json(self.folder / f"{key}.json")
+        return self._loaded[key]
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({str(self.folder)!r})"
+
+
+def write_snapshot(values: dict, folder, split: dict = None):
+    """
+    Writes a dictionary out as a folder snapshot of compact json files.
+
+    :param values: the dictionary to write
+    :param folder: the folder to write the snapshot to, it's created if it doesn't exist
+    :param split: the keys that are written as nested folder snapshots rather than single files, a dictionary mapping
+        each key to the split of its own value, e.g. {"schema": {"objects": {}}} writes schema and schema["objects"]
+        as folders
+    """
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    split = split or {}
+    for key, value in values.items():
+        if (
+            "/" in key
+            or "\\" in key
+            or key.startswith(".")
+            or f"{key}.json" == keys_file
+        ):
+            raise ValueError(f"{key!r} can't be stored as a file name")
+        if key in split and isinstance(value, dict):
+            write_snapshot(value, folder / key, split[key])
+        else:
+            with open(folder / f"{key}.json", "w", encoding="utf-8") as outfile:
+                json.dump(value, outfile, separators=(",", ":"), ensure_ascii=False)
+    with open(folder / keys_file, "w", encoding="utf-8") as outfile:
+        json.dump(list(values), outfile)
@@ -0,0 +1,251 @@
+"""
+Keeps a record of the conversions run into a BIDS dataset so that re-running a conversion over unchanged inputs can be
+skipped. The manifest lives at the root of the output dataset as .pet2bids_manifest.json and holds an entry for every
+converted input with:
+
+- a fingerprint of the input: the size and modification time of every file and a hash of the first block of each
+  (where DICOM and ECAT headers are), so inputs are never read in full
+- a hash of the metadata spreadsheet and of the settings (kwargs and options) used for the conversion
+- the version of pypet2bids that converted it
+- the files the conversion created, which also gives the provenance of every output
+
+An input is up to date when all of these match and its outputs still exist. Entries are saved as soon as each
+conversion finishes so interrupted batches resume where they stopped.
+
+| *Authors: Anthony Galassi*
+| *Copyright OpenNeuroPET team*
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from os import walk
+from os.path import join
+from pathlib import Path
+
+try:
+    import helper_functions
+    from update_json_pet_file import write_sidecar
+except ModuleNotFoundError:
+    import pypet2bids.helper_functions as helper_functions
+    from pypet2bids.update_json_pet_file import write_sidecar
+
+logger = helper_functions.logger("pypet2bids")
+
+manifest_name = ".pet2bids_manifest.json"
+
+# number of bytes hashed from the start of every input file, enough to cover a dicom header or the main header and
+# first directory and subheader of an ECAT
+header_block_size = 16384
+
+
+def dataset_root(destination) -> Path:
+    """
+    Finds the root of the BIDS dataset a destination belongs to, that is the closest folder containing a
+    dataset_description.json, or failing that the folder above the first sub-<label> folder in the destination. If
+    neither exists the destination folder itself is used.
+
+    :param destination: an output folder or file path
+    :return: the folder the manifest is kept in
+    """
+    destination = Path(destination).absolute()
+    if destination.suffix:
+        destination = destination.parent
+    for folder in [destination, *destination.parents]:
+        if (folder / "dataset_description.json").is_file():
+            return folder
+    for folder in [destination, *destination.parents]:
+        if folder.name.startswith("sub-"):
+            return folder.parent
+    return destination
+
+
+def _file_fingerprint(path: Path) -> tuple:
+    stat = path.stat()
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as infile:
+        digest.update(infile.read(header_block_size))
+    return stat.st_size, stat.st_mtime_ns, digest.hexdigest()
+
+
+def fingerprint(input_path, n_jobs: int = None, exclude=()) -> dict:
+    """
+    Fingerprints an input file or folder from the size, modification time, and first block of each file in it.
+    Manifests and any excluded files are left out, outputs are written inside the input folder when no destination is
+    given and they mustn't change the fingerprint of the input they were converted from.
+
+    :param input_path: a file (e.g. an ECAT or archive) or a folder of dicoms
+    :param n_jobs: number of threads used to read files, defaults to the number of cpus + 4 up to 32
+    :param exclude: absolute paths of files to leave out, e.g. the outputs recorded in a manifest
+    :return: the number of files, their total size, the latest modification time, and a hash combining the name, size,
+        modification time, and header hash of every file
+    """
+    input_path = Path(input_path)
+    if input_path.is_file():
+        paths = [input_path]
+    else:
+        exclude = {str(path) for path in exclude}
+        paths = sorted(
+            Path(join(root, f))
+            for root, dirs, files in walk(input_path)
+            for f in files
+            if f != manifest_name and str(Path(join(root, f)).absolute()) not in exclude
+        )
+    n_jobs = n_jobs or min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        file_fingerprints = list(executor.map(_file_fingerprint, paths))
+
+    digest = hashlib.blake2b(digest_size=16)
+    for path, (size, mtime, header_hash) in zip(paths, file_fingerprints):
+        name = path.name if path == input_path else path.relative_to(input_path)
+        digest.update(f"{name}:{size}:{mtime}:{header_hash};".encode())
+    return {
+        "files": len(paths),
+        "size": sum(size for size, _, _ in file_fingerprints),
+        "mtime_ns": max((mtime for _, mtime, _ in file_fingerprints), default=0),
+        "hash": digest.hexdigest(),
+    }
+
+
+def hash_file(path) -> str:
+    """
+    Hashes the whole of a file, used for metadata spreadsheets which are small and may change anywhere.
+
+    :param path: path to a file
+    :return: the hash or None if there's no file at path
+    """
+    if not path or not Path(path).is_file():
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as infile:
+        for block in iter(lambda: infile.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def hash_values(values) -> str:
+    """
+    Hashes json serializable values (e.g. kwargs), the order of dictionary keys doesn't change the hash.
+
+    :param values: values to hash
+    :return: the hash
+    """
+    return hashlib.blake2b(
+        json.dumps(values, sort_keys=True, default=str).encode(), digest_size=16
+    ).hexdigest()
+
+
+class ConversionManifest:
+    """
+    The manifest of a single output dataset, see the module documentation.
+
+    :param path: path to the manifest json, it's created on the first save if it doesn't exist
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.entries = {}
+        if self.path.is_file():
+            try:
+                with open(self.path, "r") as infile:
+                    self.entries = json.load(infile).get("conversions", {})
+            except json.decoder.JSONDecodeError:
+                logger.warning(f"Unable to read {self.path}, starting a new manifest")
+
+    @classmethod
+    def for_destination(cls, destination):
+        """
+        Opens the manifest of the dataset that destination belongs to, see dataset_root.
+
+        :param destination: an output folder or file path
+        :return: a ConversionManifest
+        """
+        return cls(dataset_root(destination) / manifest_name)
+
+    def outputs(self) -> set:
+        """
+        :return: the absolute paths of every output recorded in the manifest
+        """
+        return {
+            str((self.path.parent / output).absolute())
+            for entry in self.entries.values()
+            for output in entry.get("outputs", [])
+        }
+
+    def describe(self, input_path, metadata_path=None, settings=None) -> dict:
+        """
+        Collects everything that determines the output of a conversion, this is compared against the manifest before
+        converting and recorded in it after. Outputs recorded in the manifest aren't part of the input's fingerprint.
+
+        :param input_path: the file or folder being converted
+        :param metadata_path: the metadata spreadsheet used for the conversion, if any
+        :param settings: any other values the output depends on, e.g. kwargs and conversion options
+        :return: a manifest entry without outputs
+        """
+        return {
+            "input": str(Path(input_path).absolute()),
+            "fingerprint": fingerprint(input_path, exclude=self.outputs()),
+            "metadata_hash": hash_file(metadata_path),
+            "settings_hash": hash_values(settings or {}),
+            "version": helper_functions.get_version(),
+        }
+
+    def is_up_to_date(self, entry: dict) -> bool:
+        """
+        Checks whether an input has already been converted with the same inputs, metadata, settings, and version and
+        its outputs are all still present.
+
+        :param entry: an entry as returned by describe
+        :return: True if the conversion can be skipped
+        """
+        recorded = self.entries.get(entry["input"])
+        if not recorded or not recorded.get("outputs"):
+            return False
+        if any(recorded.get(key) != value for key, value in entry.items()):
+            return False
+        return all(
+            (self.path.parent / output).exists() for output in recorded["outputs"]
+        )
+
+    def record(self, entry: dict, outputs: list):
+        """
+        Records a finished conversion and saves the manifest.
+
+        :param entry: an entry as returned by describe before the conversion started
+        :param outputs: the files created by the conversion
+        """
+        root = self.path.parent.absolute()
+        relative_outputs = []
+        for output in outputs:
+            output = Path(output).absolute()
+            try:
+                relative_outputs.append(str(output.relative_to(root)))
+            except ValueError:
+                # outputs outside of the dataset are recorded by their full path
+                relative_outputs.append(str(output))
+        self.entries[entry["input"]] = {
+            **entry,
+            "outputs": sorted(relative_outputs),
+            "converted": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        self.save()
+
+    def provenance(self, output_path) -> dict:
+        """
+        Looks up which conversion created an output file.
+
+        :param output_path: path to an output file
+        :return: the manifest entry of the conversion or None
+        """
+        output_path = Path(output_path).absolute()
+        for entry in self.entries.values():
+            for output in entry.get("outputs", []):
+                if (self.path.parent / output).absolute() == output_path:
+                    return entry
+        return None
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_sidecar(self.path, {"conversions": self.entries})
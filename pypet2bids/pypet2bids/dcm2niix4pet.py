@@ -15,7 +15,6 @@ For more details see the CLI portion of this module or the documentation for the
 import pathlib
 import sys
 import textwrap
-from json_maj.main import JsonMAJ
 from platform import system
 import subprocess
 import pandas as pd
@@ -25,6 +24,7 @@ from os import listdir, walk, environ
 from pathlib import Path
 import json
 import pydicom
+from pydicom.datadict import tag_for_keyword
 import re
 from tempfile import TemporaryDirectory
 import shutil
@@ -32,12 +32,30 @@ import argparse
 import importlib
 import zipfile
 import stat
+import shlex
+import time
+import asyncio
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+
+try:
+    import resource
+except ImportError:
+    # resource is unavailable on windows
+    resource = None
 
 try:
     import helper_functions
     import is_pet
+    from archives import is_archive, extract_pet_dicoms
+    from conversion_manifest import ConversionManifest, hash_file
+    from dicom2nii import dicom2nii
     from update_json_pet_file import (
         check_json,
+        add_dicom_values,
+        SidecarBuilder,
         update_json_with_dicom_value,
         update_json_with_dicom_value_cli,
         get_radionuclide,
@@ -54,8 +72,13 @@ try:
 except ModuleNotFoundError:
     import pypet2bids.helper_functions as helper_functions
     import pypet2bids.is_pet as is_pet
+    from pypet2bids.archives import is_archive, extract_pet_dicoms
+    from pypet2bids.conversion_manifest import ConversionManifest, hash_file
+    from pypet2bids.dicom2nii import dicom2nii
     from pypet2bids.update_json_pet_file import (
         check_json,
+        add_dicom_values,
+        SidecarBuilder,
         update_json_with_dicom_value,
         update_json_with_dicom_value_cli,
         get_radionuclide,
@@ -219,6 +242,425 @@ def use_included_binary():
         return None
 
 
+# messages dcm2niix prints for series it can't convert correctly, lower case
+dcm2niix_fatal_messages = ["missing images", "check sorted order"]
+
+
+def _child_cpu_time():
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _peak_rss(pid: int):
+    # VmHWM is the high water mark of the resident set size in kB, only available on linux
+    try:
+        with open(f"/proc/{pid}/status", "r") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _kill_process_group(process):
+    try:
+        if system() == "Windows":
+            process.kill()
+        else:
+            os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+async def _stream_dcm2niix(
+    command: list, timeout=None, stop_on_fatal: bool = True, poll_interval=0.1
+) -> dict:
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        # dcm2niix may hand off compression to pigz, a session lets us kill both
+        start_new_session=system() != "Windows",
+    )
+    result = {
+        "stdout": "",
+        "stderr": "",
+        "fatal_message": None,
+        "timed_out": False,
+        "peak_rss": None,
+    }
+    fatal = asyncio.Event()
+
+    async def read_stream(stream, name):
+        lines = []
+        async for raw_line in stream:
+            line = raw_line.decode("utf-8", errors="replace")
+            lines.append(line)
+            logger.debug(f"dcm2niix {name}: {line.rstrip()}")
+            if result["fatal_message"] is None and any(
+                message in line.lower() for message in dcm2niix_fatal_messages
+            ):
+                result["fatal_message"] = line.strip()
+                fatal.set()
+        result[name] = "".join(lines)
+
+    async def watch_memory():
+        while process.returncode is None:
+            rss = _peak_rss(process.pid)
+            if rss is not None:
+                result["peak_rss"] = max(result["peak_rss"] or 0, rss)
+            await asyncio.sleep(poll_interval)
+
+    readers = asyncio.gather(
+        read_stream(process.stdout, "stdout"), read_stream(process.stderr, "stderr")
+    )
+    memory_watcher = asyncio.ensure_future(watch_memory())
+    exited = asyncio.ensure_future(process.wait())
+    waiting_on = {exited}
+    if stop_on_fatal:
+        fatal_waiter = asyncio.ensure_future(fatal.wait())
+        waiting_on.add(fatal_waiter)
+
+    done, _ = await asyncio.wait(
+        waiting_on, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+    )
+    if not done:
+        result["timed_out"] = True
+    if exited not in done:
+        _kill_process_group(process)
+    await exited
+    # whatever is left in the pipes once the process is gone is read all the same
+    await readers
+    if stop_on_fatal:
+        fatal_waiter.cancel()
+    memory_watcher.cancel()
+    result["returncode"] = process.returncode
+    return result
+
+
+def run_dcm2niix_process(
+    command: list, timeout=None, stop_on_fatal: bool = True
+) -> dict:
+    """
+    Runs dcm2niix without blocking on its output. stdout and stderr are read line by line as they're written, if a
+    line contains one of dcm2niix_fatal_messages the process is stopped right away rather than left to finish
+    converting a broken series. Likewise, the process is killed once timeout is exceeded.
+
+    :param command: the dcm2niix command as a list of arguments
+    :param timeout: number of seconds to wait before killing dcm2niix, defaults to no limit
+    :param stop_on_fatal: kill dcm2niix on the first fatal message, defaults to True
+    :return: a dictionary of the returncode, stdout, stderr, the fatal message if any, whether the process timed out,
+        and the wall time, cpu time (seconds) and peak resident memory (bytes, only measured on linux otherwise None)
+        of the process
+    """
+    command = [str(argument) for argument in command]
+    cpu_time_before = _child_cpu_time()
+    start = time.perf_counter()
+    try:
+        asyncio.get_running_loop()
+        inside_event_loop = True
+    except RuntimeError:
+        inside_event_loop = False
+    if inside_event_loop:
+        # we're inside someone else's event loop (e.g. jupyter), run ours in a thread instead
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            result = executor.submit(
+                asyncio.run, _stream_dcm2niix(command, timeout, stop_on_fatal)
+            ).result()
+    else:
+        result = asyncio.run(_stream_dcm2niix(command, timeout, stop_on_fatal))
+    result["wall_time"] = time.perf_counter() - start
+
+    cpu_time_after = _child_cpu_time()
+    if cpu_time_before is not None and cpu_time_after is not None:
+        result["cpu_time"] = cpu_time_after - cpu_time_before
+    else:
+        result["cpu_time"] = None
+    # peak_rss stays None when the process' memory couldn't be sampled, RUSAGE_CHILDREN only gives the largest child
+    # this process has ever waited on rather than this dcm2niix
+    return result
+
+
+# header elements used by this module and update_json_pet_file, the dicom to BIDS mapping in dicom2bids supplies most
+# of them; the rest are used to name, group, and time the output
+dicom_header_tags = sorted(
+    {
+        re.sub("[^0-9a-zA-Z]+", "", field)
+        for field in metadata_dictionaries["dicom2bids"]["dcmfields"]
+        + metadata_dictionaries["dicom2bids"]["jsonfields"]
+        + [
+            "SOPClassUID",
+            "Modality",
+            "PatientID",
+            "StudyInstanceUID",
+            "SeriesInstanceUID",
+            "SeriesNumber",
+            "SeriesDescription",
+            "ProtocolName",
+            "ImageType",
+            "StudyDate",
+            "StudyTime",
+            "SeriesDate",
+            "SeriesTime",
+            "AcquisitionDate",
+            "AcquisitionTime",
+            "Units",
+            "RadiopharmaceuticalInformationSequence",
+        ]
+        # only keep valid dicom keywords, some BIDS fields share names with them
+        if tag_for_keyword(re.sub("[^0-9a-zA-Z]+", "", field)) is not None
+    }
+)
+
+
+def read_dicom_header(dicom_path, specific_tags: list = dicom_header_tags):
+    """
+    Reads only the header elements listed in specific_tags from a dicom, any other element (e.g. large private
+    sequences) is skipped over rather than parsed and values larger than 1 KB are only read if they're accessed.
+
+    :param dicom_path: path to a dicom file
+    :param specific_tags: the keywords of the elements to read, defaults to dicom_header_tags
+    :return: the header as a pydicom.dataset.FileDataset or None if the file isn't a dicom
+    """
+    try:
+        return pydicom.dcmread(
+            dicom_path,
+            stop_before_pixels=True,
+            specific_tags=specific_tags,
+            defer_size="1 KB",
+        )
+    except pydicom.errors.InvalidDicomError:
+        return None
+
+
+def group_dicoms_by_series(image_folder, n_jobs: int = None) -> dict:
+    """
+    Reads the header of every file in a folder in parallel and groups the dicoms by SeriesInstanceUID.
+
+    :param image_folder: folder containing dicoms, searched recursively
+    :param n_jobs: number of threads used to read headers, defaults to the number of cpus + 4 up to 32
+    :return: a dictionary keyed by SeriesInstanceUID of dictionaries with the modality, the header of the first dicom,
+        and the paths of all dicoms in that series
+    """
+    dicom_paths = [
+        Path(join(root, f)) for root, dirs, files in walk(image_folder) for f in files
+    ]
+    n_jobs = n_jobs or min(32, (os.cpu_count() or 1) + 4)
+    series = {}
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        for dicom_path, dicom_header in zip(
+            dicom_paths, executor.map(read_dicom_header, dicom_paths)
+        ):
+            if dicom_header is None:
+                continue
+            series_uid = str(dicom_header.get("SeriesInstanceUID", ""))
+            if series_uid not in series:
+                series[series_uid] = {
+                    "modality": dicom_header.get("Modality", None),
+                    "header": dicom_header,
+                    "files": [],
+                }
+            series[series_uid]["files"].append(dicom_path)
+    return series
+
+
+completeness_tags = [
+    "Modality",
+    "SeriesInstanceUID",
+    "SeriesNumber",
+    "NumberOfSlices",
+    "NumberOfTimeSlices",
+    "ImageIndex",
+]
+
+
+def check_series_completeness(image_folder, n_jobs: int = None) -> dict:
+    """
+    Checks that every PET series in a folder has all of its images before it's converted, using only the
+    NumberOfSlices, NumberOfTimeSlices, and ImageIndex of each dicom. Headers are read in parallel. Each image's
+    ImageIndex gives its place in the grid of slices and frames, a series is complete when every place in the grid is
+    filled exactly once. Series missing any of these values can't be checked, they're reported with a complete entry
+    of None and left to dcm2niix.
+
+    :param image_folder: folder containing dicoms, searched recursively
+    :param n_jobs: number of threads used to read headers, defaults to the number of cpus + 4 up to 32
+    :return: a report with an overall 'complete' entry and an entry for each PET series keyed by SeriesInstanceUID
+        listing the expected and found number of images and the missing, duplicated, and unexpected images, slices and
+        frames are numbered from 1
+    """
+    dicom_paths = [
+        Path(join(root, f)) for root, dirs, files in walk(image_folder) for f in files
+    ]
+    n_jobs = n_jobs or min(32, (os.cpu_count() or 1) + 4)
+    series = {}
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        for dicom_path, dicom_header in zip(
+            dicom_paths,
+            executor.map(
+                lambda path: read_dicom_header(path, completeness_tags), dicom_paths
+            ),
+        ):
+            if dicom_header is None or dicom_header.get("Modality", None) != "PT":
+                continue
+            series.setdefault(
+                str(dicom_header.get("SeriesInstanceUID", "")), []
+            ).append((dicom_path, dicom_header))
+
+    report = {"folder": str(image_folder), "complete": True, "series": {}}
+    for series_uid, dicoms in series.items():
+        first = dicoms[0][1]
+        number_of_slices = int(first.get("NumberOfSlices", 0) or 0)
+        number_of_frames = int(first.get("NumberOfTimeSlices", 0) or 0)
+        series_report = {
+            "series_number": first.get("SeriesNumber", None),
+            "expected_images": number_of_slices * number_of_frames or None,
+            "found_images": len(dicoms),
+            "missing": [],
+            "duplicates": [],
+            "unexpected": [],
+            "complete": True,
+        }
+        # without the size of the grid or the place of each image in it the series can't be checked, leave it to
+        # dcm2niix
+        indexed = all(
+            dicom_header.get("ImageIndex", None) for _, dicom_header in dicoms
+        )
+        missing_tags = [
+            tag
+            for tag, present in [
+                ("NumberOfSlices", number_of_slices),
+                ("NumberOfTimeSlices", number_of_frames),
+                ("ImageIndex", indexed),
+            ]
+            if not present
+        ]
+        if missing_tags:
+            series_report["complete"] = None
+            series_report["error"] = (
+                f"{', '.join(missing_tags)} missing from the header"
+            )
+            report["series"][series_uid] = series_report
+            continue
+
+        positions = {}
+        for dicom_path, dicom_header in dicoms:
+            image_index = int(dicom_header.get("ImageIndex"))
+            if not 1 <= image_index <= number_of_slices * number_of_frames:
+                series_report["unexpected"].append(
+                    {"image_index": image_index, "file": str(dicom_path)}
+                )
+                continue
+            positions.setdefault(image_index, []).append(str(dicom_path))
+
+        for image_index in range(1, number_of_slices * number_of_frames + 1):
+            place = {
+                "slice": (image_index - 1) % number_of_slices + 1,
+                "frame": (image_index - 1) // number_of_slices + 1,
+            }
+            if image_index not in positions:
+                series_report["missing"].append(place)
+            elif len(positions[image_index]) > 1:
+                series_report["duplicates"].append(
+                    {**place, "files": sorted(positions[image_index])}
+                )
+
+        series_report["complete"] = not (
+            series_report["missing"]
+            or series_report["duplicates"]
+            or series_report["unexpected"]
+        )
+        report["series"][series_uid] = series_report
+        report["complete"] = report["complete"] and series_report["complete"]
+
+    return report
+
+
+def describe_completeness_gaps(report: dict) -> str:
+    """
+    Summarizes the incomplete series of a report from check_series_completeness in a single line.
+
+    :param report: a report from check_series_completeness
+    :return: a description of the gaps in each incomplete series
+    """
+    descriptions = []
+    for series_report in report["series"].values():
+        if series_report["complete"] is not False:
+            continue
+        description = (
+            f"series {series_report['series_number']} has {series_report['found_images']} of "
+            f"{series_report['expected_images']} images"
+        )
+        missing_frames = sorted({place["frame"] for place in series_report["missing"]})
+        if missing_frames:
+            description += f", {len(series_report['missing'])} missing from frames {missing_frames}"
+        if series_report["duplicates"]:
+            description += f", {len(series_report['duplicates'])} duplicated"
+        if series_report["unexpected"]:
+            description += (
+                f", {len(series_report['unexpected'])} outside the expected range"
+            )
+        descriptions.append(description)
+    return f"Incomplete series in {report['folder']}: " + "; ".join(descriptions)
+
+
+def stage_series(dicom_paths: list, staging_folder) -> Path:
+    """
+    Creates a folder of symbolic links to a set of dicoms so dcm2niix can be run on just those dicoms, files are copied
+    instead where symbolic links can't be created (e.g. windows without developer mode).
+
+    :param dicom_paths: paths to the dicoms to stage
+    :param staging_folder: folder to create the links in
+    :return: the staging folder
+    """
+    staging_folder = Path(staging_folder)
+    staging_folder.mkdir(parents=True, exist_ok=True)
+    for index, dicom_path in enumerate(dicom_paths):
+        # dicoms from different sub folders can share a name
+        link = staging_folder / f"{index:06d}_{Path(dicom_path).name}"
+        try:
+            link.symlink_to(Path(dicom_path).resolve())
+        except OSError:
+            shutil.copy(dicom_path, link)
+    return staging_folder
+
+
+def merge_dcm2niix_results(results: list, cpu_time: float = None) -> dict:
+    """
+    Combines the results of several runs of run_dcm2niix_process that ran side by side into one. The cpu time of each
+    run is measured across every child of this process so the cpu times of runs that overlapped also include each
+    other, cpu time is instead measured once around all of the runs by the caller.
+
+    :param results: list of dictionaries returned by run_dcm2niix_process
+    :param cpu_time: cpu time (seconds) used by all of the runs together
+    :return: a single result, returncode is the first non-zero returncode, output is concatenated, cpu time is the
+        cpu_time given, and wall time and peak rss are the maximum of the runs
+    """
+    return {
+        "returncode": next(
+            (result["returncode"] for result in results if result["returncode"]), 0
+        ),
+        "stdout": "".join(result["stdout"] for result in results),
+        "stderr": "".join(result["stderr"] for result in results),
+        "fatal_message": next(
+            (result["fatal_message"] for result in results if result["fatal_message"]),
+            None,
+        ),
+        "timed_out": any(result["timed_out"] for result in results),
+        "wall_time": max(result["wall_time"] for result in results),
+        "cpu_time": cpu_time,
+        "peak_rss": max(
+            (result["peak_rss"] for result in results if result["peak_rss"]),
+            default=None,
+        ),
+    }
+
+
+conversion_engines = ["dcm2niix", "native"]
+
+
 class Dcm2niix4PET:
     def __init__(
         self,
@@ -233,6 +675,12 @@ class Dcm2niix4PET:
         tempdir_location=None,
         ezbids=False,
         ignore_dcm2niix_errors=False,
+        dcm2niix_timeout=None,
+        headers_per_series=None,
+        split_series=False,
+        n_jobs=None,
+        engine="dcm2niix",
+        check_completeness=False,
     ):
         """
         This class is a simple wrapper for dcm2niix and contains methods to do the following in order:
@@ -251,7 +699,8 @@ class Dcm2niix4PET:
         (and to avoid leaving intermediary files persisting on disc). After which, these files are then moved the
         destination directory.
 
-        :param image_folder: folder containing a single series/session of dicoms
+        :param image_folder: folder containing a single series/session of dicoms, or a zip or tar archive of them in
+        which case only the PET dicoms in the archive are extracted
         :param destination_path: destination path for dcm2niix output nii and json files
         :param metadata_path: path to excel, csv, or text file with PET metadata (radioligand, blood, etc etc)
         :param metadata_translation_script: python file to extract and transform data contained in the metadata_path
@@ -267,37 +716,75 @@ class Dcm2niix4PET:
         :param tempdir_location: user supplied base location for temporary directory (override system default)
         :param silent: silence missing sidecar metadata messages, default is False and very verbose
         :param tempdir_location: location to create the temporary directory, for use on constrained systems
+        :param ignore_dcm2niix_errors: carry on with the conversion if dcm2niix reports errors
+        :param dcm2niix_timeout: seconds to wait for dcm2niix before stopping it, defaults to no limit
+        :param headers_per_series: collect this many dicom headers from every series in image_folder, by default a
+        single header is collected from the first dicom found
+        :param split_series: group the dicoms in image_folder by series before conversion, non PET series are skipped
+        and dcm2niix is run on each PET series separately
+        :param n_jobs: the number of series to convert at once when split_series is True, defaults to all of them
+        :param engine: the converter to use, either dcm2niix or native, the native engine converts PET dicoms in
+        process with pydicom (see dicom2nii) and doesn't need dcm2niix to be installed
+        :param check_completeness: check that every PET series in image_folder has all of its images before converting
+        it with check_series_completeness, a FileNotFoundError describing the gaps is raised if not
         """
 
-        # check to see if dcm2niix is installed
         self.blood_json = None
         self.blood_tsv = None
         self.telemetry_data = {}
         self.ezbids = ezbids
-        self.dcm2niix_path = self.check_for_dcm2niix()
-        if not self.dcm2niix_path:
-            logger.error(
-                "dcm2niix not found, this module depends on it for conversions, exiting."
+        if engine not in conversion_engines:
+            raise ValueError(
+                f"Unknown engine {engine}, must be one of {', '.join(conversion_engines)}"
             )
-            sys.exit(1)
+        self.engine = engine
+        self.check_completeness = check_completeness
+        self.completeness_report = None
+        # check to see if dcm2niix is installed
+        self.dcm2niix_path = None
+        if self.engine == "dcm2niix":
+            self.dcm2niix_path = self.check_for_dcm2niix()
+            if not self.dcm2niix_path:
+                logger.error(
+                    "dcm2niix not found, this module depends on it for conversions, exiting."
+                )
+                sys.exit(1)
         self.ignore_dcm2niix_errors = ignore_dcm2niix_errors
+        self.dcm2niix_timeout = dcm2niix_timeout
+        self.headers_per_series = headers_per_series
+        self.split_series = split_series
+        self.n_jobs = n_jobs
         # check for the version of dcm2niix
         minimum_version = "v1.0.20220720"
-        version_string = subprocess.run([self.dcm2niix_path, "-v"], capture_output=True)
-        version = re.search(r"v[0-9].[0-9].{8}[0-9]", str(version_string.stdout))
+        if self.dcm2niix_path:
+            version_string = subprocess.run(
+                [self.dcm2niix_path, "-v"], capture_output=True
+            )
+            version = re.search(r"v[0-9].[0-9].{8}[0-9]", str(version_string.stdout))
 
-        if version:
-            # compare with minimum version
-            if version[0] < minimum_version:
-                logger.warning(
-                    f"Minimum version {minimum_version} of dcm2niix is recommended, found "
-                    f"installed version {version[0]} at {self.dcm2niix_path}."
-                )
+            if version:
+                # compare with minimum version
+                if version[0] < minimum_version:
+                    logger.warning(
+                        f"Minimum version {minimum_version} of dcm2niix is recommended, found "
+                        f"installed version {version[0]} at {self.dcm2niix_path}."
+                    )
 
         # check if user provided a custom tempdir location
         self.tempdir_location = tempdir_location
         self.image_folder = Path(image_folder)
         self.destination_folder = None
+        # paths of the files the last conversion moved or wrote into the destination
+        self.created_files = []
+
+        # only the PET dicoms of an archive are extracted, into a temporary directory that lives as long as this object
+        self.archive_path = None
+        self.archive_tempdir = None
+        if is_archive(self.image_folder):
+            self.archive_path = self.image_folder
+            self.archive_tempdir = TemporaryDirectory(dir=tempdir_location)
+            self.image_folder = Path(self.archive_tempdir.name)
+            extract_pet_dicoms(self.archive_path, self.image_folder, n_jobs=n_jobs)
 
         # if we're provided an entire file path just us that no matter what, we're assuming the user knows what they
         # are doing in that case
@@ -321,8 +808,10 @@ class Dcm2niix4PET:
 
         if not self.full_file_path_given:
             if not destination_path:
-                self.destination_path = self.image_folder
-                self.destination_folder = self.image_folder
+                self.destination_path = (
+                    self.archive_path.parent if self.archive_path else self.image_folder
+                )
+                self.destination_folder = self.destination_path
             else:
                 self.destination_folder = Path(destination_path)
                 self.destination_path = self.destination_folder
@@ -356,7 +845,12 @@ class Dcm2niix4PET:
             "blood_json": {},
             "blood_tsv": {},
         }
-        self.dicom_headers = self.extract_dicom_headers()
+        if self.headers_per_series:
+            self.dicom_headers = self.extract_dicom_headers(
+                depth=self.headers_per_series, per_series=True
+            )
+        else:
+            self.dicom_headers = self.extract_dicom_headers()
         # we consider values stored in a default JSON file to be additional arguments, we load those
         # values first and then overwrite them with any user supplied values
 
@@ -383,6 +877,7 @@ class Dcm2niix4PET:
                     )
 
         self.additional_arguments = additional_arguments
+        self.metadata_path = None
 
         # if there's a spreadsheet and if there's a provided python script use it to manipulate the data in the
         # spreadsheet
@@ -529,87 +1024,277 @@ class Dcm2niix4PET:
 
         return dcm2niix_path
 
-    def extract_dicom_headers(self, depth=1):
+    def extract_dicom_headers(self, depth=1, per_series=False):
         """
         Opening up files till a dicom is located, then extracting any header information
         to be used during and after the conversion process. This includes patient/subject id,
         as well any additional frame or metadata that's required for conversion.
 
-        :param depth: the number of dicoms to collect per folder, defaults to 1 as it assumes a single sessions worth of
-                     dicoms is included per folder.
+        Only the elements in dicom_header_tags are read from each header and files are read several at a time from a
+        pool of threads.
+
+        :param depth: the number of dicoms to collect, defaults to 1 as it assumes a single sessions worth of dicoms is
+                     included per folder. When per_series is True this is the number of dicoms collected per series.
+        :param per_series: collect depth dicoms from every series (SeriesInstanceUID) in the folder, this reads the
+                     header of every file in the folder.
         :return: dicom header information to self.subject_id and/or self.dicom_header_data
         """
-        n = 0
+        dicom_paths = (
+            Path(join(root, f))
+            for root, dirs, files in walk(self.image_folder)
+            for f in files
+        )
         dicom_headers = {}
-        for root, dirs, files in walk(self.image_folder):
-            for f in files:
-                if n >= depth:
+        collected_per_series = {}
+        # reading headers is mostly waiting on disk, so threads are enough to read several at once
+        workers = min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # files are read in batches so we can stop once enough headers are collected, when only a few headers are
+            # wanted only as many files as are still needed are read, doubling each time a batch comes up short of
+            # dicoms (e.g. in folders holding other files)
+            max_batch_size = 4 * workers
+            short_batches = 0
+            while True:
+                if per_series:
+                    batch_size = max_batch_size
+                else:
+                    batch_size = min(
+                        max_batch_size,
+                        (depth - len(dicom_headers)) * 2**short_batches,
+                    )
+                    short_batches += 1
+                batch = list(islice(dicom_paths, batch_size))
+                if not batch:
                     break
-                try:
-                    dicom_path = Path(join(root, f))
-                    dicom_header = pydicom.dcmread(dicom_path, stop_before_pixels=True)
+                for dicom_path, dicom_header in zip(
+                    batch, executor.map(read_dicom_header, batch)
+                ):
+                    if dicom_header is None:
+                        continue
+                    series = (
+                        dicom_header.get("SeriesInstanceUID", None)
+                        if per_series
+                        else None
+                    )
+                    if collected_per_series.get(series, 0) >= depth:
+                        continue
+                    collected_per_series[series] = (
+                        collected_per_series.get(series, 0) + 1
+                    )
                     # collect subject/patient id if none is supplied
                     if self.subject_id is None:
                         self.subject_id = dicom_header.PatientID
 
                     dicom_headers[dicom_path.name] = dicom_header
-                    n += 1
 
-                except pydicom.errors.InvalidDicomError:
-                    pass
+                if not per_series and len(dicom_headers) >= depth:
+                    break
 
         return dicom_headers
 
-    def run_dcm2niix(self):
+    def run_native_on_folder(self, image_folder, output_folder) -> dict:
         """
-        This runs dcm2niix and uses the other methods within this class to supplement the sidecar json's produced as
-        dcm2niix output.
+        Converts a single folder with dicom2nii instead of dcm2niix. Only the file format and compression (-z n) of the
+        dcm2niix options apply. Errors are returned in the same form as they would be by dcm2niix.
 
-        :return: the path to the output of dcm2niix and the modified sidecar jsons
+        :param image_folder: folder of dicoms to convert
+        :param output_folder: folder to write the niftis and sidecars to
+        :return: a dictionary with the same keys as the result of run_dcm2niix_process
         """
+        options = shlex.split(self.dcm2niix_options)
+        compress = not any(
+            option == "-z" and value == "n"
+            for option, value in zip(options, options[1:])
+        )
+        result = {
+            "returncode": 0,
+            "stdout": "",
+            "stderr": "",
+            "fatal_message": None,
+            "timed_out": False,
+        }
+        start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            created = dicom2nii(
+                image_folder,
+                output_folder,
+                file_format=self.file_format or "%p_%i_%t_%s",
+                compress=compress,
+            )
+            result["stdout"] = "\n".join(f"Convert {path}" for path in created)
+        except ValueError as err:
+            result["returncode"] = 1
+            result["stderr"] = f"Error: {err} "
+            if "missing images" in str(err).lower():
+                result["fatal_message"] = str(err)
+        result["wall_time"] = time.perf_counter() - start
+        result["cpu_time"] = time.process_time() - cpu_start
+        result["peak_rss"] = _peak_rss(os.getpid())
+        return result
+
+    def run_dcm2niix_on_folder(self, image_folder, output_folder) -> dict:
+        """
+        Runs dcm2niix with the options given to this class on a single folder, or dicom2nii if the native engine was
+        selected.
+
+        :param image_folder: folder of dicoms to convert
+        :param output_folder: folder dcm2niix writes to
+        :return: the result of run_dcm2niix_process
+        """
+        if self.engine == "native":
+            return self.run_native_on_folder(image_folder, output_folder)
         if self.file_format:
             file_format_args = f"-f {self.file_format}"
         else:
             file_format_args = ""
+        # arguments are passed straight to dcm2niix without a shell so paths with spaces need no quoting
+        cmd = [
+            self.dcm2niix_path,
+            *shlex.split(self.dcm2niix_options),
+            *shlex.split(file_format_args),
+            "-o",
+            output_folder,
+            image_folder,
+        ]
+        return run_dcm2niix_process(
+            cmd,
+            timeout=self.dcm2niix_timeout,
+            stop_on_fatal=not self.ignore_dcm2niix_errors,
+        )
+
+    def run_dcm2niix_per_series(self, output_folder) -> dict:
+        """
+        Groups the dicoms in the image folder by series, skips any series that isn't PET, and runs dcm2niix on each PET
+        series at the same time. Each series is staged as a folder of links to its dicoms and converted into its own
+        folder, after which the output is moved into output_folder.
+
+        The header of the first dicom of each series is added to self.dicom_headers so that every series' sidecar can
+        be supplemented from its own header.
+
+        :param output_folder: folder to place the output of dcm2niix in
+        :return: the results of each run of dcm2niix merged with merge_dcm2niix_results
+        """
+        output_folder = Path(output_folder)
+        series = group_dicoms_by_series(self.image_folder)
+        pet_series = {
+            uid: group for uid, group in series.items() if group["modality"] == "PT"
+        }
+        skipped = [
+            group["modality"] for group in series.values() if group["modality"] != "PT"
+        ]
+        if skipped:
+            logger.info(
+                f"Skipping {len(skipped)} non PET series ({', '.join(map(str, skipped))}) in {self.image_folder}"
+            )
+        if not pet_series:
+            raise FileNotFoundError(f"No PET dicoms found in {self.image_folder}")
+
+        staging = output_folder / ".series"
+        jobs = []
+        for index, group in enumerate(pet_series.values()):
+            self.dicom_headers[group["files"][0].name] = group["header"]
+            jobs.append(
+                (
+                    stage_series(group["files"], staging / f"{index}" / "dicoms"),
+                    staging / f"{index}" / "output",
+                )
+            )
+            jobs[-1][1].mkdir()
+
+        cpu_time_before = _child_cpu_time()
+        # dcm2niix is cpu bound, by default run no more instances of it than there are cpus
+        n_jobs = self.n_jobs or min(len(jobs), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(
+                executor.map(lambda job: self.run_dcm2niix_on_folder(*job), jobs)
+            )
+        cpu_time_after = _child_cpu_time()
+
+        for index, (_, series_output) in enumerate(jobs):
+            for created in sorted(series_output.iterdir()):
+                destination = output_folder / created.name
+                if destination.exists():
+                    # custom file formats don't always include the series number
+                    destination = output_folder / f"series{index}_{created.name}"
+                shutil.move(created, destination)
+        shutil.rmtree(staging)
+
+        return merge_dcm2niix_results(
+            results,
+            cpu_time=(
+                cpu_time_after - cpu_time_before
+                if cpu_time_before is not None and cpu_time_after is not None
+                else None
+            ),
+        )
+
+    def run_dcm2niix(self):
+        """
+        This runs dcm2niix and uses the other methods within this class to supplement the sidecar json's produced as
+        dcm2niix output.
+
+        :return: the path to the output of dcm2niix and the modified sidecar jsons
+        """
+        self.created_files = []
+        if self.check_completeness:
+            self.completeness_report = check_series_completeness(self.image_folder)
+            if not self.completeness_report["complete"]:
+                raise FileNotFoundError(
+                    describe_completeness_gaps(self.completeness_report)
+                )
+
         with TemporaryDirectory(dir=self.tempdir_location) as tempdir:
             tempdir_pathlike = Path(tempdir)
             self.tempdir_location = tempdir_pathlike
-            # people use screwy paths, we do this before running dcm2niix to account for that
-            image_folder = helper_functions.sanitize_bad_path(self.image_folder)
-            cmd = f"{self.dcm2niix_path} {self.dcm2niix_options} {file_format_args} -o {tempdir_pathlike} {image_folder}"
-            convert = subprocess.run(cmd, shell=True, capture_output=True)
+            if self.split_series:
+                convert = self.run_dcm2niix_per_series(tempdir_pathlike)
+            else:
+                convert = self.run_dcm2niix_on_folder(
+                    self.image_folder, tempdir_pathlike
+                )
             self.telemetry_data["dcm2niix"] = {
-                "returncode": convert.returncode,
+                "returncode": convert["returncode"],
+                "timed_out": convert["timed_out"],
+                "wall_time": convert["wall_time"],
+                "cpu_time": convert["cpu_time"],
+                "peak_rss": convert["peak_rss"],
             }
             self.telemetry_data.update(count_output_files(self.tempdir_location))
 
+            if convert["timed_out"]:
+                raise TimeoutError(
+                    f"dcm2niix did not finish converting {self.image_folder} within "
+                    f"{self.dcm2niix_timeout} seconds and was stopped"
+                )
+
             if (
-                convert.returncode != 0
-                or "error" in convert.stderr.decode("utf-8").lower()
+                convert["returncode"] != 0
+                or "error" in convert["stderr"].lower()
+                or convert["fatal_message"]
             ) and not self.ignore_dcm2niix_errors:
                 print(
                     "Check output .nii files, dcm2iix returned these errors during conversion:"
                 )
-                # raise error if missing images is found
-                if "missing images" in convert.stderr.decode("utf8").lower():
-                    error_message = convert.stderr.decode("utf8").replace("Error:", "")
-                    error_message = f"{error_message}for dicoms in {image_folder}"
-                    raise FileNotFoundError(error_message)
-                if (
-                    bytes("Skipping existing file name", "utf-8") not in convert.stdout
-                    or convert.stderr
-                ):
-                    print(convert.stderr.decode("utf-8"))
-                elif (
-                    convert.returncode != 0
-                    and bytes("Error: Check sorted order", "utf-8") in convert.stdout
-                    or convert.stderr
-                ):
-                    print(
-                        "Possible error with frame order, is this a phillips dicom set?"
+                # dcm2niix reports fatal errors on stdout or stderr, either way the conversion was stopped and
+                # what it left behind is incomplete
+                fatal_message = convert["fatal_message"]
+                if fatal_message and "missing images" in fatal_message.lower():
+                    error_message = fatal_message.replace("Error:", "").strip()
+                    raise FileNotFoundError(
+                        f"{error_message} for dicoms in {self.image_folder}"
+                    )
+                elif fatal_message:
+                    if "check sorted order" in fatal_message.lower():
+                        print(
+                            "Possible error with frame order, is this a phillips dicom set?"
+                        )
+                    print(convert["stdout"])
+                    print(convert["stderr"])
+                    raise RuntimeError(
+                        f"dcm2niix was stopped converting {self.image_folder}: {fatal_message}"
                     )
-                    print(convert.stdout)
-                    print(convert.stderr)
+                elif "Skipping existing file name" not in convert["stdout"]:
+                    print(convert["stderr"])
 
             # collect contents of the tempdir
             files_created_by_dcm2niix = [
@@ -653,46 +1338,40 @@ class Dcm2niix4PET:
             except FileExistsError:
                 pass
 
+            # we want to pair up the headers to the files created in the output directory in case
+            # dcm2niix has created files from multiple sessions, this is done once for every file
+            files_to_dicom_headers = self.match_dicom_headers_to_files(
+                destination_path=tempdir_pathlike
+            )
+
             # iterate through created files to supplement sidecar jsons
             for created in files_created_by_dcm2niix:
                 created_path = Path(created)
                 if created_path.suffix == ".json":
-                    # we want to pair up the headers to the files created in the output directory in case
-                    # dcm2niix has created files from multiple sessions
-                    matched_dicoms_and_headers = self.match_dicom_header_to_file(
-                        destination_path=tempdir_pathlike
-                    )
+
+                    # the sidecar is loaded once and built up in memory, each source of values is a layer that
+                    # overrides the ones before it: dcm2niix < dicom header < derived < spreadsheet < kwargs
+                    sidecar = SidecarBuilder(created_path)
 
                     # we check to see what's missing from our recommended and required jsons by gathering the
                     # output of check_json silently
-                    if self.additional_arguments:
-                        check_for_missing = check_json(
-                            created_path,
-                            silent=True,
-                            spreadsheet_metadata=self.spreadsheet_metadata,
-                            **self.additional_arguments,
-                        )
-                    else:
-                        check_for_missing = check_json(
-                            created_path,
-                            silent=True,
-                            spreadsheet_metadata=self.spreadsheet_metadata,
-                        )
+                    check_for_missing = check_json(
+                        sidecar.data,
+                        silent=True,
+                        spreadsheet_metadata=self.spreadsheet_metadata,
+                        **self.additional_arguments,
+                    )
 
                     # we do our best to extra information from the dicom header and insert these values
                     # into the sidecar json
 
-                    # first do a reverse lookup of the key the json corresponds to
-                    lookup = [
-                        key
-                        for key, value in matched_dicoms_and_headers.items()
-                        if str(created_path) in value
-                    ]
-                    if lookup:
-                        dicom_header = self.dicom_headers[lookup[0]]
+                    # first look up the header the json corresponds to
+                    header_key = files_to_dicom_headers.get(str(created_path))
+                    if header_key is not None:
+                        dicom_header = self.dicom_headers[header_key]
 
-                        update_json_with_dicom_value(
-                            created_path,
+                        add_dicom_values(
+                            sidecar,
                             check_for_missing,
                             dicom_header,
                             dicom2bids_json=metadata_dictionaries["dicom2bids"],
@@ -700,40 +1379,20 @@ class Dcm2niix4PET:
                             **self.additional_arguments,
                         )
 
-                    # if we have entities in our metadata spreadsheet that we've used we update
-                    if self.spreadsheet_metadata.get("nifti_json", None):
-                        update_json = JsonMAJ(
-                            json_path=str(created),
-                            update_values=self.spreadsheet_metadata["nifti_json"],
-                            bids_null=True,
-                        )
-                        update_json.update()
-
-                    # check to see if frame duration is a single value, if so convert it to list
-                    update_json = JsonMAJ(json_path=str(created), bids_null=True)
+                    # values supplied by the user via a spreadsheet or kwargs are "the correct input" and take
+                    # precedence over anything this software or dcm2niix has determined
+                    sidecar.update(
+                        "spreadsheet", self.spreadsheet_metadata.get("nifti_json", {})
+                    )
+                    sidecar.update("kwargs", self.additional_arguments)
 
                     # there are some additional updates that depend on some PET BIDS logic that we do next, since these
                     # updates depend on both information provided via the sidecar json and/or information provided via
-                    # additional arguments we run this step after updating the sidecar with those additional user
-                    # arguments
-
-                    sidecar_json = JsonMAJ(
-                        json_path=str(created),
-                        bids_null=True,
-                        update_values=self.additional_arguments,
-                    )  # load all supplied and now written sidecar data in
-
-                    sidecar_json.update()
+                    # additional arguments we run this step after collecting those additional user arguments
+                    sidecar.apply_radio_inputs()
 
-                    check_metadata_radio_inputs = check_meta_radio_inputs(
-                        sidecar_json.json_data
-                    )  # run logic
-
-                    sidecar_json.update(
-                        check_metadata_radio_inputs
-                    )  # update sidecar json with results of logic
-
-                    # should be list/array types in the json
+                    # should be list/array types in the json, as a derived value this doesn't override what the user
+                    # supplied
                     should_be_array = [
                         "FrameDuration",
                         "ScatterFraction",
@@ -741,56 +1400,43 @@ class Dcm2niix4PET:
                         "DecayCorrectionFactor",
                         "ReconFilterSize",
                     ]
-
                     for should in should_be_array:
-                        should_value = update_json.get(should)
+                        should_value = sidecar.get(should)
                         if should_value and type(should_value) is not list:
-                            update_json.update({should: [should_value]})
-
-                    # next we check to see if any of the additional user supplied arguments (kwargs) correspond to
-                    # any of the missing tags in our sidecars
-                    if self.additional_arguments:
-                        update_json = JsonMAJ(
-                            json_path=str(created),
-                            update_values=self.additional_arguments,
-                            bids_null=True,
-                        )
-                        update_json.update()
+                            sidecar.update("derived", {should: [should_value]})
 
                     # check to see if convolution kernel is present
-                    sidecar_json = JsonMAJ(json_path=str(created), bids_null=True)
-                    if sidecar_json.get("ConvolutionKernel"):
-                        if sidecar_json.get("ReconFilterType") and sidecar_json.get(
+                    if sidecar.get("ConvolutionKernel"):
+                        if sidecar.get("ReconFilterType") and sidecar.get(
                             "ReconFilterSize"
                         ):
-                            sidecar_json.remove("ConvolutionKernel")
+                            sidecar.remove("ConvolutionKernel")
                         else:
                             # collect filter size
                             recon_filter_size = ""
-                            if re.search(
-                                r"\d+.\d+", sidecar_json.get("ConvolutionKernel")
-                            ):
+                            if re.search(r"\d+.\d+", sidecar.get("ConvolutionKernel")):
                                 try:
                                     recon_filter_size = re.search(
                                         r"\d+.\d*",
-                                        sidecar_json.get("ConvolutionKernel"),
+                                        sidecar.get("ConvolutionKernel"),
                                     )[0]
                                     recon_filter_size = float(recon_filter_size)
                                 except ValueError:
                                     # If float conversion fails, try splitting and take first part
                                     match_str = re.search(
                                         r"\d+.\d*",
-                                        sidecar_json.get("ConvolutionKernel"),
+                                        sidecar.get("ConvolutionKernel"),
                                     )[0]
                                     recon_filter_size = float(match_str.split()[0])
-                                sidecar_json.update(
-                                    {"ReconFilterSize": float(recon_filter_size)}
+                                sidecar.update(
+                                    "derived",
+                                    {"ReconFilterSize": float(recon_filter_size)},
                                 )
                             # collect just the filter type by popping out the filter size if it exists
                             recon_filter_type = re.sub(
                                 str(recon_filter_size),
                                 "",
-                                sidecar_json.get("ConvolutionKernel"),
+                                sidecar.get("ConvolutionKernel"),
                             )
                             # further sanitize the recon filter type string
                             recon_filter_type = re.sub(
@@ -799,89 +1445,29 @@ class Dcm2niix4PET:
                             recon_filter_type = re.sub(r" +", " ", recon_filter_type)
 
                             # update the json
-                            sidecar_json.update({"ReconFilterType": recon_filter_type})
+                            sidecar.update(
+                                "derived", {"ReconFilterType": recon_filter_type}
+                            )
                             # remove non bids field
-                            sidecar_json.remove("ConvolutionKernel")
-
-                    # check the input args again as our logic is applied after parsing user inputs
-                    if self.additional_arguments:
-                        recon_filter_user_input = {
-                            "ReconFilterSize": self.additional_arguments.get(
-                                "ReconFilterSize", None
-                            ),
-                            "ReconFilterType": self.additional_arguments.get(
-                                "ReconFilterType", None
-                            ),
-                        }
-                        for key, value in recon_filter_user_input.items():
-                            if value:
-                                sidecar_json.update({key: value})
-                    else:
-                        pass
+                            sidecar.remove("ConvolutionKernel")
 
                     # tag json with additional conversion software
-                    conversion_software = sidecar_json.get("ConversionSoftware")
-                    conversion_software_version = sidecar_json.get(
-                        "ConversionSoftwareVersion"
-                    )
-
-                    sidecar_json.update(
-                        {"ConversionSoftware": [conversion_software, "pypet2bids"]}
-                    )
-                    sidecar_json.update(
+                    sidecar.update(
+                        "derived",
                         {
+                            "ConversionSoftware": [
+                                sidecar.get("ConversionSoftware"),
+                                "pypet2bids",
+                            ],
                             "ConversionSoftwareVersion": [
-                                conversion_software_version,
+                                sidecar.get("ConversionSoftwareVersion"),
                                 helper_functions.get_version(),
-                            ]
-                        }
+                            ],
+                        },
                     )
 
-                    # if this looks familiar, that's because it is, we re-run this to override any changes
-                    # made by this software as the input provided by the user is "the correct input"
-                    sidecar_json.update(self.spreadsheet_metadata.get("nifti_json", {}))
-                    sidecar_json.update(self.additional_arguments)
-
-                    # set ModeOfAdministration to lower case
-                    if sidecar_json.get("ModeOfAdministration"):
-                        sidecar_json.update(
-                            {
-                                "ModeOfAdministration": sidecar_json.get(
-                                    "ModeOfAdministration"
-                                ).lower()
-                            }
-                        )
-
-                    # this is mostly for ezBIDS, but it helps us to make better use of the series description that
-                    # dcm2niix generates by default for PET imaging
-                    collect_these_fields = {
-                        "ProtocolName": "",
-                        "SeriesDescription": "",
-                        "TracerName": "trc",
-                        "InjectedRadioactivity": "",
-                        "InjectedRadioactivityUnits": "",
-                        "ReconMethodName": "rec",
-                        "TimeZero": "",
-                    }
-                    collection_of_fields = {}
-                    for field, entity_string in collect_these_fields.items():
-                        if sidecar_json.get(field):
-                            # if there's a shortened entity string for the field use that
-                            if entity_string != "":
-                                collection_of_fields[entity_string] = sidecar_json.get(
-                                    field
-                                )
-                            else:
-                                collection_of_fields[field] = sidecar_json.get(field)
-
-                    if self.session_id:
-                        collection_of_fields["ses"] = self.session_id
-
-                    if self.ezbids:
-                        hash_string = helper_functions.hash_fields(
-                            **collection_of_fields
-                        )
-                        sidecar_json.update({"SeriesDescription": hash_string})
+                    sidecar.add_normalizer(self._normalize_sidecar)
+                    sidecar.write()
 
                 # if there's a subject id rename the output file to use it
                 if self.subject_id:
@@ -940,9 +1526,53 @@ class Dcm2niix4PET:
                 self.new_file_name_with_entities = new_path
 
                 shutil.move(src=created, dst=new_path)
+                self.created_files.append(str(Path(new_path).absolute()))
 
             return self.destination_path
 
+    def _normalize_sidecar(self, sidecar: dict) -> dict:
+        """
+        Final adjustments made to every sidecar after all sources of values have been merged, these apply no matter
+        where a value came from.
+
+        :param sidecar: the merged sidecar
+        :return: values to update the sidecar with
+        """
+        normalized = {}
+        # set ModeOfAdministration to lower case
+        if sidecar.get("ModeOfAdministration"):
+            normalized["ModeOfAdministration"] = sidecar["ModeOfAdministration"].lower()
+
+        # this is mostly for ezBIDS, but it helps us to make better use of the series description that
+        # dcm2niix generates by default for PET imaging
+        if self.ezbids:
+            collect_these_fields = {
+                "ProtocolName": "",
+                "SeriesDescription": "",
+                "TracerName": "trc",
+                "InjectedRadioactivity": "",
+                "InjectedRadioactivityUnits": "",
+                "ReconMethodName": "rec",
+                "TimeZero": "",
+            }
+            collection_of_fields = {}
+            for field, entity_string in collect_these_fields.items():
+                if sidecar.get(field):
+                    # if there's a shortened entity string for the field use that
+                    if entity_string != "":
+                        collection_of_fields[entity_string] = sidecar.get(field)
+                    else:
+                        collection_of_fields[field] = sidecar.get(field)
+
+            if self.session_id:
+                collection_of_fields["ses"] = self.session_id
+
+            normalized["SeriesDescription"] = helper_functions.hash_fields(
+                **collection_of_fields
+            )
+
+        return normalized
+
     def post_dcm2niix(self):
         # TODO add logic to handle blood tsv recording manual vs automatic
         # for now we will just assume that if the user supplied a blood tsv then it is manual
@@ -993,6 +1623,8 @@ class Dcm2niix4PET:
                     f"pandas.DataFrame or str\nCheck return type of translate_metadata in "
                     f"{self.metadata_translation_script}"
                 )
+            blood_tsv_path = Path(self.destination_folder, blood_file_name + ".tsv")
+            self.created_files.append(str(blood_tsv_path.absolute()))
 
         # if there's blood data in the tsv then write out the sidecar file too
         if (
@@ -1017,6 +1649,8 @@ class Dcm2niix4PET:
                 join(self.destination_folder, blood_file_name + ".json"), "w"
             ) as outfile:
                 json.dump(blood_json_data, outfile, indent=4)
+            blood_json_path = Path(self.destination_folder, blood_file_name + ".json")
+            self.created_files.append(str(blood_json_path.absolute()))
 
     def convert(self):
         # check the size of out the output folder
@@ -1025,7 +1659,7 @@ class Dcm2niix4PET:
         self.post_dcm2niix()
 
         # if telemetry isn't disabled we send a telemetry event to the pypet2bids server
-        if telemetry_enabled:
+        if telemetry_enabled():
             # count the number of files
             self.telemetry_data.update(count_input_files(self.image_folder))
             # record if a blood tsv and json file were created
@@ -1034,7 +1668,9 @@ class Dcm2niix4PET:
             else:
                 self.telemetry_data["blood_tsv"] = False
             # record if a metadata spreadsheet was used
-            if helper_functions.collect_spreadsheets(self.metadata_path):
+            if self.metadata_path and helper_functions.collect_spreadsheets(
+                self.metadata_path
+            ):
                 self.telemetry_data["metadata_spreadsheet_used"] = True
             else:
                 self.telemetry_data["metadata_spreadsheet_used"] = False
@@ -1045,47 +1681,87 @@ class Dcm2niix4PET:
 
             send_telemetry(self.telemetry_data)
 
-    def match_dicom_header_to_file(self, destination_path=None):
+    def match_dicom_headers_to_files(self, destination_path=None) -> dict:
         """
-        Matches a dicom header to a nifti or json file produced by dcm2niix, this is run after dcm2niix converts the
-        input dicoms into nifti's and json's.
+        Pairs each file produced by dcm2niix with the dicom header it was converted from. The pairing is built once per
+        conversion: the headers are indexed by SeriesInstanceUID, SeriesNumber, and study date time, then each json
+        written by dcm2niix is looked up in that index. SeriesInstanceUID is only written by dcm2niix when it's run
+        with -ba n, SeriesNumber is always written, and the study date time is matched against file names created with
+        %t as a last resort. Niftis are paired with the same header as the json that shares their name.
 
         :param destination_path: the path dcm2niix generated files are placed at, collected during class instantiation
-
-        :return: a dictionary of headers matched to nifti and json file names
+        :return: a dictionary of output file paths to the key of their header in self.dicom_headers
         """
         if not destination_path:
             destination_path = self.destination_path
-        # first collect all the files in the output directory
+
+        by_series_uid, by_series_number, by_date_time = {}, {}, {}
+        for key, header in self.dicom_headers.items():
+            series_uid = header.get("SeriesInstanceUID", None)
+            if series_uid:
+                by_series_uid.setdefault(str(series_uid), key)
+            series_number = header.get("SeriesNumber", None)
+            if series_number is not None and series_number != "":
+                by_series_number.setdefault(str(int(series_number)), []).append(key)
+            if header.get("StudyDate", None) and header.get("StudyTime", None):
+                date_time = dicom_datetime_to_dcm2niix_time(
+                    date=header.StudyDate, time=header.StudyTime
+                )
+                by_date_time.setdefault(date_time, []).append(key)
+
+        def match_by_date_time(file_name, candidates):
+            for date_time, keys in by_date_time.items():
+                if date_time in file_name:
+                    for key in keys:
+                        if candidates is None or key in candidates:
+                            return key
+            return None
+
         output_files = [
             join(destination_path, output_file)
             for output_file in listdir(destination_path)
         ]
+        files_to_headers = {}
+        for output_file in output_files:
+            if not output_file.endswith(".json"):
+                continue
+            with open(output_file, "r") as infile:
+                sidecar = json.load(infile)
+            file_name = Path(output_file).name
+
+            key = by_series_uid.get(str(sidecar.get("SeriesInstanceUID")))
+            if key is None and sidecar.get("SeriesNumber") is not None:
+                candidates = by_series_number.get(str(sidecar["SeriesNumber"]), [])
+                # several studies can share a series number, the date time breaks the tie
+                if len(candidates) > 1:
+                    key = match_by_date_time(file_name, candidates) or candidates[0]
+                elif candidates:
+                    key = candidates[0]
+            if key is None:
+                key = match_by_date_time(file_name, None)
+
+            if key is not None:
+                stem = output_file[: -len(".json")]
+                for paired_file in output_files:
+                    if paired_file == output_file or paired_file.startswith(stem + "."):
+                        files_to_headers[paired_file] = key
+
+        return files_to_headers
 
-        # create empty dictionary to store pairings
-        headers_to_files = {}
-
-        # collect study date and time from header
-        for each in self.dicom_headers:
-            header_study_date = self.dicom_headers[each].StudyDate
-            header_acquisition_time = str(
-                round(float(self.dicom_headers[each].StudyTime))
-            )
-            if len(header_acquisition_time) < 6:
-                header_acquisition_time = (
-                    6 - len(header_acquisition_time)
-                ) * "0" + header_acquisition_time
+    def match_dicom_header_to_file(self, destination_path=None):
+        """
+        Matches a dicom header to a nifti or json file produced by dcm2niix, this is run after dcm2niix converts the
+        input dicoms into nifti's and json's.
 
-            header_date_time = dicom_datetime_to_dcm2niix_time(
-                date=header_study_date, time=header_acquisition_time
-            )
+        :param destination_path: the path dcm2niix generated files are placed at, collected during class instantiation
 
-            for output_file in output_files:
-                if header_date_time in output_file:
-                    try:
-                        headers_to_files[each].append(output_file)
-                    except KeyError:
-                        headers_to_files[each] = [output_file]
+        :return: a dictionary of headers matched to nifti and json file names
+        """
+        headers_to_files = {}
+        for output_file, key in self.match_dicom_headers_to_files(
+            destination_path
+        ).items():
+            headers_to_files.setdefault(key, []).append(output_file)
         return headers_to_files
 
     def extract_metadata(self):
@@ -1158,6 +1834,271 @@ epilog = textwrap.dedent(
 )
 
 
+# columns that may be supplied in a batch manifest, only folder is required
+batch_manifest_columns = [
+    "folder",
+    "destination_path",
+    "metadata_path",
+    "translation_script_path",
+    "kwargs",
+    "trc",
+    "run",
+    "rec",
+]
+
+
+def read_batch_manifest(manifest_path) -> list:
+    """
+    Reads a tab separated manifest of conversions to run with dcm2niix4pet --batch. Each row describes a single
+    conversion with the columns folder, destination_path, metadata_path, translation_script_path, kwargs, trc, run, and
+    rec. Only folder is required, kwargs are written the same way they are on the command line e.g.
+    `TimeZero="12:12:12" InjectedRadioactivity=1` and are parsed by the worker running that row.
+
+    :param manifest_path: path to the manifest tsv
+    :return: a list of dictionaries, one per row, missing or empty columns are set to None
+    """
+    manifest = pd.read_csv(manifest_path, sep="\t", dtype=str, keep_default_na=False)
+    if "folder" not in manifest.columns:
+        raise ValueError(f"Batch manifest {manifest_path} must contain a folder column")
+    unknown_columns = set(manifest.columns) - set(batch_manifest_columns)
+    if unknown_columns:
+        logger.warning(
+            f"Ignoring unknown columns {sorted(unknown_columns)} in batch manifest {manifest_path}"
+        )
+
+    rows = []
+    for record in manifest.to_dict(orient="records"):
+        row = {
+            column: (record.get(column) or "").strip() or None
+            for column in batch_manifest_columns
+        }
+        rows.append(row)
+    return rows
+
+
+def parse_kwargs_string(kwargs_string: str) -> dict:
+    """
+    Parses key=value pairs written as they would be on the command line into a dictionary, values are evaluated with
+    helper_functions.very_tolerant_literal_eval just as they are by helper_functions.ParseKwargs.
+
+    :param kwargs_string: e.g. 'TimeZero="12:12:12" InjectedRadioactivity=1'
+    :return: a dictionary of the parsed pairs
+    """
+    kwargs = {}
+    for pair in shlex.split(kwargs_string or ""):
+        try:
+            key, value = pair.split("=", 1)
+        except ValueError:
+            raise ValueError(f"Unable to unpack {pair}")
+        kwargs[key] = helper_functions.very_tolerant_literal_eval(value)
+    return kwargs
+
+
+# options that change how a conversion runs but not what it creates
+run_only_options = [
+    "tempdir_location",
+    "silent",
+    "dcm2niix_timeout",
+    "check_completeness",
+    "n_jobs",
+]
+
+
+def default_destination(folder, destination_path=None) -> str:
+    """
+    Output is written to the folder being converted unless a destination is given, or next to an archive rather than
+    inside it.
+
+    :param folder: the folder or archive being converted
+    :param destination_path: the destination given by the user, if any
+    :return: the destination path
+    """
+    if destination_path:
+        return destination_path
+    if is_archive(folder):
+        return str(Path(folder).parent)
+    return folder
+
+
+def conversion_settings(row: dict, options: dict) -> dict:
+    """
+    Collects the values other than the dicoms and metadata spreadsheet that determine the output of a conversion, used
+    to tell whether a conversion recorded in a ConversionManifest is up to date.
+
+    :param row: a batch manifest row, or a dictionary with the same keys
+    :param options: keyword arguments to Dcm2niix4PET
+    :return: the settings as a dictionary
+    """
+    return {
+        "kwargs": row.get("kwargs"),
+        "trc": row.get("trc"),
+        "run": row.get("run"),
+        "rec": row.get("rec"),
+        "destination_path": row.get("destination_path"),
+        "translation_script": hash_file(row.get("translation_script_path")),
+        "options": {
+            key: value for key, value in options.items() if key not in run_only_options
+        },
+    }
+
+
+def convert_batch_row(row: dict, options: dict) -> dict:
+    """
+    Runs a single conversion from a batch manifest, this is the unit of work sent to each worker by run_batch. Every
+    conversion creates its own Dcm2niix4PET object and therefore runs dcm2niix in its own temporary directory.
+
+    :param row: a row of the manifest as returned by read_batch_manifest
+    :param options: options shared by every conversion in the batch, these are keyword arguments to Dcm2niix4PET
+    :return: a dictionary recording the status, error (if any), duration in seconds, and created files of the
+        conversion
+    """
+    start = time.perf_counter()
+    result = {"status": "success", "error": "", "outputs": ""}
+    options = dict(options)
+    try:
+        folder = helper_functions.expand_path(row["folder"])
+        check_completeness = options.pop("check_completeness", False)
+        if is_archive(folder):
+            # archives are checked by the converter once their PET dicoms are extracted
+            options["check_completeness"] = check_completeness
+        elif check_completeness:
+            completeness_report = check_series_completeness(folder)
+            if not completeness_report["complete"]:
+                # the dicoms may still be arriving, leave the row to be converted by a later batch
+                result["status"] = "deferred"
+                result["error"] = describe_completeness_gaps(completeness_report)
+                logger.warning(result["error"])
+                result["duration"] = round(time.perf_counter() - start, 3)
+                return result
+        destination_path = default_destination(folder, row["destination_path"])
+        converter = Dcm2niix4PET(
+            image_folder=folder,
+            destination_path=helper_functions.expand_path(destination_path),
+            metadata_path=helper_functions.expand_path(row["metadata_path"]),
+            metadata_translation_script=helper_functions.expand_path(
+                row["translation_script_path"]
+            ),
+            additional_arguments=parse_kwargs_string(row["kwargs"]),
+            **options,
+        )
+        if row["trc"]:
+            converter.tracer = "trc-" + row["trc"]
+        if row["run"]:
+            converter.run_id = "run-" + row["run"]
+        if row["rec"]:
+            converter.reconstruction_method = "rec-" + row["rec"]
+
+        converter.convert()
+        # only the files this conversion moved into place, rows sharing a destination folder may run at the same time
+        created = sorted(set(converter.created_files))
+        result["outputs"] = ",".join(created)
+        if not created:
+            raise Exception(f"no files were created from {row['folder']}")
+    except (Exception, SystemExit) as err:
+        result["status"] = "failed"
+        result["error"] = f"{type(err).__name__}: {err}"
+        logger.error(f"Failed to convert {row['folder']}: {result['error']}")
+    result["duration"] = round(time.perf_counter() - start, 3)
+    return result
+
+
+def run_batch(
+    manifest_path,
+    results_path=None,
+    n_jobs: int = 1,
+    options: dict = {},
+    incremental: bool = False,
+) -> pd.DataFrame:
+    """
+    Converts every row of a batch manifest using a pool of worker processes, each worker imports this module once and
+    then runs as many conversions as it is given. The outcome of every row is written to a results tsv containing the
+    manifest columns along with status, error, duration, and outputs columns.
+
+    :param manifest_path: path to a manifest tsv, see read_batch_manifest
+    :param results_path: path to write the results tsv to, defaults to <manifest name>_results.tsv next to the manifest
+    :param n_jobs: number of conversions to run at once
+    :param options: keyword arguments passed to every Dcm2niix4PET object, e.g. dcm2niix_options or tempdir_location
+    :param incremental: skip rows already converted with the same inputs and settings according to the
+        ConversionManifest of their destination, these rows are given the status skipped. Each conversion is recorded
+        in the manifest as soon as it finishes so an interrupted batch resumes where it stopped.
+    :return: the results as a pandas.DataFrame
+    """
+    rows = read_batch_manifest(manifest_path)
+    if not results_path:
+        results_path = Path(manifest_path).with_name(
+            Path(manifest_path).stem + "_results.tsv"
+        )
+
+    results = [None] * len(rows)
+    # manifests are only read and written here, never by the workers
+    manifests, entries = {}, {}
+    for index, row in enumerate(rows):
+        if not incremental:
+            continue
+        folder = helper_functions.expand_path(row["folder"])
+        manifest = ConversionManifest.for_destination(
+            helper_functions.expand_path(
+                default_destination(folder, row["destination_path"])
+            )
+        )
+        manifest = manifests.setdefault(manifest.path, manifest)
+        entry = manifest.describe(
+            folder, row["metadata_path"], conversion_settings(row, options)
+        )
+        entries[index] = (manifest, entry)
+        if manifest.is_up_to_date(entry):
+            results[index] = {
+                "status": "skipped",
+                "error": "",
+                "outputs": ",".join(
+                    str(manifest.path.parent / output)
+                    for output in manifest.entries[entry["input"]]["outputs"]
+                ),
+                "duration": 0,
+            }
+
+    def finished(index, result):
+        results[index] = result
+        if incremental and result["status"] == "success":
+            manifest, entry = entries[index]
+            manifest.record(entry, result["outputs"].split(","))
+
+    pending = [index for index, result in enumerate(results) if result is None]
+    if n_jobs == 1:
+        for index in pending:
+            finished(index, convert_batch_row(rows[index], options))
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            for index, result in zip(
+                pending,
+                executor.map(
+                    convert_batch_row,
+                    [rows[index] for index in pending],
+                    [options] * len(pending),
+                ),
+            ):
+                finished(index, result)
+
+    records = [{**row, **result} for row, result in zip(rows, results)]
+
+    results_dataframe = pd.DataFrame(
+        records,
+        columns=batch_manifest_columns + ["status", "error", "duration", "outputs"],
+    )
+    results_dataframe.to_csv(results_path, sep="\t", index=False, na_rep="")
+    converted = (results_dataframe["status"] == "success").sum()
+    skipped = (results_dataframe["status"] == "skipped").sum()
+    deferred = (results_dataframe["status"] == "deferred").sum()
+    logger.info(
+        f"Converted {converted} of {len(rows)} rows from {manifest_path}, results written to {results_path}"
+    )
+    if skipped:
+        logger.info(f"Skipped {skipped} rows that were already converted")
+    if deferred:
+        logger.info(f"Deferred {deferred} rows with incomplete series")
+    return results_dataframe
+
+
 def cli():
     """
     Collects arguments used to initiate a Dcm2niix4PET class, collects the following arguments from the user.
@@ -1175,7 +2116,10 @@ def cli():
         "them to BIDS compliant nifti (using dcm2niix), json, and tsv files.",
     )
     parser.add_argument(
-        "folder", nargs="?", type=str, help="Folder path containing imaging data"
+        "folder",
+        nargs="?",
+        type=str,
+        help="Folder path containing imaging data, or a zip or tar archive of it",
     )
     parser.add_argument(
         "--metadata-path",
@@ -1310,6 +2254,52 @@ def cli():
         help="Accept any NifTi produced by dcm2niix even if it contains errors. This flag should only be used for "
         "batch processing and only if you're performing robust QC after the fact.",
     )
+    parser.add_argument(
+        "--split-series",
+        action="store_true",
+        default=False,
+        help="Group the dicoms in the folder by series first, series that aren't PET (e.g. CT) are skipped and "
+        "dcm2niix is run on each PET series at the same time. Use --njobs to limit the number of series converted at "
+        "once.",
+    )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        choices=conversion_engines,
+        default="dcm2niix",
+        help="Converter to use, dcm2niix (default) or native. The native engine converts PET dicoms with pydicom "
+        "without starting dcm2niix and only uses the -z n option of --dcm2niix-options, if given.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        default=False,
+        help="Skip folders that were already converted with the same dicoms, metadata, and options. Conversions are "
+        "recorded in .pet2bids_manifest.json at the root of the output dataset, which also records the input each "
+        "output was converted from. With --batch, rows already converted are given the status skipped.",
+    )
+    parser.add_argument(
+        "--check-completeness",
+        action="store_true",
+        default=False,
+        help="Check that every PET series has all of its slices and frames using only the dicom headers before "
+        "running dcm2niix. Incomplete folders are not converted, with --batch their rows are given the status "
+        "deferred and don't cause a non-zero exit status.",
+    )
+    parser.add_argument(
+        "--headers-per-series",
+        type=int,
+        default=None,
+        help="Read this many dicom headers from every series in the folder to supplement the sidecars of each series "
+        "dcm2niix creates. By default only the header of the first dicom found is read.",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Stop dcm2niix if it hasn't finished converting after this many seconds, by default dcm2niix is given "
+        "as long as it needs.",
+    )
     parser.add_argument(
         "--dcm2niix-options",
         nargs="*",
@@ -1319,6 +2309,28 @@ def cli():
         "You can also set default options using --set-dcm2niix-options or the PET2BIDS_DCM2NIIX_OPTIONS environment variable. "
         "Example: --dcm2niix-options -v y -w 1 -z y",
     )
+    parser.add_argument(
+        "--batch",
+        type=str,
+        default=None,
+        help="Path to a tab separated manifest of conversions to run, one per row, with the columns folder, "
+        "destination_path, metadata_path, translation_script_path, kwargs, trc, run, and rec. Only folder is "
+        "required. Options such as --dcm2niix-options and --tempdir apply to every row.",
+    )
+    parser.add_argument(
+        "--batch-results",
+        type=str,
+        default=None,
+        help="Path to write the per row results of a --batch run to, defaults to <manifest>_results.tsv",
+    )
+    parser.add_argument(
+        "--njobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Number of conversions to run at once when using --batch, default is 1. With --split-series the number "
+        "of series to convert at once, default is all of them.",
+    )
     return parser
 
 
@@ -1479,7 +2491,68 @@ def main():
     if cli_args.notrack:
         environ["PET2BIDS_TRACK"] = "False"
 
+    if cli_args.batch:
+        results = run_batch(
+            manifest_path=helper_functions.expand_path(cli_args.batch),
+            results_path=helper_functions.expand_path(cli_args.batch_results),
+            n_jobs=cli_args.njobs or 1,
+            incremental=cli_args.incremental,
+            options={
+                "dcm2niix_options": (
+                    " ".join(cli_args.dcm2niix_options)
+                    if cli_args.dcm2niix_options
+                    else ""
+                ),
+                "tempdir_location": cli_args.tempdir,
+                "silent": cli_args.silent,
+                "ezbids": cli_args.ezbids,
+                "ignore_dcm2niix_errors": cli_args.ignore_dcm2niix_errors,
+                "dcm2niix_timeout": cli_args.timeout,
+                "headers_per_series": cli_args.headers_per_series,
+                "split_series": cli_args.split_series,
+                "engine": cli_args.engine,
+                "check_completeness": cli_args.check_completeness,
+            },
+        )
+        # deferred rows aren't failures, they're converted once their series are complete
+        if (~results["status"].isin(["success", "skipped", "deferred"])).any():
+            sys.exit(1)
     elif cli_args.folder:
+        folder = helper_functions.expand_path(cli_args.folder)
+        if cli_args.incremental:
+            manifest = ConversionManifest.for_destination(
+                helper_functions.expand_path(
+                    default_destination(folder, cli_args.destination_path)
+                )
+            )
+            manifest_entry = manifest.describe(
+                folder,
+                cli_args.metadata_path,
+                conversion_settings(
+                    {
+                        "kwargs": cli_args.kwargs,
+                        "trc": cli_args.trc,
+                        "run": cli_args.run,
+                        "rec": cli_args.rec,
+                        "destination_path": cli_args.destination_path,
+                        "translation_script_path": cli_args.translation_script_path,
+                    },
+                    {
+                        "dcm2niix_options": cli_args.dcm2niix_options,
+                        "ezbids": cli_args.ezbids,
+                        "ignore_dcm2niix_errors": cli_args.ignore_dcm2niix_errors,
+                        "headers_per_series": cli_args.headers_per_series,
+                        "split_series": cli_args.split_series,
+                        "engine": cli_args.engine,
+                    },
+                ),
+            )
+            if manifest.is_up_to_date(manifest_entry):
+                logger.info(
+                    f"{folder} has already been converted, see {manifest.path}, skipping"
+                )
+                sys.exit(0)
+
         # instantiate class
         converter = Dcm2niix4PET(
             image_folder=helper_functions.expand_path(cli_args.folder),
@@ -1496,6 +2569,12 @@ def main():
             silent=cli_args.silent,
             ezbids=cli_args.ezbids,
             ignore_dcm2niix_errors=cli_args.ignore_dcm2niix_errors,
+            dcm2niix_timeout=cli_args.timeout,
+            headers_per_series=cli_args.headers_per_series,
+            split_series=cli_args.split_series,
+            engine=cli_args.engine,
+            check_completeness=cli_args.check_completeness,
+            n_jobs=cli_args.njobs,
         )
 
         if cli_args.trc:
@@ -1506,9 +2585,11 @@ def main():
             converter.reconstruction_method = "rec-" + cli_args.rec
 
         converter.convert()
+        if cli_args.incremental:
+            manifest.record(manifest_entry, sorted(set(converter.created_files)))
     else:
         print(
-            "folder is a required argument for running dcm2niix, see -h for more detailed usage."
+            "folder (or --batch) is a required argument for running dcm2niix, see -h for more detailed usage."
         )
         sys.exit(1)
 
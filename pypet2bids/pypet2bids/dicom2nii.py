@@ -0,0 +1,395 @@
+"""
+A pure python (pydicom and numpy) converter from PET dicoms to nifti, an alternative to running dcm2niix in a
+subprocess. For small and medium sized series starting dcm2niix, writing to and reading back from a temporary folder
+takes longer than the conversion itself, this module does the conversion in process instead. The niftis and sidecars
+it writes follow the conventions of dcm2niix (orientation, file names, and sidecar fields) so that they can be handled
+the same way by Dcm2niix4PET.
+
+Only PET series are converted, slices are grouped into frames by FrameReferenceTime and ActualFrameDuration and
+sorted along the slice direction by ImagePositionPatient.
+
+| *Authors: Anthony Galassi*
+| *Copyright OpenNeuroPET team*
+"""
+
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from os import walk
+from os.path import join
+from pathlib import Path
+
+import nibabel
+import numpy
+import pydicom
+
+try:
+    import helper_functions
+except ModuleNotFoundError:
+    import pypet2bids.helper_functions as helper_functions
+
+logger = helper_functions.logger("pypet2bids")
+
+# dcm2niix shortens some manufacturer names in its sidecars, we do the same
+manufacturer_names = {
+    "SIEMENS": "Siemens",
+    "GE MEDICAL SYSTEMS": "GE",
+    "PHILIPS": "Philips",
+    "PHILIPS MEDICAL SYSTEMS": "Philips",
+    "CANON_MEC": "Canon",
+    "TOSHIBA_MEC": "Toshiba",
+    "UIH": "UIH",
+}
+
+# sidecar fields copied as they are from the dicom header, BIDS name: dicom keyword
+header_to_sidecar = {
+    "Modality": "Modality",
+    "Manufacturer": "Manufacturer",
+    "ManufacturersModelName": "ManufacturerModelName",
+    "InstitutionName": "InstitutionName",
+    "PatientPosition": "PatientPosition",
+    "SeriesDescription": "SeriesDescription",
+    "ProtocolName": "ProtocolName",
+    "ImageType": "ImageType",
+    "SeriesNumber": "SeriesNumber",
+    "AcquisitionNumber": "AcquisitionNumber",
+    "ConvolutionKernel": "ConvolutionKernel",
+    "Units": "Units",
+    "DecayCorrection": "DecayCorrection",
+    "AttenuationCorrectionMethod": "AttenuationCorrectionMethod",
+    "ReconstructionMethod": "ReconstructionMethod",
+    "SliceThickness": "SliceThickness",
+}
+
+
+def _read_dicom(dicom_path):
+    """
+    Reads the header of a dicom and, only if it's a PET image, its pixel data.
+
+    :param dicom_path: path to a file
+    :return: the full dataset of a PET dicom, the header alone of any other dicom, or None if the file isn't a dicom
+    """
+    try:
+        header = pydicom.dcmread(dicom_path, stop_before_pixels=True)
+    except pydicom.errors.InvalidDicomError:
+        return None
+    if header.get("Modality", None) != "PT":
+        return header
+    return pydicom.dcmread(dicom_path)
+
+
+def read_pet_series(image_folder, n_jobs: int = None) -> dict:
+    """
+    Reads every dicom in a folder in parallel and groups the PET dicoms by series, dicoms of other modalities are
+    skipped without reading their pixel data.
+
+    :param image_folder: folder of dicoms, searched recursively
+    :param n_jobs: the number of threads to read dicoms with
+    :return: a dictionary of SeriesInstanceUID to the list of datasets in that series
+    """
+    dicom_paths = [
+        Path(join(root, f)) for root, dirs, files in walk(image_folder) for f in files
+    ]
+    n_jobs = n_jobs or min(32, (os.cpu_count() or 1) + 4)
+    series = {}
+    skipped = set()
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        for dataset in executor.map(_read_dicom, dicom_paths):
+            if dataset is None:
+                continue
+            if dataset.get("Modality", None) != "PT":
+                skipped.add(str(dataset.get("Modality", None)))
+                continue
+            if "PixelData" not in dataset:
+                continue
+            series.setdefault(str(dataset.get("SeriesInstanceUID", "")), []).append(
+                dataset
+            )
+    if skipped:
+        logger.info(f"Skipping non PET dicoms ({', '.join(sorted(skipped))})")
+    return series
+
+
+def sort_pet_frames(datasets: list) -> list:
+    """
+    Groups the slices of a PET series into frames and sorts the slices of each frame along the slice direction.
+
+    :param datasets: the datasets of a single series
+    :return: a list of frames ordered in time, each a list of datasets ordered by position
+    """
+    orientation = numpy.array(datasets[0].ImageOrientationPatient, dtype=float)
+    normal = numpy.cross(orientation[:3], orientation[3:])
+
+    frames = {}
+    for dataset in datasets:
+        frame_key = (
+            float(dataset.get("FrameReferenceTime", 0) or 0),
+            float(dataset.get("ActualFrameDuration", 0) or 0),
+        )
+        frames.setdefault(frame_key, []).append(dataset)
+
+    sorted_frames = []
+    for frame_key in sorted(frames):
+        sorted_frames.append(
+            sorted(
+                frames[frame_key],
+                key=lambda dataset: float(
+                    numpy.dot(
+                        numpy.array(dataset.ImagePositionPatient, dtype=float), normal
+                    )
+                ),
+            )
+        )
+
+    slices_per_frame = [len(frame) for frame in sorted_frames]
+    if len(set(slices_per_frame)) > 1:
+        raise ValueError(
+            f"Missing images, frames of series {datasets[0].get('SeriesNumber', '')} have differing numbers of "
+            f"slices: {slices_per_frame}"
+        )
+    return sorted_frames
+
+
+def dicom_affine(frame: list) -> numpy.ndarray:
+    """
+    Builds the RAS affine of a frame from its sorted slices. As dcm2niix does, rows are flipped so the first row of the
+    dicom is the last row of the nifti.
+
+    :param frame: the datasets of a single frame sorted by position
+    :return: a 4x4 affine
+    """
+    first = frame[0]
+    orientation = numpy.array(first.ImageOrientationPatient, dtype=float)
+    row_cosine, column_cosine = orientation[:3], orientation[3:]
+    # PixelSpacing is the spacing between rows followed by the spacing between columns
+    row_spacing, column_spacing = (float(spacing) for spacing in first.PixelSpacing)
+    origin = numpy.array(first.ImagePositionPatient, dtype=float)
+    if len(frame) > 1:
+        last = numpy.array(frame[-1].ImagePositionPatient, dtype=float)
+        slice_vector = (last - origin) / (len(frame) - 1)
+    else:
+        slice_vector = numpy.cross(row_cosine, column_cosine) * float(
+            first.get("SliceThickness", 1) or 1
+        )
+
+    affine = numpy.eye(4)
+    affine[:3, 0] = row_cosine * column_spacing
+    affine[:3, 1] = column_cosine * row_spacing
+    affine[:3, 2] = slice_vector
+    affine[:3, 3] = origin
+
+    # flip the rows
+    affine[:3, 3] += (int(first.Rows) - 1) * affine[:3, 1]
+    affine[:3, 1] *= -1
+
+    # dicom is LPS, nifti is RAS
+    return numpy.diag([-1, -1, 1, 1]) @ affine
+
+
+def pet_volume(frames: list) -> numpy.ndarray:
+    """
+    Stacks the pixel data of every slice into a single volume and applies the rescale slope and intercept of each
+    slice. If every slice shares the same slope and intercept of 1 and 0 the stored data type is kept, otherwise the
+    result is float32.
+
+    :param frames: frames of sorted datasets as returned by sort_pet_frames
+    :return: an array of shape columns x rows x slices (x frames if there's more than one)
+    """
+    datasets = [dataset for frame in frames for dataset in frame]
+    stored = numpy.stack([dataset.pixel_array for dataset in datasets])
+    slopes = numpy.array(
+        [float(dataset.get("RescaleSlope", 1) or 1) for dataset in datasets]
+    )
+    intercepts = numpy.array(
+        [float(dataset.get("RescaleIntercept", 0) or 0) for dataset in datasets]
+    )
+    if numpy.all(slopes == 1) and numpy.all(intercepts == 0):
+        volume = stored
+    else:
+        volume = stored.astype(numpy.float32) * slopes[:, None, None].astype(
+            numpy.float32
+        ) + intercepts[:, None, None].astype(numpy.float32)
+
+    number_of_frames = len(frames)
+    volume = volume.reshape((number_of_frames, len(frames[0])) + stored.shape[1:])
+    # frames, slices, rows, columns -> columns, rows, slices, frames and flip the rows
+    volume = volume.transpose(3, 2, 1, 0)[:, ::-1]
+    if number_of_frames == 1:
+        volume = volume[..., 0]
+    return numpy.ascontiguousarray(volume)
+
+
+def _format_time(dicom_time) -> str:
+    dicom_time = str(dicom_time)
+    return f"{dicom_time[0:2]}:{dicom_time[2:4]}:{dicom_time[4:6]}"
+
+
+def pet_sidecar(frames: list) -> dict:
+    """
+    Creates the sidecar for a converted series with the fields dcm2niix would include for it.
+
+    :param frames: frames of sorted datasets as returned by sort_pet_frames
+    :return: the sidecar as a dictionary
+    """
+    first = frames[0][0]
+    sidecar = {}
+    for bids_field, keyword in header_to_sidecar.items():
+        value = first.get(keyword, None)
+        if value is None or value == "":
+            continue
+        if isinstance(value, pydicom.multival.MultiValue):
+            value = list(value)
+        elif isinstance(value, pydicom.valuerep.IS):
+            value = int(value)
+        elif isinstance(value, pydicom.valuerep.DSfloat):
+            value = float(value)
+        sidecar[bids_field] = value
+
+    sidecar["Manufacturer"] = manufacturer_names.get(
+        str(sidecar.get("Manufacturer", "")).upper(), sidecar.get("Manufacturer")
+    )
+    if first.get("AcquisitionTime", None):
+        sidecar["AcquisitionTime"] = (
+            _format_time(first.AcquisitionTime)
+            + f".{str(first.AcquisitionTime).partition('.')[2]:0<6}"
+        )
+
+    radiopharmaceutical_sequence = first.get(
+        "RadiopharmaceuticalInformationSequence", None
+    )
+    if radiopharmaceutical_sequence:
+        radiopharmaceutical = radiopharmaceutical_sequence[0]
+        if radiopharmaceutical.get("Radiopharmaceutical", None):
+            sidecar["Radiopharmaceutical"] = str(
+                radiopharmaceutical.Radiopharmaceutical
+            )
+        if radiopharmaceutical.get("RadionuclidePositronFraction", None):
+            sidecar["RadionuclidePositronFraction"] = float(
+                radiopharmaceutical.RadionuclidePositronFraction
+            )
+        if radiopharmaceutical.get("RadionuclideTotalDose", None):
+            # dicom records the dose in Bq
+            sidecar["InjectedRadioactivity"] = (
+                float(radiopharmaceutical.RadionuclideTotalDose) / 1e6
+            )
+            sidecar["InjectedRadioactivityUnits"] = "MBq"
+        if radiopharmaceutical.get("RadionuclideHalfLife", None):
+            sidecar["RadionuclideHalfLife"] = float(
+                radiopharmaceutical.RadionuclideHalfLife
+            )
+
+    if sidecar.get("ReconstructionMethod"):
+        recon_method = helper_functions.get_recon_method(
+            sidecar["ReconstructionMethod"]
+        )
+        for field in [
+            "ReconMethodName",
+            "ReconMethodParameterLabels",
+            "ReconMethodParameterValues",
+        ]:
+            if recon_method.get(field):
+                sidecar[field] = recon_method[field]
+
+    # frame timing is recorded in milliseconds
+    if first.get("ActualFrameDuration", None) is not None:
+        sidecar["FrameDuration"] = [
+            float(frame[0].ActualFrameDuration) / 1000 for frame in frames
+        ]
+    if first.get("FrameReferenceTime", None) is not None:
+        sidecar["FrameReferenceTime"] = [
+            float(frame[0].FrameReferenceTime) / 1000 for frame in frames
+        ]
+    if first.get("AcquisitionTime", None):
+        sidecar["TimeZero"] = _format_time(first.AcquisitionTime)
+
+    sidecar["ImageOrientationPatientDICOM"] = [
+        float(value) for value in first.ImageOrientationPatient
+    ]
+    sidecar["ConversionSoftware"] = "pydicom"
+    sidecar["ConversionSoftwareVersion"] = pydicom.__version__
+    return sidecar
+
+
+def format_file_name(file_format: str, dataset, image_folder) -> str:
+    """
+    Creates a file name from a dcm2niix style format string, supports %d (series description), %f (folder name),
+    %i (patient id), %m (manufacturer), %n (patient name), %p (protocol name), %s (series number), and %t (study date
+    and time).
+
+    :param file_format: the format string e.g. %p_%i_%t_%s
+    :param dataset: a dataset of the series
+    :param image_folder: the folder the dicoms were read from
+    :return: a file name without an extension
+    """
+    study_date_time = str(dataset.get("StudyDate", "")) + (
+        f"{round(float(dataset.StudyTime)):06d}" if dataset.get("StudyTime", "") else ""
+    )
+    replacements = {
+        "d": dataset.get("SeriesDescription", ""),
+        "f": Path(image_folder).name,
+        "i": dataset.get("PatientID", ""),
+        "m": dataset.get("Manufacturer", ""),
+        "n": dataset.get("PatientName", ""),
+        "p": dataset.get("ProtocolName", ""),
+        "s": dataset.get("SeriesNumber", ""),
+        "t": study_date_time,
+    }
+    file_name = re.sub(
+        r"%([dfimnpst])",
+        lambda match: str(replacements[match[1]] or ""),
+        file_format,
+    )
+    # dcm2niix replaces characters that don't belong in file names with underscores
+    return re.sub(r"[^A-Za-z0-9_.\-]", "_", file_name)
+
+
+def dicom2nii(
+    image_folder,
+    output_folder,
+    file_format: str = "%p_%i_%t_%s",
+    compress: bool = True,
+    n_jobs: int = None,
+) -> list:
+    """
+    Converts every PET series in a folder to a nifti and a sidecar json.
+
+    :param image_folder: folder of dicoms
+    :param output_folder: folder to write the niftis and sidecars to
+    :param file_format: dcm2niix style format of the output file names, see format_file_name
+    :param compress: write .nii.gz files instead of .nii
+    :param n_jobs: the number of threads used to read the dicoms
+    :return: a list of the paths of the written files
+    """
+    output_folder = Path(output_folder)
+    output_folder.mkdir(parents=True, exist_ok=True)
+    extension = ".nii.gz" if compress else ".nii"
+
+    created = []
+    for series_uid, datasets in read_pet_series(image_folder, n_jobs=n_jobs).items():
+        frames = sort_pet_frames(datasets)
+        affine = dicom_affine(frames[0])
+        sidecar = pet_sidecar(frames)
+        image = nibabel.Nifti1Image(pet_volume(frames), affine)
+        image.header.set_xyzt_units("mm", "sec")
+        if len(frames) > 1:
+            image.header.set_zooms(
+                image.header.get_zooms()[:3] + (sidecar.get("FrameDuration", [1])[0],)
+            )
+        image.set_qform(affine, code=1)
+        image.set_sform(affine, code=1)
+
+        file_name = format_file_name(file_format, frames[0][0], image_folder)
+        # like dcm2niix add a letter to the name when it's already taken
+        suffix = ""
+        while (output_folder / f"{file_name}{suffix}.json").exists():
+            suffix = chr(ord(suffix or "`") + 1)
+        nifti_path = output_folder / f"{file_name}{suffix}{extension}"
+        json_path = output_folder / f"{file_name}{suffix}.json"
+
+        nibabel.save(image, nifti_path)
+        with open(json_path, "w") as outfile:
+            json.dump(sidecar, outfile, indent=4)
+        created.extend([nifti_path, json_path])
+
+    return created
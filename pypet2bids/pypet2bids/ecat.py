@@ -13,10 +13,12 @@ import nibabel
 import os
 import json
 import pathlib
+import tempfile
 import pandas as pd
 
 try:
     import helper_functions
+    import archives
     import sidecar
     import read_ecat
     import ecat2nii
@@ -24,10 +26,13 @@ try:
     from update_json_pet_file import (
         get_metadata_from_spreadsheet,
         check_meta_radio_inputs,
+        SidecarBuilder,
+        write_sidecar,
     )
     from telemetry import telemetry_enabled, send_telemetry
 except ModuleNotFoundError:
     import pypet2bids.helper_functions as helper_functions
+    import pypet2bids.archives as archives
     import pypet2bids.sidecar as sidecar
     import pypet2bids.read_ecat as read_ecat
     import pypet2bids.ecat2nii as ecat2nii
@@ -35,6 +40,8 @@ except ModuleNotFoundError:
     from pypet2bids.update_json_pet_file import (
         get_metadata_from_spreadsheet,
         check_meta_radio_inputs,
+        SidecarBuilder,
+        write_sidecar,
     )
     from pypet2bids.telemetry import telemetry_enabled, send_telemetry
 
@@ -73,14 +80,17 @@ class Ecat:
         metadata_path=None,
         kwargs={},
         ezbids=False,
+        archive_member=None,
     ):
         """
         Initialization of this class requires only a path to an ecat file.
 
-        :param ecat_file: path to a valid ecat file
+        :param ecat_file: path to a valid ecat file, or a zip or tar archive containing one
         :param nifti_file: when using this class for conversion from ecat to nifti this path, if supplied, will be used
             to output the newly generated nifti
         :param decompress: attempt to decompress the ecat file, should probably be set to false
+        :param archive_member: name of the ecat within ecat_file when ecat_file is an archive that contains more than
+            one ecat
         """
         self.ecat_header = {}  # ecat header information is stored here
         self.subheaders = []  # subheader information is placed here
@@ -99,7 +109,11 @@ class Ecat:
         self.sidecar_template_short = (
             sidecar.sidecar_template_short
         )  # bids approved sidecar with only required bids fields
+        # assembles the sidecar from the template and other sources of metadata
+        self.sidecar_builder = None
         self.sidecar_path = None
+        # paths of the files written by the last conversion
+        self.created_files = []
         self.directory_table = None
         self.spreadsheet_metadata = {
             "nifti_json": {},
@@ -126,6 +140,16 @@ class Ecat:
                         f"Unable to load default metadata json file at {default_json_path}, skipping."
                     )
 
+        # an ecat in an archive is streamed into a temporary directory that lives as long as this object, anything
+        # written next to the ecat by default is written next to the archive instead
+        self.archive_tempdir = None
+        source_folder = pathlib.Path(ecat_file).parent
+        if archives.is_archive(ecat_file):
+            self.archive_tempdir = tempfile.TemporaryDirectory()
+            ecat_file = archives.extract_ecat(
+                ecat_file, self.archive_tempdir.name, member=archive_member
+            )
+
         if os.path.isfile(ecat_file):
             self.ecat_file = str(ecat_file)
         else:
@@ -171,7 +195,9 @@ class Ecat:
 
         # swap file extensions and save output nifti with same name as original ecat
         if not nifti_file:
-            self.nifti_file = os.path.splitext(self.ecat_file)[0] + ".nii"
+            self.nifti_file = str(
+                source_folder / (pathlib.Path(self.ecat_file).stem + ".nii")
+            )
         else:
             self.nifti_file = nifti_file
 
@@ -189,14 +215,14 @@ class Ecat:
             ):
                 self.metadata_path = metadata_path
         elif metadata_path == "":
-            self.metadata_path = pathlib.Path(self.ecat_file).parent
+            self.metadata_path = source_folder
         else:
             self.metadata_path = None
 
         if self.metadata_path:
             load_spreadsheet_data = get_metadata_from_spreadsheet(
                 metadata_path=self.metadata_path,
-                image_folder=pathlib.Path(self.ecat_file).parent,
+                image_folder=source_folder,
                 image_header_dict={},
             )
 
@@ -298,70 +324,71 @@ class Ecat:
 
     def populate_sidecar(self, **kwargs):
         """
-        Creates a side-car dictionary with any bids relevant information extracted from the ecat.
+        Creates a side-car dictionary with any bids relevant information extracted from the ecat. Values are layered
+        with a SidecarBuilder so that values from a spreadsheet override those from the ecat header and values passed
+        via kwargs override both.
 
         :param kwargs: Populates sidecar file with relevant PET information, additional information that is not in the
             ECAT file can be supplied as a dictionary argument via kwargs.
         :return: None
         """
+        self.sidecar_builder = SidecarBuilder(self.sidecar_template)
+        header_values = {}
 
         # if it's an ecat it's Siemens
-        self.sidecar_template["Manufacturer"] = "Siemens"
+        header_values["Manufacturer"] = "Siemens"
         # Siemens model best guess
-        self.sidecar_template["ManufacturersModelName"] = self.ecat_header.get(
+        header_values["ManufacturersModelName"] = self.ecat_header.get(
             "SERIAL_NUMBER", None
         )
-        self.sidecar_template["TracerRadionuclide"] = self.ecat_header.get(
-            "ISOTOPE_NAME", None
-        )
-        self.sidecar_template["PharmaceuticalName"] = self.ecat_header.get(
+        header_values["TracerRadionuclide"] = self.ecat_header.get("ISOTOPE_NAME", None)
+        header_values["PharmaceuticalName"] = self.ecat_header.get(
             "RADIOPHARMACEUTICAL", None
         )
 
         # collect frame time start and populate various subheader fields
-        for subheader in self.subheaders:
-            self.sidecar_template["DecayCorrectionFactor"].append(
-                subheader.get("DECAY_CORR_FCTR", None)
-            )
-            self.sidecar_template["FrameTimesStart"].append(
-                subheader.get("FRAME_START_TIME", None)
-            )
-            self.sidecar_template["FrameDuration"].append(
-                subheader.get("FRAME_DURATION", None)
-            )
-            self.sidecar_template["ScaleFactor"].append(
-                subheader.get("SCALE_FACTOR", None)
-            )
-
-            # note some of these values won't be in the subheaders for the standard matrix image
-            # need to make sure to clean up arrays and fields filled w/ none during pruning
-            if subheader.get("SCATTER_FRACTION", None):
-                self.sidecar_template["ScatterFraction"].append(
-                    subheader.get("SCATTER_FRACTION")
-                )
-            if subheader.get("PROMPT_RATE", None):
-                self.sidecar_template["PromptRate"].append(subheader.get("PROMPT_RATE"))
-            if subheader.get("RANDOM_RATE", None):
-                self.sidecar_template["RandomRate"].append(subheader.get("RANDOM_RATE"))
-            if subheader.get("SINGLES_RATE", None):
-                self.sidecar_template["SinglesRate"].append(
-                    subheader.get("SINGLES_RATE")
-                )
+        subheader_fields = {
+            "DecayCorrectionFactor": "DECAY_CORR_FCTR",
+            "FrameTimesStart": "FRAME_START_TIME",
+            "FrameDuration": "FRAME_DURATION",
+            "ScaleFactor": "SCALE_FACTOR",
+        }
+        for field, subheader_field in subheader_fields.items():
+            header_values[field] = [
+                subheader.get(subheader_field, None) for subheader in self.subheaders
+            ]
+
+        # note some of these values won't be in the subheaders for the standard matrix image
+        # need to make sure to clean up arrays and fields filled w/ none during pruning
+        optional_subheader_fields = {
+            "ScatterFraction": "SCATTER_FRACTION",
+            "PromptRate": "PROMPT_RATE",
+            "RandomRate": "RANDOM_RATE",
+            "SinglesRate": "SINGLES_RATE",
+        }
+        for field, subheader_field in optional_subheader_fields.items():
+            values = [
+                subheader.get(subheader_field)
+                for subheader in self.subheaders
+                if subheader.get(subheader_field, None)
+            ]
+            if values:
+                header_values[field] = values
 
         # collect possible reconstruction method from subheader
         recon_method = helper_functions.get_recon_method(
             self.subheaders[0].get("ANNOTATION")
         )
         if recon_method:
-            self.sidecar_template.update(**recon_method)
+            header_values.update(**recon_method)
 
         # collect and convert start times for acquisition/time zero?
         scan_start_time = self.ecat_header.get("SCAN_START_TIME", None)
 
         if scan_start_time:
             scan_start_time = parse_this_date(scan_start_time)
-            self.sidecar_template["AcquisitionTime"] = scan_start_time
-            self.sidecar_template["ScanStart"] = scan_start_time
+            header_values["AcquisitionTime"] = scan_start_time
+            header_values["ScanStart"] = scan_start_time
 
         # collect dose start time
         dose_start_time = self.ecat_header.get("DOSE_START_TIME", None)
@@ -373,93 +400,101 @@ class Ecat:
             ):
                 dose_start_time = parse_this_date(dose_start_time)
                 parsed_dose_time = parse_this_date(dose_start_time)
-                self.sidecar_template["PharmaceuticalDoseTime"] = parsed_dose_time
-                self.sidecar_template["InjectionStart"] = parsed_dose_time
+                header_values["PharmaceuticalDoseTime"] = parsed_dose_time
+                header_values["InjectionStart"] = parsed_dose_time
             else:
-                self.sidecar_template["PharmaceuticalDoseTime"] = int(dose_start_time)
-                self.sidecar_template["InjectionStart"] = int(dose_start_time)
+                header_values["PharmaceuticalDoseTime"] = int(dose_start_time)
+                header_values["InjectionStart"] = int(dose_start_time)
 
         # if decay correction exists mark decay correction boolean as true
         if len(self.decay_factors) > 0:
-            self.sidecar_template["ImageDecayCorrected"] = "true"
+            header_values["ImageDecayCorrected"] = "true"
 
         # calculate scaling factor
         sca = self.data.max() / 32767
 
-        self.sidecar_template["DoseCalibrationFactor"] = sca * self.ecat_header.get(
+        header_values["DoseCalibrationFactor"] = sca * self.ecat_header.get(
             "ECAT_CALIBRATION_FACTOR"
         )
-        self.sidecar_template["Filename"] = os.path.basename(self.nifti_file)
-        self.sidecar_template["ImageSize"] = [
+        header_values["Filename"] = os.path.basename(self.nifti_file)
+        header_values["ImageSize"] = [
             self.subheaders[0]["X_DIMENSION"],
             self.subheaders[0]["Y_DIMENSION"],
             self.subheaders[0]["Z_DIMENSION"],
             self.ecat_header["NUM_FRAMES"],
         ]
 
-        self.sidecar_template["PixelDimensions"] = [
+        header_values["PixelDimensions"] = [
             self.subheaders[0]["X_PIXEL_SIZE"] * 10,
             self.subheaders[0]["Y_PIXEL_SIZE"] * 10,
             self.subheaders[0]["Z_PIXEL_SIZE"] * 10,
         ]
+        self.sidecar_builder.update("header", header_values)
 
         # add tag for conversion software
-        self.sidecar_template["ConversionSoftware"] = "pypet2bids"
-        self.sidecar_template["ConversionSoftwareVersion"] = (
-            helper_functions.get_version()
+        self.sidecar_builder.update(
+            "derived",
+            {
+                "ConversionSoftware": "pypet2bids",
+                "ConversionSoftwareVersion": helper_functions.get_version(),
+            },
         )
 
         # update sidecar values from spreadsheet
-        if self.spreadsheet_metadata.get("nifti_json", None):
-            self.sidecar_template.update(self.spreadsheet_metadata["nifti_json"])
+        self.sidecar_builder.update(
+            "spreadsheet", self.spreadsheet_metadata.get("nifti_json", None)
+        )
 
         # include any additional values
-        if kwargs:
-            self.sidecar_template.update(**kwargs)
+        self.sidecar_builder.update("kwargs", kwargs)
 
-        if not self.sidecar_template.get("TimeZero", None) and not kwargs.get(
-            "TimeZero", None
-        ):
-            if not self.sidecar_template.get(
-                "AcquisitionTime", None
-            ) and not kwargs.get("TimeZero", None):
+        if not self.sidecar_builder.get("TimeZero", None):
+            if not self.sidecar_builder.get("AcquisitionTime", None):
                 logger.warn(
                     f"Unable to determine TimeZero for {self.ecat_file}, you need will need to provide this"
                     f" for a valid BIDS sidecar."
                 )
             else:
-                self.sidecar_template["TimeZero"] = self.sidecar_template[
-                    "AcquisitionTime"
-                ]
+                self.sidecar_builder.update(
+                    "derived",
+                    {"TimeZero": self.sidecar_builder.get("AcquisitionTime")},
+                )
 
+        # lastly infer radio data if we have it
+        self.sidecar_builder.apply_radio_inputs()
+
+        self.sidecar_builder.add_normalizer(self._normalize_sidecar)
+        self.sidecar_template = self.sidecar_builder.build()
+
+    @staticmethod
+    def _normalize_sidecar(sidecar: dict) -> dict:
+        """
+        Final adjustments made to the sidecar after all sources of values have been merged.
+
+        :param sidecar: the merged sidecar
+        :return: values to update the sidecar with
+        """
+        normalized = {}
         # set scan start and pharmaceutical dose time relative to time zero.
         times_make_relative = ["ScanStart", "PharmaceuticalDoseTime", "InjectionStart"]
         time_zero_datetime = datetime.datetime.strptime(
-            self.sidecar_template.get("TimeZero"), "%H:%M:%S"
+            sidecar.get("TimeZero"), "%H:%M:%S"
         )
         for t in times_make_relative:
-            t_value = self.sidecar_template.get(t)
+            t_value = sidecar.get(t)
             # sometimes we start with 0 or time in seconds, we first check for this
             try:
                 int(t_value)
-                self.sidecar_template[t] = t_value
             except ValueError:
                 t_datetime = datetime.datetime.strptime(t_value, "%H:%M:%S")
                 time_diff = t_datetime - time_zero_datetime
-                self.sidecar_template[t] = time_diff.total_seconds()
-
-        # clear any nulls from json sidecar and replace with none's
-        self.sidecar_template = helper_functions.replace_nones(self.sidecar_template)
-
-        # lastly infer radio data if we have it
-        meta_radio_inputs = check_meta_radio_inputs(self.sidecar_template)
-        self.sidecar_template.update(**meta_radio_inputs)
+                normalized[t] = time_diff.total_seconds()
 
         # set ModeOfAdministration to lower case
-        if self.sidecar_template.get("ModeOfAdministration", ""):
-            self.sidecar_template["ModeOfAdministration"] = self.sidecar_template[
-                "ModeOfAdministration"
-            ].lower()
+        if sidecar.get("ModeOfAdministration", ""):
+            normalized["ModeOfAdministration"] = sidecar["ModeOfAdministration"].lower()
+
+        return normalized
 
     def prune_sidecar(self):
         """
@@ -467,29 +502,12 @@ class Ecat:
 
         :return: a list of removed fields from the sidecar file
         """
-        short_fields = list(self.sidecar_template_short.keys())
-        full_fields = list(self.sidecar_template)
-        exclude_list = []
-        for field, value in self.sidecar_template.items():
-            if value is not None and value != "":
-                # check to make sure value isn't a list of null types
-                # e.g. if value = [None, None, None] we don't want to include it.
-                if type(value) is list:
-                    none_count = value.count(None)
-                    if len(value) == none_count:
-                        pass
-                    else:
-                        exclude_list.append(field)
-                else:
-                    exclude_list.append(field)
-
-        exclude_list = exclude_list + short_fields
-
-        destroy_list = set(full_fields) - set(exclude_list)
-
-        destroyed = []
-        for to_be_destroyed in destroy_list:
-            destroyed.append(self.sidecar_template.pop(to_be_destroyed))
+        if self.sidecar_builder is None:
+            self.sidecar_builder = SidecarBuilder(self.sidecar_template)
+        destroyed = self.sidecar_builder.prune(
+            keep=list(self.sidecar_template_short.keys())
+        )
+        self.sidecar_template = self.sidecar_builder.build()
 
         return destroyed
 
@@ -543,12 +561,9 @@ class Ecat:
                     temp_output_path = re.sub(suffix, "", temp_output_path)
                 output_path = pathlib.Path(temp_output_path).with_suffix(".json")
 
-            with open(output_path, "w") as outfile:
-                json.dump(
-                    helper_functions.replace_nones(self.sidecar_template),
-                    outfile,
-                    indent=4,
-                )
+            write_sidecar(
+                output_path, helper_functions.replace_nones(self.sidecar_template)
+            )
         else:
             print(
                 json.dumps(
@@ -608,6 +623,8 @@ class Ecat:
                     f"blood_tsv dictionary is incorrect type {type(blood_tsv_data)}, must be type: "
                     f"pandas.DataFrame"
                 )
+            blood_tsv_path = pathlib.Path(destination_folder, blood_file_name + ".tsv")
+            self.created_files.append(str(blood_tsv_path.absolute()))
 
         # if there's blood data in the tsv then write out the sidecar file too
         if (
@@ -631,6 +648,10 @@ class Ecat:
                 os.path.join(destination_folder, blood_file_name + ".json"), "w"
             ) as outfile:
                 json.dump(blood_json_data, outfile, indent=4)
+            blood_json_path = pathlib.Path(
+                destination_folder, blood_file_name + ".json"
+            )
+            self.created_files.append(str(blood_json_path.absolute()))
 
     def update_pet_json(self, pet_json_path):
         """given a json file (or a path ending in .json) update or create a PET json file with information collected
@@ -681,11 +702,13 @@ class Ecat:
         :return: None
         """
         self.output_path = pathlib.Path(self.make_nifti())
+        self.created_files = [str(self.output_path.absolute())]
         self.sidecar_path = self.output_path.parent / self.output_path.stem
         self.sidecar_path = self.sidecar_path.with_suffix(".json")
         self.populate_sidecar(**self.kwargs)
         self.prune_sidecar()
         self.show_sidecar(output_path=self.sidecar_path)
+        self.created_files.append(str(self.sidecar_path.absolute()))
         self.write_out_blood_files()
 
         if telemetry_enabled:
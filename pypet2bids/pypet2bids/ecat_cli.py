@@ -16,10 +16,12 @@ from importlib.metadata import version
 try:
     import helper_functions
     import Ecat
+    from conversion_manifest import ConversionManifest
     from update_json_pet_file import check_json, check_meta_radio_inputs
 except ModuleNotFoundError:
     import pypet2bids.helper_functions as helper_functions
     from pypet2bids.ecat import Ecat
+    from pypet2bids.conversion_manifest import ConversionManifest
     from pypet2bids.update_json_pet_file import check_json, check_meta_radio_inputs
 
 epilog = textwrap.dedent(
@@ -81,7 +83,16 @@ def cli():
     )
     update_or_convert = parser.add_mutually_exclusive_group()
     parser.add_argument(
-        "ecat", nargs="?", metavar="ecat_file", help="Ecat image to collect info from."
+        "ecat",
+        nargs="?",
+        metavar="ecat_file",
+        help="Ecat image to collect info from, or a zip or tar archive containing it.",
+    )
+    parser.add_argument(
+        "--archive-member",
+        type=str,
+        default=None,
+        help="Name of the ecat to use when ecat_file is an archive containing more than one ecat.",
     )
     parser.add_argument(
         "--affine", "-a", help="Show affine matrix", action="store_true", default=False
@@ -93,6 +104,13 @@ def cli():
         action="store_true",
         help="If supplied will attempt conversion.",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        default=False,
+        help="Used with --convert, skip the conversion if this ecat was already converted with the same metadata and "
+        "arguments. Conversions are recorded in .pet2bids_manifest.json at the root of the output dataset.",
+    )
     parser.add_argument(
         "--dump",
         "-d",
@@ -311,6 +329,23 @@ def main():
             scanner_params.update(cli_args.kwargs)
             cli_args.kwargs.update(scanner_params)
 
+    incremental = cli_args.incremental and cli_args.convert
+    if incremental:
+        manifest = ConversionManifest.for_destination(cli_args.nifti or cli_args.ecat)
+        manifest_entry = manifest.describe(
+            cli_args.ecat,
+            cli_args.metadata_path,
+            {
+                "kwargs": cli_args.kwargs,
+                "nifti": cli_args.nifti,
+                "archive_member": cli_args.archive_member,
+                "ezbids": cli_args.ezbids,
+            },
+        )
+        if manifest.is_up_to_date(manifest_entry):
+            print(f"{cli_args.ecat} has already been converted, see {manifest.path}")
+            sys.exit(0)
+
     ecat = Ecat(
         ecat_file=cli_args.ecat,
         nifti_file=cli_args.nifti,
@@ -318,6 +353,7 @@ def main():
         metadata_path=cli_args.metadata_path,
         kwargs=cli_args.kwargs,
         ezbids=cli_args.ezbids,
+        archive_member=cli_args.archive_member,
     )
     if cli_args.json:
         ecat.json_out()
@@ -338,6 +374,8 @@ def main():
         ecat.show_sidecar()
     if cli_args.convert:
         ecat.convert()
+        if incremental:
+            manifest.record(manifest_entry, sorted(set(ecat.created_files)))
     if cli_args.update:
         ecat.update_pet_json(cli_args.update)
 
@@ -0,0 +1,236 @@
+"""
+Checks that a NIfTI converted from an ECAT faithfully reproduces the ECAT's image data. Both images are streamed from
+disk one frame at a time, so the check costs about two frames of memory regardless of the size of the images. Each ECAT
+frame is scaled and flipped the same way :func:`pypet2bids.ecat2nii.ecat2nii` does before it is compared with the
+matching NIfTI frame.
+
+Example:
+
+.. code-block:: bash
+
+    ecatfidelity sub-01_pet.v sub-01_pet.nii.gz --rtol 1e-4 --report fidelity.json
+
+| *Authors: Anthony Galassi*
+| *Copyright OpenNeuroPET team*
+"""
+
+import argparse
+import gzip
+import json
+import sys
+
+import nibabel
+import numpy
+
+try:
+    import helper_functions
+    from read_ecat import read_ecat, iter_ecat_frames
+except ModuleNotFoundError:
+    import pypet2bids.helper_functions as helper_functions
+    from pypet2bids.read_ecat import read_ecat, iter_ecat_frames
+
+logger = helper_functions.logger("pypet2bids")
+
+
+def iter_nifti_frames(nifti_file: str):
+    """
+    Reads a NIfTI one volume at a time straight from the file, gzipped NIfTIs are decompressed as a stream rather than
+    all at once. Scaling from scl_slope and scl_inter is applied.
+
+    :param nifti_file: path to a .nii or .nii.gz file
+    :return: a generator yielding each 3d volume as a float64 array
+    """
+    # the array proxy records where the voxel data actually starts in the file along with its scaling
+    proxy = nibabel.load(nifti_file).dataobj
+    shape = proxy.shape
+    dtype = proxy.dtype
+    slope, inter = proxy.slope, proxy.inter
+    frame_shape = shape[:3]
+    frame_size = int(numpy.prod(frame_shape))
+    number_of_frames = int(numpy.prod(shape[3:])) if len(shape) > 3 else 1
+
+    opener = gzip.open if str(nifti_file).endswith(".gz") else open
+    with opener(nifti_file, "rb") as infile:
+        infile.seek(int(proxy.offset))
+        for _ in range(number_of_frames):
+            frame = numpy.frombuffer(
+                infile.read(frame_size * dtype.itemsize), dtype=dtype, count=frame_size
+            ).reshape(frame_shape, order="F")
+            frame = frame.astype(numpy.float64)
+            if slope != 1:
+                frame = frame * slope
+            if inter != 0:
+                frame = frame + inter
+            yield frame
+
+
+def expected_nifti_frame(
+    main_header: dict, subheader: dict, pixel_data: numpy.ndarray
+) -> numpy.ndarray:
+    """
+    Applies the scaling, calibration, and orientation used by ecat2nii to a single frame of ECAT pixel data.
+
+    :param main_header: main header of the ECAT
+    :param subheader: subheader of the frame
+    :param pixel_data: unscaled pixel data of the frame as read from the ECAT
+    :return: the frame as it should appear in the NIfTI
+    """
+    expected = pixel_data.astype(numpy.float64) * subheader["SCALE_FACTOR"]
+    if main_header["CALIBRATION_UNITS"] == 1:
+        expected = expected * main_header["ECAT_CALIBRATION_FACTOR"]
+    return numpy.flip(expected, axis=(0, 1, 2))
+
+
+def compare_frame(
+    expected: numpy.ndarray, actual: numpy.ndarray, tolerance: float
+) -> dict:
+    """
+    Computes error statistics between an expected and an actual frame.
+
+    :param expected: the frame derived from the ECAT
+    :param actual: the frame read from the NIfTI
+    :param tolerance: voxels whose absolute difference exceeds this value are counted as mismatches
+    :return: a dictionary of the max absolute error, max relative error, correlation, and number of mismatched voxels
+    """
+    difference = numpy.abs(actual - expected)
+    nonzero = expected != 0
+    if nonzero.any():
+        max_relative_error = float(
+            (difference[nonzero] / numpy.abs(expected[nonzero])).max()
+        )
+    else:
+        max_relative_error = 0.0
+
+    if expected.std() > 0 and actual.std() > 0:
+        correlation = float(numpy.corrcoef(expected.ravel(), actual.ravel())[0, 1])
+    else:
+        # correlation is undefined for constant frames, report 1 if they are identical
+        correlation = float(numpy.array_equal(expected, actual))
+
+    return {
+        "max_absolute_error": float(difference.max()),
+        "max_relative_error": max_relative_error,
+        "correlation": correlation,
+        "mismatched_voxels": int((difference > tolerance).sum()),
+    }
+
+
+def check_ecat_nifti_fidelity(
+    ecat_file: str, nifti_file: str, rtol: float = 1e-4, atol: float = 0.0
+) -> dict:
+    """
+    Compares an ECAT and a NIfTI frame by frame. A voxel is a mismatch when the absolute difference between the NIfTI
+    and the scaled ECAT exceeds atol + rtol * peak, where peak is the largest absolute value in the ECAT image as
+    recorded by IMAGE_MIN and IMAGE_MAX in its subheaders. ecat2nii rescales images into 16 bits, which introduces
+    errors of up to peak / 65534, so rtol should not be set much below 1e-4.
+
+    :param ecat_file: path to the ECAT file
+    :param nifti_file: path to the NIfTI converted from the ECAT
+    :param rtol: tolerance relative to the peak of the image
+    :param atol: absolute tolerance
+    :return: a report dictionary with per frame statistics and an overall 'passed' entry
+    """
+    main_header, subheaders, _ = read_ecat(ecat_file, collect_pixel_data=False)
+    calibration = (
+        main_header["ECAT_CALIBRATION_FACTOR"]
+        if main_header["CALIBRATION_UNITS"] == 1
+        else 1
+    )
+    peak = max(
+        max(abs(s["IMAGE_MIN"]), abs(s["IMAGE_MAX"])) * abs(s["SCALE_FACTOR"])
+        for s in subheaders
+    ) * abs(calibration)
+
+    report = {
+        "ecat_file": str(ecat_file),
+        "nifti_file": str(nifti_file),
+        "rtol": rtol,
+        "atol": atol,
+        "frames": [],
+        "passed": True,
+    }
+
+    nifti_shape = nibabel.load(nifti_file).header.get_data_shape()
+    nifti_frames = int(numpy.prod(nifti_shape[3:])) if len(nifti_shape) > 3 else 1
+    if nifti_frames != len(subheaders):
+        report["passed"] = False
+        report["error"] = (
+            f"{ecat_file} has {len(subheaders)} frames, {nifti_file} has {nifti_frames}"
+        )
+        return report
+
+    for index, ((ecat_main_header, subheader, pixel_data), actual) in enumerate(
+        zip(iter_ecat_frames(ecat_file), iter_nifti_frames(nifti_file))
+    ):
+        expected = expected_nifti_frame(ecat_main_header, subheader, pixel_data)
+        if expected.shape != actual.shape:
+            report["passed"] = False
+            report["error"] = (
+                f"frame {index + 1} of {ecat_file} has shape {expected.shape}, "
+                f"{nifti_file} has {actual.shape}"
+            )
+            return report
+        # guard against IMAGE_MAX being unreliable in the subheader
+        tolerance = atol + rtol * max(peak, float(numpy.abs(expected).max()))
+        frame_report = compare_frame(expected, actual, tolerance)
+        frame_report["frame"] = index + 1
+        report["frames"].append(frame_report)
+        if frame_report["mismatched_voxels"]:
+            report["passed"] = False
+
+    return report
+
+
+def cli():
+    parser = argparse.ArgumentParser(
+        description="Compare a NIfTI with the ECAT it was converted from frame by frame, exits with a non-zero "
+        "status if any voxel differs by more than the tolerance."
+    )
+    parser.add_argument("ecat_file", type=str, help="path to the ECAT file")
+    parser.add_argument(
+        "nifti_file", type=str, help="path to the NIfTI converted from the ECAT file"
+    )
+    parser.add_argument(
+        "--rtol",
+        type=float,
+        default=1e-4,
+        help="tolerance relative to the peak value of the image, default is 1e-4",
+    )
+    parser.add_argument(
+        "--atol", type=float, default=0.0, help="absolute tolerance, default is 0"
+    )
+    parser.add_argument(
+        "--report",
+        type=str,
+        default=None,
+        help="optional path to write the full report to as json",
+    )
+    args = parser.parse_args()
+
+    report = check_ecat_nifti_fidelity(
+        args.ecat_file, args.nifti_file, rtol=args.rtol, atol=args.atol
+    )
+
+    if args.report:
+        with open(args.report, "w") as outfile:
+            json.dump(report, outfile, indent=4)
+
+    if report.get("error"):
+        logger.error(report["error"])
+    for frame in report["frames"]:
+        print(
+            f"frame {frame['frame']}: max abs error {frame['max_absolute_error']:.6g}, "
+            f"max rel error {frame['max_relative_error']:.6g}, "
+            f"correlation {frame['correlation']:.6f}, "
+            f"mismatched voxels {frame['mismatched_voxels']}"
+        )
+
+    if report["passed"]:
+        logger.info(f"{args.nifti_file} matches {args.ecat_file}")
+    else:
+        logger.error(f"{args.nifti_file} does not match {args.ecat_file}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    cli()
@@ -1,64 +1,186 @@
+"""
+Update the main header of one or many ECAT files in place. Only the 512 byte main header block of each file is read
+and rewritten, subheaders and pixel data are never touched, which keeps header edits (e.g. de-identifying
+PATIENT_NAME and PATIENT_ID across an archive) cheap regardless of the size of the images.
+
+| *Authors: Anthony Galassi*
+| *Copyright OpenNeuroPET team*
+"""
+
+import pathlib
+from concurrent.futures import ThreadPoolExecutor
+
 try:
-    import ecat
-    import write_ecat
     import read_ecat
     import helper_functions
 except ImportError:
-    import pypet2bids.ecat as ecat
-    import pypet2bids.write_ecat as write_ecat
     import pypet2bids.read_ecat as read_ecat
     import pypet2bids.helper_functions as helper_functions
 
+logger = helper_functions.logger("pypet2bids")
+
 # collect ecat header jsons
 ecat_headers = read_ecat.ecat_header_maps.get("ecat_headers")
 
 
-def update_ecat_header(ecat_file: str, new_values: dict):
+def _coerce_value(field: dict, value):
     """
-    Update the header of an ECAT file with new values
-    :param ecat_file: path to the ECAT file
-    :param new_values: dictionary of new values to update
-    :param ecat_header: dictionary of the ECAT header
-    :return: None
+    Checks that a new value is compatible with the struct format of a header field and returns it in the form that
+    struct.pack_into expects. String fields accept any value (it's converted to str), integer fields accept only ints,
+    float fields accept ints and floats, array fields require a list of matching length.
+
+    :param field: a single entry of the output of read_ecat.compile_header_schema
+    :param value: the new value for that field
+    :return: a tuple of the values to pack
+    :raises TypeError: if the value can't be stored in the field
     """
+    fmt = field["fmt"]
+    if "s" in fmt:
+        encoded = str(value).encode("utf-8")
+        if len(encoded) > field["struct"].size:
+            raise TypeError(
+                f"{field['variable_name']} is limited to {field['struct'].size} bytes, {value} is too long"
+            )
+        return (encoded,)
 
-    # read ecat and determine version of ecat file
-    print(f"Reading ECAT file {ecat_file}")
-    infile = ecat.Ecat(ecat_file)
+    count = len(field["struct"].unpack(bytes(field["struct"].size)))
+    values = value if isinstance(value, (list, tuple)) else [value]
+    if len(values) != count:
+        raise TypeError(
+            f"{field['variable_name']} holds {count} value(s), received {len(values)}"
+        )
+
+    is_float = fmt[-1] in "fd"
+    for v in values:
+        if isinstance(v, bool) or not isinstance(v, (int, float)):
+            raise TypeError(
+                f"{field['variable_name']} is numeric, {v} has type {type(v)}"
+            )
+        if not is_float and not isinstance(v, int):
+            raise TypeError(
+                f"{field['variable_name']} is an integer, {v} has type {type(v)}"
+            )
+    return tuple(values)
 
-    # collect the appropriate header schema
-    sw_version = str(infile.ecat_header.get("SW_VERSION", 73))
 
-    infile_header_map = ecat_headers[sw_version]["mainheader"]
+def update_ecat_header(ecat_file: str, new_values: dict, dry_run: bool = False):
+    """
+    Update the main header of an ECAT file in place with new values. Only the main header block is read and, if any
+    value differs from what is already in the file, written back, the remainder of the file is left untouched.
 
-    # iterate through new values and update the header
-    for name, value in new_values.items():
-        if infile.ecat_header.get(name):
-            if type(infile.ecat_header[name]) == type(value):
-                infile.ecat_header[name] = value
-            else:
-                print(
-                    f"WARNING: {name} has type {type(infile.ecat_header[name])} "
-                    f"and new value {value} has type {type(value)}"
+    :param ecat_file: path to the ECAT file, must be uncompressed
+    :param new_values: dictionary of header variable names and the new values to write to them
+    :param dry_run: if True, nothing is written and only the differences are returned
+    :return: a dictionary of the fields that differ, {variable_name: (old value, new value)}
+    """
+    ecat_file = str(ecat_file)
+    if ecat_file.endswith(".gz"):
+        raise ValueError(
+            f"Unable to update {ecat_file} in place, decompress the file first."
+        )
+
+    with open(ecat_file, "r+b") as infile:
+        header_bytes = bytearray(infile.read(read_ecat.MAIN_HEADER_SIZE))
+
+        # determine version of ecat file and collect the appropriate header schema
+        sw_version, header = read_ecat.determine_ecat_version(bytes(header_bytes))
+        compiled_schema = read_ecat.compile_header_schema(
+            ecat_headers[sw_version]["mainheader"]
+        )
+        fields = {field["variable_name"]: field for field in compiled_schema}
+
+        # iterate through new values and update the header block
+        diff = {}
+        for name, value in new_values.items():
+            field = fields.get(name)
+            if field is None:
+                logger.warning(
+                    f"{name} not found in header schema for ECAT {sw_version} "
+                    f"not updating {ecat_file} with value {value}"
                 )
-        else:
-            print(
-                f"WARNING: {name} not found in header schema for ECAT {ecat_headers.ecat_header.get('SW_VERSION', 73)} "
-                f"not updating with value {value}"
+                continue
+            try:
+                packable = _coerce_value(field, value)
+            except TypeError as err:
+                logger.warning(f"{err}, not updating {ecat_file}")
+                continue
+
+            old_value = header[name]
+            field["struct"].pack_into(header_bytes, field["byte"], *packable)
+            new_value = read_ecat.filter_bytes(
+                field["struct"].unpack_from(header_bytes, field["byte"]), field["fmt"]
             )
+            if new_value != old_value:
+                diff[name] = (old_value, new_value)
+
+        # write out the header block only if something has changed
+        if diff and not dry_run:
+            infile.seek(0)
+            infile.write(header_bytes)
+
+    return diff
 
-    # update the header of the ecat file in question
-    with open(infile.ecat_file, "r+b") as outfile:
-        write_ecat.write_header(
-            ecat_file=outfile, schema=infile_header_map, values=infile.ecat_header
-        )
+
+def collect_ecat_files(paths: list) -> list:
+    """
+    Expands a list of files and directories into a list of ECAT files, directories are searched recursively for files
+    ending in .v
+
+    :param paths: paths to ECAT files or folders containing them
+    :return: a sorted list of paths to ECAT files
+    """
+    ecat_files = set()
+    for path in paths:
+        path = pathlib.Path(path)
+        if path.is_dir():
+            ecat_files.update(str(p) for p in path.rglob("*.v") if p.is_file())
+        else:
+            ecat_files.add(str(path))
+    return sorted(ecat_files)
+
+
+def update_ecat_headers(
+    ecat_files: list,
+    new_values: dict,
+    n_jobs: int = 4,
+    dry_run: bool = False,
+):
+    """
+    Apply the same set of new main header values to many ECAT files using a pool of threads, since each update is a
+    single small read and write the work is bound by I/O rather than by Python.
+
+    :param ecat_files: list of paths to ECAT files
+    :param new_values: dictionary of header variable names and the new values to write to them
+    :param n_jobs: number of files to update concurrently
+    :param dry_run: if True, nothing is written and only the differences are returned
+    :return: a dictionary keyed by file path containing either the diff returned by update_ecat_header or the exception
+        raised while updating that file
+    """
+
+    def _update(ecat_file):
+        try:
+            return update_ecat_header(ecat_file, new_values, dry_run=dry_run)
+        except Exception as err:
+            logger.error(f"Unable to update {ecat_file}: {err}")
+            return err
+
+    with ThreadPoolExecutor(max_workers=max(1, n_jobs)) as executor:
+        results = list(executor.map(_update, ecat_files))
+
+    return dict(zip(ecat_files, results))
 
 
 def cli():
     import argparse
 
-    parser = argparse.ArgumentParser(description="Update the header of an ECAT file.")
-    parser.add_argument("ecat_file", type=str, help="path to the ECAT file")
+    parser = argparse.ArgumentParser(
+        description="Update the main header of one or more ECAT files in place."
+    )
+    parser.add_argument(
+        "ecat_file",
+        type=str,
+        help="path to the ECAT file or to a folder of ECAT files (searched recursively for *.v)",
+    )
     parser.add_argument(
         "new_values",
         nargs="*",
@@ -69,8 +191,47 @@ def cli():
         'or STUDY_DESCRIPTION="very important work"'
         "If the value is a string, it must be in quotes.",
     )
+    parser.add_argument(
+        "--file-list",
+        type=str,
+        default=None,
+        help="text file containing additional ECAT file paths to update, one per line",
+    )
+    parser.add_argument(
+        "--njobs",
+        "-j",
+        type=int,
+        default=4,
+        help="number of files to update concurrently, default is 4",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        default=False,
+        help="report the changes that would be made without writing to any file",
+    )
     args = parser.parse_args()
-    update_ecat_header(ecat_file=args.ecat_file, new_values=args.new_values)
+
+    paths = [args.ecat_file]
+    if args.file_list:
+        with open(args.file_list, "r") as infile:
+            paths.extend(line.strip() for line in infile if line.strip())
+
+    ecat_files = collect_ecat_files(paths)
+    results = update_ecat_headers(
+        ecat_files, args.new_values, n_jobs=args.njobs, dry_run=args.dry_run
+    )
+
+    failed = False
+    for ecat_file, diff in results.items():
+        if isinstance(diff, Exception):
+            failed = True
+            continue
+        for name, (old, new) in diff.items():
+            print(f"{ecat_file}: {name} {old!r} -> {new!r}")
+
+    if failed:
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
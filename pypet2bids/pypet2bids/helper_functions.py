@@ -16,6 +16,7 @@ Some of the modules in this library that depend on this module are:
 """
 
 import os
+import copy
 import gzip
 import re
 import shutil
@@ -51,6 +52,11 @@ try:
 except ImportError:
     import pypet2bids.pet_metadata as metadata
 
+try:
+    import spreadsheet_cache
+except ImportError:
+    import pypet2bids.spreadsheet_cache as spreadsheet_cache
+
 # load bids schema
 schema = metadata.schema
 pet_metadata = metadata.PET_metadata
@@ -144,25 +150,50 @@ def single_spreadsheet_reader(
     else:
         raise FileNotFoundError(f"{path_to_spreadsheet} does not exist.")
 
-    spreadsheet_dataframe = open_meta_data(path_to_spreadsheet)
-
     log = logging.getLogger("pypet2bids")
 
-    # collect mandatory fields
-    for field_level in metadata_fields.keys():
-        for field in metadata_fields[field_level]:
-            series = spreadsheet_dataframe.get(field, Series(dtype=numpy.float64))
-            if not series.empty:
-                spreadsheet_metadata[field] = flatten_series(series)
-            elif (
-                series.empty
-                and field_level == "mandatory"
-                and not dicom_metadata.get(field, None)
-                and field not in kwargs
-            ):
-                log.warning(
-                    f"{field} not found in metadata spreadsheet: {path_to_spreadsheet}, {field} is required by BIDS"
-                )
+    # the metadata collected from a spreadsheet is cached when the spreadsheet cache is enabled
+    cached_metadata = None
+    cache = spreadsheet_cache.spreadsheet_cache()
+    if cache:
+        cache_key = cache.key(
+            path_to_spreadsheet,
+            "metadata",
+            fields=metadata_fields,
+            pandas=pandas.__version__,
+        )
+        cached_metadata = cache.get(cache_key)
+
+    if cached_metadata is not None:
+        spreadsheet_metadata = cached_metadata
+    else:
+        # only the columns of the fields being collected are parsed
+        spreadsheet_dataframe = open_meta_data(
+            path_to_spreadsheet,
+            usecols=[
+                field
+                for field_level in metadata_fields.values()
+                for field in field_level
+            ],
+        )
+        for field_level in metadata_fields.keys():
+            for field in metadata_fields[field_level]:
+                series = spreadsheet_dataframe.get(field, Series(dtype=numpy.float64))
+                if not series.empty:
+                    spreadsheet_metadata[field] = flatten_series(series)
+        if cache:
+            cache.put(cache_key, spreadsheet_metadata)
+
+    # warn about any mandatory fields that aren't supplied by the spreadsheet, dicom, or kwargs
+    for field in metadata_fields.get("mandatory", []):
+        if (
+            field not in spreadsheet_metadata
+            and not dicom_metadata.get(field, None)
+            and field not in kwargs
+        ):
+            log.warning(
+                f"{field} not found in metadata spreadsheet: {path_to_spreadsheet}, {field} is required by BIDS"
+            )
 
     # lastly apply any kwargs to the metadata
     spreadsheet_metadata.update(**kwargs)
@@ -373,7 +404,7 @@ def very_tolerant_literal_eval(value):
 
 
 def open_meta_data(
-    metadata_path: Union[str, pathlib.Path], separator=None
+    metadata_path: Union[str, pathlib.Path], separator=None, usecols=None
 ) -> pandas.DataFrame:
     """
     Opens a text metadata file with the pandas method most appropriate for doing so based on the metadata
@@ -382,6 +413,9 @@ def open_meta_data(
     :type metadata_path: Path or str
     :param separator: Optional separator argument, used to try and parse tricky spreadsheets. e.g. ',' '\t', ' '
     :type separator: str
+    :param usecols: Optional collection of column names, only these columns are parsed (names not present in the
+        spreadsheet are ignored), wide spreadsheets with many unrelated columns load much faster with this set
+    :type usecols: list, set, or other collection of strings
     :return: a pandas dataframe representation of the spreadsheet/metadatafile
     """
     log = logger("pypet2bids")
@@ -394,17 +428,57 @@ def open_meta_data(
     else:
         raise FileExistsError(metadata_path)
 
+    if usecols is not None:
+        usecols = set(usecols)
+
+    # spreadsheets already parsed by this process are returned without parsing them again
+    reader_options = {
+        "separator": separator,
+        "usecols": sorted(usecols) if usecols is not None else None,
+    }
+    memory_key = spreadsheet_cache.parsed_spreadsheets.key(
+        metadata_path, "dataframe", **reader_options
+    )
+    parsed_dataframe = spreadsheet_cache.parsed_spreadsheets.get(memory_key)
+    if parsed_dataframe is not None:
+        return parsed_dataframe
+
+    # return the parsed spreadsheet from the spreadsheet cache if it's enabled and the spreadsheet hasn't changed
+    cache = spreadsheet_cache.spreadsheet_cache()
+    if cache:
+        cache_key = cache.key(
+            metadata_path, "dataframe", pandas=pandas.__version__, **reader_options
+        )
+        cached_dataframe = cache.get(cache_key)
+        if cached_dataframe is not None:
+            spreadsheet_cache.parsed_spreadsheets.put(memory_key, cached_dataframe)
+            return cached_dataframe
+
     # collect suffix from metadata and use the appropriate pandas method to read the data
     extension = metadata_path.suffix
 
-    methods = {"excel": read_excel, "csv": read_csv, "tsv": read_csv, "txt": read_csv}
+    methods = {
+        "excel": read_excel,
+        "csv": read_csv,
+        "tsv": read_csv,
+        "txt": read_csv,
+        "bld": read_csv,
+    }
 
-    if "xls" in extension or "bld" in extension:
+    # pmod .bld files may be excel workbooks or tab separated text, workbooks start with a zip or OLE signature
+    workbook_signatures = (b"PK\x03\x04", b"\xd0\xcf\x11\xe0")
+    if "bld" in extension:
+        with open(metadata_path, "rb") as infile:
+            is_workbook = infile.read(4).startswith(workbook_signatures)
+    else:
+        is_workbook = False
+
+    if "xls" in extension or is_workbook:
         proper_method = "excel"
     else:
         proper_method = extension.replace(".", "")
         with open(metadata_path, "r") as infile:
-            first_line = infile.read()
+            first_line = infile.readline()
             # check for separators in line
             separators = ["\t", ","]
             for sep in separators:
@@ -420,11 +494,28 @@ def open_meta_data(
                 separator = "\t"
             else:
                 separator = ","
-            metadata_dataframe = use_me_to_read(metadata_path, sep=separator)
+            columns = None
+            if usecols is not None:
+                # only the columns named in the header line that were asked for are parsed
+                header = [
+                    column.strip().strip('"')
+                    for column in first_line.rstrip("\r\n").split(separator)
+                ]
+                columns = [column for column in header if column in usecols]
+            metadata_dataframe = use_me_to_read(
+                metadata_path, sep=separator, usecols=columns
+            )
         else:
-            metadata_dataframe = use_me_to_read(metadata_path, sheet_name=None)
+            # pandas opens workbooks with openpyxl in read only mode, every sheet is parsed in a single pass
+            metadata_dataframe = use_me_to_read(
+                metadata_path,
+                sheet_name=None,
+                usecols=(
+                    (lambda column: column in usecols) if usecols is not None else None
+                ),
+            )
             # check to see if there are multiple sheets in this input file
-            multiple_sheets = pandas.ExcelFile(metadata_path).sheet_names
+            multiple_sheets = list(metadata_dataframe.keys())
             first_sheet = multiple_sheets.pop(0)
             if len(multiple_sheets) >= 1:
                 for index, sheet_name in enumerate(multiple_sheets):
@@ -440,12 +531,24 @@ def open_meta_data(
             metadata_dataframe = pandas.read_csv(
                 metadata_path, sep=separator, engine="python"
             )
+            if usecols is not None:
+                metadata_dataframe = metadata_dataframe[
+                    [
+                        column
+                        for column in metadata_dataframe.columns
+                        if column in usecols
+                    ]
+                ]
         except IOError:
             log.error(
                 f"Tried falling back to reading {metadata_path} with pandas.read_csv, still unable to parse"
             )
             raise err(f"Problem opening {metadata_path}")
 
+    if cache:
+        cache.put(cache_key, metadata_dataframe)
+    spreadsheet_cache.parsed_spreadsheets.put(memory_key, metadata_dataframe)
+
     return metadata_dataframe
 
 
@@ -681,17 +784,65 @@ def transform_row_to_dict(
 
     transformed = {}
     for key, value in row.items():
-        try:
-            evaluated = ast.literal_eval(str(value))
-            if type(evaluated) is tuple:
-                evaluated = list(evaluated)
-        except (SyntaxError, ValueError):
-            evaluated = value
-        transformed[key] = evaluated
+        transformed[key] = evaluate_cell(value)
 
     return transformed
 
 
+def evaluate_cell(value):
+    """
+    Evaluates the contents of a single spreadsheet cell, array like cells (e.g. '0,10,20' or '[0, 10, 20]') become lists
+    and cells that can't be evaluated are returned as they are.
+    :param value: contents of a cell
+    :return: the evaluated contents
+    """
+    try:
+        evaluated = ast.literal_eval(str(value))
+        if type(evaluated) is tuple:
+            evaluated = list(evaluated)
+    except (SyntaxError, ValueError, TypeError, MemoryError, RecursionError):
+        evaluated = value
+    return evaluated
+
+
+def evaluate_cells(dataframe: pandas.DataFrame) -> pandas.DataFrame:
+    """
+    Evaluates every cell of a dataframe the same way transform_row_to_dict does, but column by column: numeric and
+    boolean columns are left as they are and each distinct value of the remaining columns is only evaluated once, so
+    large multi subject spreadsheets are parsed in a single pass.
+    :param dataframe: a dataframe read from a spreadsheet
+    :type dataframe: pandas.DataFrame
+    :return: a copy of the dataframe with evaluated cells
+    :rtype: pandas.DataFrame
+    """
+    evaluated = dataframe.copy()
+    for column in evaluated.columns:
+        if pandas.api.types.is_numeric_dtype(
+            evaluated[column]
+        ) or pandas.api.types.is_bool_dtype(evaluated[column]):
+            continue
+        values = evaluated[column].tolist()
+        lookup = {}
+        for index, value in enumerate(values):
+            if pandas.api.types.is_scalar(value) and pandas.isna(value):
+                continue
+            # values are looked up by type too as 1, 1.0, and True are equal dictionary keys
+            key = (type(value), value)
+            try:
+                if key not in lookup:
+                    lookup[key] = evaluate_cell(value)
+                evaluated_value = lookup[key]
+            except TypeError:
+                # unhashable values are evaluated every time
+                evaluated_value = evaluate_cell(value)
+            # cells never share lists with each other
+            if isinstance(evaluated_value, (list, dict, set)):
+                evaluated_value = copy.deepcopy(evaluated_value)
+            values[index] = evaluated_value
+        evaluated[column] = pandas.Series(values, index=evaluated.index, dtype=object)
+    return evaluated
+
+
 # noinspection PyPep8Naming
 def get_recon_method(ReconstructionMethodString: str) -> dict:
     """
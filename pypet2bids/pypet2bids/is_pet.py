@@ -1,32 +1,36 @@
 import os
+import gzip
 import pydicom
+import pydicom.filereader
 import argparse
 import nibabel
+import pandas
 import re
 from typing import Union
 from pathlib import Path
 import contextlib
 import sys
 import json
+import threading
 from joblib import Parallel, delayed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 
 try:
     import helper_functions
     import ecat
+    import read_ecat
     import dcm2niix4pet
     import pet_metadata
 except ModuleNotFoundError:
     import pypet2bids.helper_functions as helper_functions
     import pypet2bids.ecat as ecat
+    import pypet2bids.read_ecat as read_ecat
     import pypet2bids.dcm2niix4pet as dcm2niix4pet
     import pypet2bids.pet_metadata as pet_metadata
 
 
 def spread_sheet_check_for_pet(sourcefile: Union[str, Path], **kwargs):
-    # load data from spreadsheet
-    data = helper_functions.open_meta_data(sourcefile)
-
     try:
         pet_field_requirements = pet_metadata.PET_metadata
     except:
@@ -36,10 +40,14 @@ def spread_sheet_check_for_pet(sourcefile: Union[str, Path], **kwargs):
     recommended_fields = pet_field_requirements.get("recommended", [])
     optional_fields = pet_field_requirements.get("optional", [])
     blood_recording_fields = pet_field_requirements.get("blood_recording_fields", [])
-
-    intersection = set(
+    pet_fields = set(
         mandatory_fields + recommended_fields + optional_fields + blood_recording_fields
-    ) & set(data.keys())
+    )
+
+    # load data from spreadsheet, only the columns that are pet fields are needed
+    data = helper_functions.open_meta_data(sourcefile, usecols=pet_fields)
+
+    intersection = pet_fields & set(data.keys())
 
     if len(intersection) > 0:
         return True
@@ -47,6 +55,141 @@ def spread_sheet_check_for_pet(sourcefile: Union[str, Path], **kwargs):
         return False
 
 
+# number of bytes buffered when sniffing a file, dicom headers up to the Modality tag and ECAT main headers fit in this
+sniff_block_size = 4096
+
+# the tag of the last dicom element read when sniffing, (0008,0060) Modality
+modality_tag = pydicom.tag.Tag(0x0008, 0x0060)
+
+
+def sniff_dicom_header(
+    file_path: Union[str, Path], last_tag=modality_tag
+) -> Union[pydicom.Dataset, None]:
+    """
+    Reads the start of a dicom header without reading the rest of the file, the 128 byte preamble and DICM prefix are
+    checked first and the dataset is only parsed up to last_tag, long values before it are skipped over.
+
+    :param file_path: path to a possible dicom
+    :param last_tag: the last tag to read, defaults to (0008,0060) Modality
+    :return: the partial dataset or None if the file isn't a dicom
+    """
+    with open(file_path, "rb", buffering=sniff_block_size) as infile:
+        if infile.read(132)[128:] != b"DICM":
+            return None
+        infile.seek(0)
+        try:
+            return pydicom.filereader.read_partial(
+                infile,
+                stop_when=lambda tag, vr, length: tag > last_tag,
+                defer_size=256,
+            )
+        except (pydicom.errors.InvalidDicomError, EOFError, ValueError, OSError):
+            return None
+
+
+def sniff_dicom_modality(file_path: Union[str, Path]) -> Union[str, None]:
+    """
+    Reads the Modality of a dicom without reading the rest of it, see sniff_dicom_header.
+
+    :param file_path: path to a possible dicom
+    :return: the Modality of the dicom, None if the file isn't a dicom or has no Modality
+    """
+    dataset = sniff_dicom_header(file_path)
+    if dataset is None:
+        return None
+    return dataset.get("Modality", None)
+
+
+def sniff_ecat_header(file_path: Union[str, Path]) -> Union[tuple, None]:
+    """
+    Checks for the MATRIX magic number at the start of an ECAT main header and confirms the SW_VERSION it holds is a
+    version pypet2bids can read, only the 512 byte main header is read (and decompressed for .v.gz files).
+
+    :param file_path: path to a possible ECAT
+    :return: the ECAT version (e.g. '73') and main header or None if the file isn't a readable ECAT
+    """
+    opener = gzip.open if str(file_path).lower().endswith(".gz") else open
+    try:
+        with opener(file_path, "rb") as infile:
+            main_header_bytes = infile.read(read_ecat.MAIN_HEADER_SIZE)
+    except (OSError, EOFError):
+        return None
+    if (
+        not main_header_bytes.startswith(b"MATRIX")
+        or len(main_header_bytes) < read_ecat.MAIN_HEADER_SIZE
+    ):
+        return None
+    try:
+        return read_ecat.determine_ecat_version(main_header_bytes)
+    except Exception:
+        return None
+
+
+def sniff_ecat_version(file_path: Union[str, Path]) -> Union[str, None]:
+    """
+    :param file_path: path to a possible ECAT
+    :return: the ECAT version (e.g. '73') or None if the file isn't a readable ECAT, see sniff_ecat_header
+    """
+    header = sniff_ecat_header(file_path)
+    if header is None:
+        return None
+    return header[0]
+
+
+def spreadsheet_header(file_path: Union[str, Path]) -> list:
+    """
+    Reads only the column names of a spreadsheet, the first line of text files and the first row of every sheet of
+    excel files.
+
+    :param file_path: path to a .csv, .tsv, .xls, or .xlsx file
+    :return: list of column names
+    """
+    file_path = Path(file_path)
+    suffix = file_path.suffix.lower()
+    if suffix in [".csv", ".tsv", ".txt"]:
+        with open(file_path, "r", errors="ignore") as infile:
+            first_line = infile.readline().strip("\r\n")
+        separator = "\t" if "\t" in first_line else ","
+        return [column.strip().strip('"') for column in first_line.split(separator)]
+    if suffix == ".xlsx":
+        import openpyxl
+
+        workbook = openpyxl.load_workbook(file_path, read_only=True)
+        try:
+            header = []
+            for sheet in workbook.worksheets:
+                for row in sheet.iter_rows(max_row=1, values_only=True):
+                    header.extend(str(cell) for cell in row if cell is not None)
+            return header
+        finally:
+            workbook.close()
+    sheets = pandas.read_excel(file_path, sheet_name=None, nrows=0)
+    return [str(column) for sheet in sheets.values() for column in sheet.columns]
+
+
+def sniff_spread_sheet_for_pet(sourcefile: Union[str, Path]) -> bool:
+    """
+    Same as spread_sheet_check_for_pet but only the header of the spreadsheet is read.
+
+    :param sourcefile: path to a spreadsheet
+    :return: True if any of the columns are PET BIDS fields
+    """
+    try:
+        pet_field_requirements = pet_metadata.PET_metadata
+    except:
+        pet_field_requirements = {}
+
+    pet_fields = set()
+    for requirement in [
+        "mandatory",
+        "recommended",
+        "optional",
+        "blood_recording_fields",
+    ]:
+        pet_fields.update(pet_field_requirements.get(requirement, []))
+    return len(pet_fields & set(spreadsheet_header(sourcefile))) > 0
+
+
 def read_files_in_parallel(file_paths: list, function, n_jobs=-2, **kwargs):
     """
     Read files in parallel using joblib (note this should be refactored to use the threading module)
@@ -67,21 +210,40 @@ class DummyFile(object):
     def write(self, x):
         pass
 
+    def flush(self):
+        pass
+
+
+# files are classified from several threads at once, stdout is only restored once the last of them is done
+_nostdout_lock = threading.Lock()
+_nostdout_state = {"depth": 0, "stdout": None}
+
 
 @contextlib.contextmanager
 def nostdout():
-    save_stdout = sys.stdout
-    sys.stdout = DummyFile()
-    yield
-    sys.stdout = save_stdout
+    with _nostdout_lock:
+        if _nostdout_state["depth"] == 0:
+            _nostdout_state["stdout"] = sys.stdout
+            sys.stdout = DummyFile()
+        _nostdout_state["depth"] += 1
+    try:
+        yield
+    finally:
+        with _nostdout_lock:
+            _nostdout_state["depth"] -= 1
+            if _nostdout_state["depth"] == 0:
+                sys.stdout = _nostdout_state["stdout"]
 
 
-def pet_file(file_path: Path, return_only_path=False) -> Union[bool, str]:
+def pet_file(file_path: Path, return_only_path=False, sniff=True) -> Union[bool, str]:
     """
     Given a file path determine if the file is a pet imaging or pet spreadsheet type of file.
     Returns a tuple with the 'PET' status of the file followed by the type of PET file, one of
     the following -> 'DICOM', 'ECAT', 'SPREADSHEET', ''
 
+    By default files are sniffed, only the first few KB of each file are read: the dicom header up to the Modality tag,
+    the ECAT main header, or the header row of a spreadsheet. With sniff=False files are read in full instead.
+
     True value and DICOM returned if a dicom file is found
     >>> status, type_of_pet_file = pet_file('PETDICOM001.img')
     >>> assert status == True
@@ -94,6 +256,8 @@ def pet_file(file_path: Path, return_only_path=False) -> Union[bool, str]:
 
     :param file_path: path to file to check
     :type file_path: pathlib.Path object
+    :param return_only_path: return only the path of pet files and None otherwise
+    :param sniff: read only the headers of files rather than whole files
     :return: (status, file type)
     :rtype: tuple(bool, str)
     """
@@ -115,26 +279,37 @@ def pet_file(file_path: Path, return_only_path=False) -> Union[bool, str]:
             or "mr" in str(file_path.name).lower()
             or bool(re.search(r"\d", suffix.lower()))
         ):
-            try:
-                read_file = pydicom.dcmread(file_path)
-                if read_file.Modality == "PT":
+            if sniff:
+                if sniff_dicom_modality(file_path) == "PT":
                     file_type = "DICOM"
-                else:
-                    # do nothing, we only want dicoms with the correct modality
+            else:
+                try:
+                    read_file = pydicom.dcmread(file_path)
+                    if read_file.Modality == "PT":
+                        file_type = "DICOM"
+                    else:
+                        # do nothing, we only want dicoms with the correct modality
+                        pass
+                except (pydicom.errors.InvalidDicomError, AttributeError):
                     pass
-            except (pydicom.errors.InvalidDicomError, AttributeError):
-                pass
 
         if not file_type and suffix.lower() in [".v", ".v.gz"]:
-            try:
-                read_file = ecat.Ecat(str(file_path))
-                file_type = "ECAT"
-            except nibabel.filebasedimages.ImageFileError:
-                pass
+            if sniff:
+                if sniff_ecat_version(file_path):
+                    file_type = "ECAT"
+            else:
+                try:
+                    read_file = ecat.Ecat(str(file_path))
+                    file_type = "ECAT"
+                except nibabel.filebasedimages.ImageFileError:
+                    pass
 
         if not file_type and suffix.lower() in [".xlsx", ".tsv", ".csv", ".xls"]:
             try:
-                read_file = spread_sheet_check_for_pet(file_path)
+                if sniff:
+                    read_file = sniff_spread_sheet_for_pet(file_path)
+                else:
+                    read_file = spread_sheet_check_for_pet(file_path)
                 if read_file:
                     # if it looks like a pet file
                     file_type = "SPREADSHEET"
@@ -153,58 +328,172 @@ def pet_file(file_path: Path, return_only_path=False) -> Union[bool, str]:
             return False, file_type
 
 
-def pet_folder(folder_path: Path, skim=False, njobs=2) -> Union[str, list, bool]:
+# suffixes of files that may be PET files of each type, used to skim folders
+skim_suffixes = {
+    "DICOM": (".dcm", ".ima", ".img", ""),
+    "SPREADSHEET": (".xlsx", ".tsv", ".csv", ".xls"),
+    "ECAT": (".v", ".v.gz"),
+}
+
+
+def scan_files(folder_path: Union[str, Path]):
+    """
+    Walks a folder with os.scandir yielding files as they're found rather than listing the whole tree first, symbolic
+    links to folders aren't followed (as with os.walk) and broken links are ignored.
+
+    :param folder_path: folder to walk
+    :return: generator of (parent folder, file path) string tuples
+    """
+    folders = [str(folder_path)]
+    while folders:
+        folder = folders.pop()
+        try:
+            entries = list(os.scandir(folder))
+        except OSError:
+            continue
+        subfolders = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subfolders.append(entry.path)
+                elif entry.is_file():
+                    yield folder, entry.path
+            except OSError:
+                continue
+        # visit sub folders in order
+        folders.extend(sorted(subfolders, reverse=True))
+
+
+def skim_category(file_name: str) -> str:
+    """
+    :param file_name: name of a file
+    :return: the type of PET file the name suggests or an empty string
+    """
+    name = file_name.lower()
+    if name.endswith(skim_suffixes["ECAT"]):
+        return "ECAT"
+    suffix = Path(name).suffix
+    for category in ["DICOM", "SPREADSHEET"]:
+        if suffix in skim_suffixes[category]:
+            return category
+    return ""
+
+
+def _classify(file_path: str, sniff: bool) -> tuple:
+    try:
+        return pet_file(Path(file_path), sniff=sniff)
+    except (OSError, ValueError):
+        # files removed or unreadable since they were found aren't pet files
+        return False, ""
+
+
+def iter_pet_files(folder_path: Path, skim=False, njobs=None, sniff=True):
+    """
+    Streams the PET files found in a folder, files are classified by a pool of threads while the folder is still being
+    walked and results are yielded as soon as they're available. Once a PET file is found in a folder the rest of the
+    files in that folder are skipped, so at most one PET file is yielded per folder.
+
+    :param folder_path: folder to search recursively
+    :param skim: only check the first file of each type of PET file (dicom, ECAT, spreadsheet) in each folder
+    :param njobs: number of threads, defaults to the number of cpus + 4 up to 32
+    :param sniff: only read the headers of files, see pet_file
+    :return: generator of (file path, type of PET file) tuples
+    """
+    njobs = njobs or min(32, (os.cpu_count() or 1) + 4)
+    # only a few files are queued ahead so that files in folders that turn out to hold PET files are never read
+    max_queued = njobs * 4
+    confirmed = set()
+    skimmed = set()
+    pending = {}
+
+    def collect(done):
+        for future in done:
+            folder, file_path = pending.pop(future)
+            if future.cancelled():
+                continue
+            status, file_type = future.result()
+            if status and folder not in confirmed:
+                confirmed.add(folder)
+                for other, (other_folder, _) in pending.items():
+                    if other_folder == folder:
+                        other.cancel()
+                yield Path(file_path), file_type
+
+    with ThreadPoolExecutor(max_workers=njobs) as executor:
+        for folder, file_path in scan_files(folder_path):
+            if folder in confirmed:
+                continue
+            if skim:
+                category = skim_category(os.path.basename(file_path))
+                if not category or (folder, category) in skimmed:
+                    continue
+                skimmed.add((folder, category))
+            while len(pending) >= max_queued:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                yield from collect(done)
+            pending[executor.submit(_classify, file_path, sniff)] = (folder, file_path)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            yield from collect(done)
+
+
+def pet_folder(
+    folder_path: Path, skim=False, njobs=None, sniff=True
+) -> Union[str, list, bool]:
+    """
+    Finds the folders containing PET files within a folder, see iter_pet_files.
+
+    :param folder_path: folder to search recursively
+    :param skim: only check the first file of each type of PET file in each folder
+    :param njobs: number of threads used to classify files
+    :param sniff: only read the headers of files, see pet_file
+    :return: set of folders containing PET files
+    """
     if not folder_path.exists():
         raise FileNotFoundError(folder_path)
     if not folder_path.is_dir():
         raise FileNotFoundError(folder_path)
 
-    all_files = []
-    # collect list of all files
-    for root, folders, files in os.walk(folder_path):
-        for f in files:
-            f_path = Path(os.path.join(root, f))
-            if f_path.exists():
-                all_files.append(Path(os.path.join(root, f)))
-
-    # we aren't going to want to inspect every single file, instead we're going skim through the list of files
-    # by first selecting only the first file of each folder that has a given suffix (especially for dicom files)
-    if skim:
-        from pprint import pprint
-
-        # collect all the dicom images
-        dicoms, spreadsheets, ecats = {}, {}, {}
-        for f in all_files:
-            if f.suffix.lower() in [".dcm", ".ima", ".img", ""]:
-                parent = dicoms.get(str(f.parent), {str(f.parent): {f.suffix: f}})
-                dicoms[str(f.parent)] = parent
-            if f.suffix.lower() in [".xlsx", ".tsv", ".csv", ".xls"]:
-                parent = spreadsheets.get(str(f.parent), {str(f.parent): {f.suffix: f}})
-                spreadsheets[str(f.parent)] = parent
-            if f.suffix.lower() in [".v"] or f.suffixes == [".v", ".gz"]:
-                parent = ecats.get(
-                    str(f.parent), {str(f.parent): {"".join(f.suffixes): f}}
-                )
-                ecats[str(f.parent)] = parent
-        # now flatten all the dictionaries to only include the file parts
-        smaller_list = []
-        for file_dict in [dicoms, spreadsheets, ecats]:
-            for k, v in file_dict.items():
-                for k2, v2 in v.items():
-                    for k3, v3 in v2.items():
-                        smaller_list.append(v3)
-
-        all_files = smaller_list
-
-    # check if any files are pet files
-    files = read_files_in_parallel(
-        all_files, pet_file, n_jobs=njobs, return_only_path=True
+    return set(
+        path.parent
+        for path, _ in iter_pet_files(folder_path, skim=skim, njobs=njobs, sniff=sniff)
     )
-    files = [Path(f) for f in files if f is not None]
-    # check through list of pet files and statuses for True values in parallel
-    folders = set([f.parent for f in files])
 
-    return folders
+
+def query_index(args):
+    """
+    Refreshes and queries a PET index for the ispet command line, see pet_index.
+
+    :param args: parsed command line arguments
+    """
+    # deferred to avoid a circular import as pet_index uses this module
+    try:
+        import pet_index
+    except ModuleNotFoundError:
+        import pypet2bids.pet_index as pet_index
+
+    under = None
+    with pet_index.PetIndex(args.index) as index:
+        if args.filepath is not None:
+            if not args.filepath.is_dir():
+                raise FileNotFoundError(args.filepath)
+            under = args.filepath.resolve()
+            counts = index.refresh(under, njobs=args.njobs)
+            print(
+                f"Indexed {under}: {counts['examined']} files examined, {counts['unchanged']} unchanged, "
+                f"{counts['removed']} removed",
+                file=sys.stderr,
+            )
+        series = index.pet_series(
+            patient_id=args.subject,
+            study_instance_uid=args.study,
+            series_instance_uid=args.series,
+            under=under,
+        )
+    for entry in series:
+        print(json.dumps(entry) if args.jsonl else entry["input"], flush=True)
+    if not series:
+        sys.exit(1)
 
 
 def main():
@@ -223,9 +512,10 @@ def main():
     parser.add_argument(
         "filepath",
         type=Path,
+        nargs="?",
         help="File path to check whether file is PET image or bloodfile. "
         "If a folder is given, all files in the folder will be checked and "
-        "any folders containing PET files will be returned.",
+        "any folders containing PET files will be returned. May be omitted when querying an --index.",
     )
     parser.add_argument(
         "-p",
@@ -247,13 +537,58 @@ def main():
         "-n",
         "--njobs",
         type=int,
-        default=2,
-        help="Number of jobs to run in parallel when examining folders, defaults to 2.",
+        default=None,
+        help="Number of threads used to examine files in folders, defaults to the number of cpus + 4 up to 32.",
+    )
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        default=False,
+        help="When examining a folder print a JSON object for each PET file as soon as it's found, one per line, "
+        "with the path, type, and folder of the file. Only the first PET file found in each folder is listed.",
+    )
+    parser.add_argument(
+        "--full-read",
+        action="store_true",
+        default=False,
+        help="Read files in full to classify them rather than only sniffing their headers, much slower on large "
+        "folders.",
+    )
+    parser.add_argument(
+        "--index",
+        type=Path,
+        default=None,
+        help="Path to a sqlite index of PET files. When a folder is given the index is brought up to date with it, "
+        "only files that are new or whose size or modification time changed are examined. The PET series in the "
+        "index (under the folder if one is given) are then printed, one input for dcm2niix4pet (a folder) or "
+        "ecatpet2bids (a file) per line.",
+    )
+    parser.add_argument(
+        "--subject",
+        type=str,
+        default=None,
+        help="Only print PET series of this PatientID from the --index",
+    )
+    parser.add_argument(
+        "--study",
+        type=str,
+        default=None,
+        help="Only print PET series of this StudyInstanceUID from the --index",
+    )
+    parser.add_argument(
+        "--series",
+        type=str,
+        default=None,
+        help="Only print the PET series with this SeriesInstanceUID from the --index",
     )
     args = parser.parse_args()
 
-    if args.filepath.is_file():
-        status, pet_files = pet_file(args.filepath.resolve())
+    if args.index:
+        query_index(args)
+    elif args.filepath is None:
+        parser.error("a filepath is required unless querying an --index")
+    elif args.filepath.is_file():
+        status, pet_files = pet_file(args.filepath.resolve(), sniff=not args.full_read)
         if status:
             if args.path_only:
                 print(f"{args.filepath}")
@@ -263,13 +598,25 @@ def main():
             sys.exit(1)
 
     elif args.filepath.is_dir():
-        pet_folders = pet_folder(
-            args.filepath.resolve(), skim=args.skim, njobs=args.njobs
-        )
-        if len(pet_folders) > 0:
-            for f in pet_folders:
-                print(f"{f}")
-        else:
+        # results are printed as they're found so huge trees can be piped into other tools, stdout is silenced while
+        # files are being read so results are written to the original stdout
+        stdout = sys.stdout
+        found = 0
+        for path, file_type in iter_pet_files(
+            args.filepath.resolve(),
+            skim=args.skim,
+            njobs=args.njobs,
+            sniff=not args.full_read,
+        ):
+            found += 1
+            if args.jsonl:
+                line = json.dumps(
+                    {"path": str(path), "type": file_type, "folder": str(path.parent)}
+                )
+            else:
+                line = f"{path.parent}"
+            print(line, file=stdout, flush=True)
+        if not found:
             sys.exit(1)
     else:
         sys.exit(1)
@@ -1,6 +1,8 @@
-from json_maj.main import JsonMAJ
+import copy
+import json
 import pathlib
 import numpy
+import pandas
 import typing
 import os
 import argparse
@@ -10,9 +12,11 @@ from numpy.lib.recfunctions import require_fields
 try:
     import pypet2bids.helper_functions as helper_functions
     import pypet2bids.pet_metadata as pet_metadata
+    import pypet2bids.update_json_pet_file as update_json_pet_file
 except ModuleNotFoundError:
     import helper_functions
     import pet_metadata
+    import update_json_pet_file
 
 
 def read_multi_subject_spreadsheets(
@@ -106,27 +110,12 @@ def read_multi_subject_spreadsheets(
         else:
             subject_column = found_column_names[0]
 
-        # collect all subject id's
-        subject_metadata = {}
-        for subject in multiple_subject_metadata.get(subject_column, None):
-            subject_row = helper_functions.get_coordinates_containing(
-                subject, multiple_subject_metadata, single=True
-            )[0]
-            subject_id = helper_functions.collect_bids_part("sub", subject)
-            session_id = helper_functions.collect_bids_part("ses", subject)
-            if subject_id:
-                subject_metadata[subject_id] = general_metadata
-                if session_id:
-                    subject_metadata[subject_id]["session_id"] = session_id
-                if kwargs:
-                    subject_metadata[subject_id].update(**kwargs)
-
-                subject_data_from_row = helper_functions.transform_row_to_dict(
-                    subject_row, multiple_subject_metadata
-                )
-                for k, v in subject_data_from_row.items():
-                    if v and k != subject_column and v is not numpy.nan:
-                        subject_metadata[subject_id][k] = v
+        # subjects are keyed by subject id alone, so a later row for the same subject replaces an earlier one
+        subject_metadata = dict(
+            iter_subject_metadata(
+                general_metadata, multiple_subject_metadata, subject_column, **kwargs
+            )
+        )
 
         return subject_metadata
 
@@ -143,14 +132,62 @@ def read_multi_subject_spreadsheets(
         raise Exception(error_message)
 
 
+def iter_subject_metadata(
+    general_metadata: dict,
+    multiple_subject_metadata: pandas.DataFrame,
+    subject_column: str,
+    **kwargs,
+):
+    """
+    Generates the metadata of each subject in a multi subject spreadsheet one row at a time. Array like cells are
+    evaluated for the whole spreadsheet at once (see helper_functions.evaluate_cells) and every subject gets its own
+    copy of the general metadata, so rows never share or overwrite each other's values.
+
+    :param general_metadata: metadata applicable to every subject, e.g. read from a scanner spreadsheet
+    :type general_metadata: dict
+    :param multiple_subject_metadata: dataframe with a row per subject
+    :type multiple_subject_metadata: pandas.DataFrame
+    :param subject_column: name of the column holding the subject (and session) paths
+    :type subject_column: str
+    :param kwargs: additional key pair arguments applied to every subject
+    :return: generator of (subject id, metadata) tuples, rows without a subject id are skipped
+    :rtype: generator
+    """
+    evaluated = helper_functions.evaluate_cells(multiple_subject_metadata)
+    for subject, row in zip(
+        multiple_subject_metadata[subject_column],
+        evaluated.to_dict(orient="records"),
+    ):
+        subject_id = helper_functions.collect_bids_part("sub", subject)
+        if not subject_id:
+            continue
+        metadata = copy.deepcopy(general_metadata)
+        session_id = helper_functions.collect_bids_part("ses", subject)
+        if session_id:
+            metadata["session_id"] = session_id
+        if kwargs:
+            metadata.update(**kwargs)
+        for k, v in row.items():
+            if k == subject_column or (
+                pandas.api.types.is_scalar(v) and pandas.isna(v)
+            ):
+                continue
+            if v:
+                metadata[k] = v
+        yield subject_id, metadata
+
+
 def write_multi_subject_spreadsheets(
     subjects: dict,
     output_path: typing.Union[str, pathlib.Path],
     create_bids_tree: bool = False,
-) -> None:
+    dry_run: bool = False,
+    n_jobs: int = None,
+) -> list:
     """
     Writes out a dictionary of subjects to a series of json files, if files exist updates
-    them with new values obtained from spreadsheets.
+    them with new values obtained from spreadsheets. Sidecars are updated in bulk, see
+    update_json_pet_file.write_sidecars.
 
     :param subjects: subject dictionary with subject id as primary keys and all bids fields as values
     :type subjects: dict
@@ -161,36 +198,32 @@ def write_multi_subject_spreadsheets(
         specified. Works on existing bids trees so long as session and subject id can be parsed from
         multi subject input sheet.
     :type create_bids_tree: bool
-    :return: None
-    :rtype: None
+    :param dry_run: only report the changes that would be made to each json
+    :type dry_run: bool
+    :param n_jobs: number of threads used to update jsons
+    :type n_jobs: int
+    :return: a report of the changes made to each json
+    :rtype: list
     """
-    if create_bids_tree:
-        for subject, fields in subjects.items():
-            json_out_path = os.path.join(output_path, f"{subject}")
-            if fields.get("session_id", None):
-                json_out_file_name = (
-                    subject + "_" + f"{fields.get('session_id')}_pet.json"
-                )
-                json_out_path = os.path.join(
-                    json_out_path, fields.get("session_id"), "pet"
-                )
+    updates = []
+    for subject, fields in subjects.items():
+        json_out_path = os.path.join(output_path, f"{subject}")
+        session_id = fields.get("session_id", None)
+        if create_bids_tree:
+            if session_id:
+                json_out_file_name = subject + "_" + f"{session_id}_pet.json"
+                json_out_path = os.path.join(json_out_path, session_id, "pet")
             else:
                 json_out_file_name = subject + "_pet.json"
                 json_out_path = os.path.join(json_out_path, "pet")
-            pathlib.Path(json_out_path).mkdir(parents=True, exist_ok=True)
-            json_out_file_name = os.path.join(json_out_path, json_out_file_name)
-            json_out = JsonMAJ(
-                json_path=json_out_file_name, update_values=fields
-            ).update()
-    else:
-        for subject, fields in subjects.items():
-            json_out_path = os.path.join(output_path, f"{subject}")
-            if fields.get("session_id", None):
-                json_out_path += f"{fields.get('session_id')}_pet.json"
-            else:
-                json_out_path += "_pet.json"
+            json_out_path = os.path.join(json_out_path, json_out_file_name)
+        elif session_id:
+            json_out_path += f"_{session_id}_pet.json"
+        else:
+            json_out_path += "_pet.json"
+        updates.append((json_out_path, fields))
 
-            json_out = JsonMAJ(json_path=json_out_path, update_values=fields).update()
+    return update_json_pet_file.write_sidecars(updates, n_jobs=n_jobs, dry_run=dry_run)
 
 
 def cli():
@@ -218,6 +251,11 @@ def cli():
     )
     parser.add_argument("--output-path", "-o", type=pathlib.Path)
     parser.add_argument("--bids-tree", "-b", action="store_true")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the changes that would be made to each json without writing anything",
+    )
     args = parser.parse_args()
     subjects = read_multi_subject_spreadsheets(
         general_metadata_spreadsheet=args.general_spreadsheet,
@@ -228,9 +266,15 @@ def cli():
     else:
         output_path = os.getcwd()
 
-    write_multi_subject_spreadsheets(
-        output_path=output_path, subjects=subjects, create_bids_tree=args.bids_tree
+    reports = write_multi_subject_spreadsheets(
+        output_path=output_path,
+        subjects=subjects,
+        create_bids_tree=args.bids_tree,
+        dry_run=args.dry_run,
     )
+    if args.dry_run:
+        for report in reports:
+            print(json.dumps(report, default=str))
 
     return subjects
 
@@ -0,0 +1,270 @@
+"""
+A persistent index of the PET files in an archive kept in a sqlite database so that archives don't have to be
+re-scanned from scratch. Every file found is recorded with its classification (DICOM, ECAT, SPREADSHEET, or an empty
+string for files that aren't PET files), the header fields needed to group files into series, and its size and
+modification time. Refreshing the index only re-examines files whose size or modification time has changed and drops
+files that no longer exist, and files are only ever sniffed (see is_pet.pet_file) rather than read in full.
+
+The index can then be queried for the PET series of a subject, study, or series; the inputs returned are folders for
+dicom series and files for ECATs, the same inputs dcm2niix4pet and ecatpet2bids take.
+
+| *Authors: Anthony Galassi*
+| *Copyright OpenNeuroPET team*
+"""
+
+import os
+import sqlite3
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Union
+
+import pydicom
+
+try:
+    import is_pet
+except ModuleNotFoundError:
+    import pypet2bids.is_pet as is_pet
+
+# the last dicom tag read when indexing, (0054,0101) NumberOfTimeSlices
+number_of_time_slices_tag = pydicom.tag.Tag(0x0054, 0x0101)
+
+# number of examined files written to the database at a time, an interrupted refresh keeps what was committed
+commit_every = 1000
+
+schema = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    folder TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    patient_id TEXT,
+    study_instance_uid TEXT,
+    series_instance_uid TEXT,
+    sw_version TEXT,
+    frames INTEGER,
+    indexed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_patient_id ON files (patient_id);
+CREATE INDEX IF NOT EXISTS files_series_instance_uid ON files (series_instance_uid);
+CREATE INDEX IF NOT EXISTS files_folder ON files (folder);
+"""
+
+columns = [
+    "path",
+    "folder",
+    "size",
+    "mtime_ns",
+    "type",
+    "patient_id",
+    "study_instance_uid",
+    "series_instance_uid",
+    "sw_version",
+    "frames",
+    "indexed",
+]
+
+
+def examine_file(file_path: Union[str, Path]) -> dict:
+    """
+    Classifies a file from its header and collects the fields recorded in the index.
+
+    :param file_path: path to a file
+    :return: the type of PET file (or an empty string) and the patient, study, series, ECAT version, and number of
+        frames where available
+    """
+    file_path = str(file_path)
+    record = {
+        "type": "",
+        "patient_id": None,
+        "study_instance_uid": None,
+        "series_instance_uid": None,
+        "sw_version": None,
+        "frames": None,
+    }
+    name = os.path.basename(file_path).lower()
+    try:
+        if name.endswith(is_pet.skim_suffixes["ECAT"]):
+            header = is_pet.sniff_ecat_header(file_path)
+            if header:
+                version, main_header = header
+                record.update(
+                    type="ECAT",
+                    patient_id=str(main_header.get("PATIENT_ID", "")) or None,
+                    sw_version=version,
+                    frames=main_header.get("NUM_FRAMES"),
+                )
+        elif Path(name).suffix in is_pet.skim_suffixes["SPREADSHEET"]:
+            if is_pet.sniff_spread_sheet_for_pet(file_path):
+                record["type"] = "SPREADSHEET"
+        else:
+            dataset = is_pet.sniff_dicom_header(
+                file_path, last_tag=number_of_time_slices_tag
+            )
+            if dataset is not None and dataset.get("Modality", None) == "PT":
+                frames = dataset.get("NumberOfTimeSlices", None)
+                record.update(
+                    type="DICOM",
+                    patient_id=str(dataset.get("PatientID", "")) or None,
+                    study_instance_uid=dataset.get("StudyInstanceUID", None),
+                    series_instance_uid=dataset.get("SeriesInstanceUID", None),
+                    frames=int(frames) if frames is not None else None,
+                )
+    except (OSError, ValueError):
+        # unreadable files are recorded as not being pet files until they change
+        pass
+    return record
+
+
+class PetIndex:
+    """
+    A sqlite index of PET files, see the module documentation.
+
+    :param path: path to the sqlite database, it's created if it doesn't exist
+    """
+
+    def __init__(self, path):
+        self.path = Path(path).absolute()
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(schema)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def _paths_under(self, folder: str) -> dict:
+        prefix = folder.rstrip(os.sep) + os.sep
+        rows = self.connection.execute(
+            "SELECT path, size, mtime_ns FROM files WHERE substr(path, 1, ?) = ?",
+            (len(prefix), prefix),
+        )
+        return {row["path"]: (row["size"], row["mtime_ns"]) for row in rows}
+
+    def _write(self, records: list):
+        self.connection.executemany(
+            f"INSERT OR REPLACE INTO files ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})",
+            [[record[column] for column in columns] for record in records],
+        )
+        self.connection.commit()
+
+    def refresh(self, folder, njobs: int = None) -> dict:
+        """
+        Brings the index up to date with the files in a folder, only new files and files whose size or modification time
+        changed are examined.
+
+        :param folder: folder to index recursively
+        :param njobs: number of threads used to examine files, defaults to the number of cpus + 4 up to 32
+        :return: the number of files examined, unchanged, and removed from the index
+        """
+        folder = str(Path(folder).absolute())
+        known = self._paths_under(folder)
+        njobs = njobs or min(32, (os.cpu_count() or 1) + 4)
+        max_queued = njobs * 4
+        counts = {"examined": 0, "unchanged": 0, "removed": 0}
+        seen = set()
+        pending = {}
+        examined = []
+
+        def collect(done):
+            for future in done:
+                record = pending.pop(future)
+                record.update(future.result())
+                examined.append(record)
+            if len(examined) >= commit_every:
+                self._write(examined)
+                examined.clear()
+
+        with ThreadPoolExecutor(max_workers=njobs) as executor:
+            for parent, file_path in is_pet.scan_files(folder):
+                if file_path.startswith(str(self.path)):
+                    # the database and its journal may be inside the folder being indexed
+                    continue
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                seen.add(file_path)
+                if known.get(file_path) == (stat.st_size, stat.st_mtime_ns):
+                    counts["unchanged"] += 1
+                    continue
+                while len(pending) >= max_queued:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                future = executor.submit(examine_file, file_path)
+                pending[future] = {
+                    "path": file_path,
+                    "folder": parent,
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "indexed": time.time(),
+                }
+                counts["examined"] += 1
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+        self._write(examined)
+
+        removed = [(path,) for path in known if path not in seen]
+        self.connection.executemany("DELETE FROM files WHERE path = ?", removed)
+        self.connection.commit()
+        counts["removed"] = len(removed)
+        return counts
+
+    def pet_series(
+        self,
+        patient_id: str = None,
+        study_instance_uid: str = None,
+        series_instance_uid: str = None,
+        under=None,
+    ) -> list:
+        """
+        Lists the PET series in the index, dicom files are grouped by series and folder and every ECAT is a series of
+        its own.
+
+        :param patient_id: only list series of this PatientID (or PATIENT_ID for ECATs)
+        :param study_instance_uid: only list series of this study
+        :param series_instance_uid: only list this series
+        :param under: only list series in this folder
+        :return: list of dictionaries with the type, input (a folder for dicoms and a file for ECATs), number of files,
+            patient, study, series, ECAT version, and number of frames of each series
+        """
+        conditions = ["type IN ('DICOM', 'ECAT')"]
+        values = []
+        for column, value in [
+            ("patient_id", patient_id),
+            ("study_instance_uid", study_instance_uid),
+            ("series_instance_uid", series_instance_uid),
+        ]:
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                values.append(value)
+        if under is not None:
+            prefix = str(Path(under).absolute()).rstrip(os.sep) + os.sep
+            conditions.append("substr(path, 1, ?) = ?")
+            values.extend([len(prefix), prefix])
+        rows = self.connection.execute(
+            f"""
+            SELECT type,
+                   CASE type WHEN 'DICOM' THEN folder ELSE path END AS input,
+                   count(*) AS files,
+                   patient_id,
+                   study_instance_uid,
+                   series_instance_uid,
+                   sw_version,
+                   max(frames) AS frames
+            FROM files
+            WHERE {' AND '.join(conditions)}
+            GROUP BY type, input, series_instance_uid
+            ORDER BY input, series_instance_uid
+            """,
+            values,
+        )
+        return [dict(row) for row in rows]
@@ -23,6 +23,7 @@ import pathlib
 import re
 import numpy
 from pypet2bids.helper_functions import decompress, first_middle_last_frames_to_text
+from pypet2bids.bundled_data import LazyJson
 
 parent_dir = pathlib.Path(__file__).parent.resolve()
 code_dir = parent_dir.parent
@@ -40,14 +41,14 @@ if ecat_save_steps == "1":
 
 
 # collect ecat header maps, this program will not work without these as ECAT data varies in the byte location of its
-# data depending on the version of ECAT it was formatted with.
-try:
-    with open(join(parent_dir, "ecat_headers.json"), "r") as infile:
-        ecat_header_maps = json.load(infile)
-except FileNotFoundError:
-    raise Exception(
-        "Unable to load header definitions and map from ecat_headers.json. Aborting."
-    )
+# data depending on the version of ECAT it was formatted with. The maps are read from ecat_headers.json on first use.
+ecat_header_maps = LazyJson(join(parent_dir, "ecat_headers.json"))
+
+# compiled versions of the header maps above, populated on first use by compile_header_schema
+compiled_header_schemas = {}
+
+# every ECAT main header occupies the first 512 byte block of the file
+MAIN_HEADER_SIZE = 512
 
 
 # noinspection PyShadowingNames
@@ -132,6 +133,92 @@ def get_buffer_size(data_type: str, variable_name: str):
     return scalar
 
 
+def compile_header_schema(header_data_map: list) -> list:
+    """
+    Compiles a header map from ecat_headers.json into a list of entries holding a precompiled struct.Struct along with
+    the byte position of each field, that way a whole header block can be read from disk once and each field unpacked
+    from (or packed into) that block without re-parsing the struct format strings. Compiled schemas are cached in
+    compiled_header_schemas so this work is only done once per header map.
+
+    :param header_data_map: schema for a header, e.g. ecat_header_maps['ecat_headers']['73']['mainheader']
+    :return: a list of dictionaries with the keys variable_name, byte, struct, fmt, and msec
+    """
+    cached = compiled_header_schemas.get(id(header_data_map))
+    if cached and cached[0] is header_data_map:
+        return cached[1]
+
+    compiled = []
+    for value in header_data_map:
+        compiled.append(
+            {
+                "variable_name": value["variable_name"],
+                "byte": value["byte"],
+                "struct": struct.Struct(">" + value["struct"]),
+                "fmt": ">" + value["struct"],
+                "msec": "comment" in value and "msec" in value["comment"],
+            }
+        )
+
+    compiled_header_schemas[id(header_data_map)] = (header_data_map, compiled)
+    return compiled
+
+
+def unpack_header(compiled_schema: list, header_bytes: bytes, clean=True) -> dict:
+    """
+    Unpacks a block of header bytes into a dictionary using a schema created with compile_header_schema.
+
+    :param compiled_schema: output of compile_header_schema
+    :param header_bytes: the bytes of the header block, starting at the first byte of the header
+    :param clean: Whether to remove byte padding or not, see get_header_data
+    :return: a dictionary with variable names of header fields as keys and header values as values
+    """
+    header = {}
+    for field in compiled_schema:
+        variable_name = field["variable_name"]
+        header[variable_name] = field["struct"].unpack_from(header_bytes, field["byte"])
+        if clean and "fill" not in variable_name.lower():
+            header[variable_name] = filter_bytes(header[variable_name], field["fmt"])
+        if field["msec"]:
+            # for entries that are in msec, convert to sec for PET BIDS json
+            header[variable_name] /= 1000
+    return header
+
+
+def determine_ecat_version(main_header_bytes: bytes):
+    """
+    Determines the version of an ECAT file given the bytes of its main header by checking the SW_VERSION field of each
+    known main header schema against the version that schema describes.
+
+    :param main_header_bytes: the first 512 bytes of an ECAT file
+    :return: the confirmed version as a string (e.g. '73') and the main header read with that version's schema
+    """
+    for version, dictionary in ecat_header_maps["ecat_headers"].items():
+        try:
+            possible_header = unpack_header(
+                compile_header_schema(dictionary["mainheader"]), main_header_bytes
+            )
+            if version == str(possible_header["SW_VERSION"]):
+                return version, possible_header
+        except (UnicodeDecodeError, struct.error):
+            continue
+
+    raise Exception(
+        f"Unable to determine ECAT File Type from these types {ecat_header_maps['ecat_headers'].keys()}"
+    )
+
+
+def read_main_header(ecat_file: str):
+    """
+    Reads only the 512 byte main header of an ECAT file, no subheaders, directory tables, or pixel data are touched.
+
+    :param ecat_file: path to an ecat file
+    :return: the main header as a dictionary and the ECAT version (e.g. '73') the header was read with
+    """
+    main_header_bytes = read_bytes(ecat_file, 0, MAIN_HEADER_SIZE)
+    version, main_header = determine_ecat_version(main_header_bytes)
+    return main_header, version
+
+
 def get_header_data(
     header_data_map: dict, ecat_file: str = "", byte_offset: int = 0, clean=True
 ):
@@ -151,24 +238,17 @@ def get_header_data(
            lists/arrays of data will be returned as tuples instead of lists. Uncleaned data will be of format b''.
     :return: a dictionary with variable names of header fields as keys and cleaned/uncleaned header fields as values
     """
-    header = {}
+    compiled_schema = compile_header_schema(header_data_map)
 
-    for value in header_data_map:
-        byte_position, variable_name, struct_fmt = (
-            value["byte"],
-            value["variable_name"],
-            ">" + value["struct"],
-        )
-        byte_width = struct.calcsize(struct_fmt)
-        relative_byte_position = byte_position + byte_offset
-        raw_bytes = read_bytes(ecat_file, relative_byte_position, byte_width)
-        header[variable_name] = struct.unpack(struct_fmt, raw_bytes)
-        if clean and "fill" not in variable_name.lower():
-            header[variable_name] = filter_bytes(header[variable_name], struct_fmt)
-        if "comment" in value and "msec" in value["comment"]:
-            # for entries that are in msec, convert to sec for PET BIDS json
-            header[variable_name] /= 1000
-        read_head_position = relative_byte_position + byte_width
+    # read the entire header block in one pass instead of opening the file once per field
+    header_width = max(
+        field["byte"] + field["struct"].size for field in compiled_schema
+    )
+    header_bytes = read_bytes(ecat_file, byte_offset, header_width)
+    header = unpack_header(compiled_schema, header_bytes, clean=clean)
+
+    last_field = compiled_schema[-1]
+    read_head_position = byte_offset + last_field["byte"] + last_field["struct"].size
 
     return header, read_head_position
 
@@ -274,28 +354,13 @@ def read_ecat(
     if ".gz" in ecat_file:
         ecat_file = decompress(ecat_file)
 
-    # try to determine what type of ecat this is
-    possible_ecat_headers = {}
-    for entry, dictionary in ecat_header_maps["ecat_headers"].items():
-        possible_ecat_headers[entry] = dictionary["mainheader"]
-
     # set byte order
     byte_order = ">"
 
-    confirmed_version = None
-    for version, dictionary in possible_ecat_headers.items():
-        try:
-            possible_header, _ = get_header_data(dictionary, ecat_file)
-            if version == str(possible_header["SW_VERSION"]):
-                confirmed_version = version
-                break
-        except UnicodeDecodeError:
-            continue
-
-    if not confirmed_version:
-        raise Exception(
-            f"Unable to determine ECAT File Type from these types {possible_ecat_headers.keys()}"
-        )
+    # try to determine what type of ecat this is
+    confirmed_version, _ = determine_ecat_version(
+        read_bytes(ecat_file, 0, MAIN_HEADER_SIZE)
+    )
 
     ecat_main_header = ecat_header_maps["ecat_headers"][confirmed_version]["mainheader"]
 
@@ -507,3 +572,55 @@ def read_ecat(
         pixel_data_matrix_4d = None
 
     return main_header, subheaders, pixel_data_matrix_4d
+
+
+def iter_ecat_frames(ecat_file: str):
+    """
+    Reads an ecat file one frame at a time, unlike read_ecat only a single frame of pixel data is held in memory at
+    once. Only image (FILE_TYPE 7) ecats are supported.
+
+    :param ecat_file: path to an ecat file
+    :return: a generator yielding (main header, subheader, 3d pixel data) for each frame in frame order, the pixel data
+        is not scaled or calibrated
+    """
+    if ".gz" in ecat_file:
+        ecat_file = decompress(ecat_file)
+
+    main_header, version = read_main_header(ecat_file)
+    if main_header["FILE_TYPE"] != 7:
+        raise Exception(
+            f"Unable to stream frames from {ecat_file}, unsupported image type {main_header['FILE_TYPE']}"
+        )
+    subheader_map = ecat_header_maps["ecat_headers"][version]["7"]
+
+    directory = get_directory_data(
+        read_bytes(ecat_file, MAIN_HEADER_SIZE, 512), ecat_file
+    )
+
+    with open(ecat_file, "rb") as infile:
+        for frame_start in directory[1]:
+            subheader, _ = get_header_data(
+                subheader_map, ecat_file, byte_offset=512 * (frame_start - 1)
+            )
+            image_size = (
+                subheader["X_DIMENSION"],
+                subheader["Y_DIMENSION"],
+                subheader["Z_DIMENSION"],
+            )
+            if subheader["DATA_TYPE"] == 5:
+                pixel_data_type = numpy.dtype(">f4")
+            elif subheader["DATA_TYPE"] == 6:
+                pixel_data_type = numpy.dtype(">i2")
+            else:
+                raise ValueError(
+                    f"Unable to determine pixel data type from value: {subheader['DATA_TYPE']} extracted from "
+                    f"{subheader}"
+                )
+            count = image_size[0] * image_size[1] * image_size[2]
+            infile.seek(512 * frame_start)
+            pixel_data = numpy.frombuffer(
+                infile.read(count * pixel_data_type.itemsize),
+                dtype=pixel_data_type,
+                count=count,
+            ).reshape(*image_size, order="F")
+            yield main_header, subheader, pixel_data
@@ -1,16 +1,18 @@
 import typing
 import os
+import json
 import pathlib
 import argparse
 import logging
-from json_maj.main import JsonMAJ
 
 try:
     import helper_functions
     import pet_metadata as metadata
+    import update_json_pet_file
 except ModuleNotFoundError:
     import pypet2bids.helper_functions as helper_functions
     import pypet2bids.pet_metadata as metadata
+    import pypet2bids.update_json_pet_file as update_json_pet_file
 
 # from pypet2bids.helper_functions import single_spreadsheet_reader, \
 #    collect_bids_part, open_meta_data, load_pet_bids_requirements_json, ParseKwargs
@@ -133,7 +135,8 @@ def write_single_subject_spreadsheets(
     subject_metadata: dict,
     output_path: typing.Union[str, pathlib.Path],
     create_bids_tree: bool = False,
-) -> str:
+    dry_run: bool = False,
+) -> dict:
     """
     Writes out a dictionary of subjects to a series of json files, if files exist updates
     them with new values obtained from spreadsheets.
@@ -146,8 +149,10 @@ def write_single_subject_spreadsheets(
         specified. Works on existing bids if session and subject id can be parsed from
         subject_metadata.
     :type create_bids_tree: bool
-    :return: path to written json file
-    :rtype: str
+    :param dry_run: only report the changes that would be made to the json
+    :type dry_run: bool
+    :return: a report of the changes made to the json, see update_json_pet_file.write_sidecars
+    :rtype: dict
     """
 
     subject_id = subject_metadata.get("subject_id", None)
@@ -175,23 +180,18 @@ def write_single_subject_spreadsheets(
         if output_path.parts[-1] != "pet":
             output_path = output_path / "pet"
 
-        output_path.mkdir(parents=True, exist_ok=True)
-
-        JsonMAJ(
-            json_path=os.path.join(output_path, json_out_file_name),
-            update_values=subject_metadata,
-        ).update()
+        json_out_path = os.path.join(output_path, json_out_file_name)
     else:
-        output_path.expanduser().mkdir(exist_ok=True, parents=True)
-        json_out_path = os.path.join(output_path, f"{subject_id}")
+        json_out_path = os.path.join(output_path.expanduser(), f"{subject_id}")
         if session_id:
             json_out_path += f"_{session_id}_pet.json"
         else:
             json_out_path += "_pet.json"
 
-        JsonMAJ(json_path=json_out_path, update_values=subject_metadata).update()
-
-    return None
+    # the json is read, merged, and written atomically in one go
+    return update_json_pet_file.write_sidecars(
+        [(json_out_path, subject_metadata)], n_jobs=1, dry_run=dry_run
+    )[0]
 
 
 def cli():
@@ -216,6 +216,11 @@ def cli():
     parser.add_argument(
         "--kwargs", "-k", nargs="*", action=helper_functions.ParseKwargs, default={}
     )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the changes that would be made to the json without writing anything",
+    )
     args = parser.parse_args()
     subject = read_single_subject_spreadsheets(
         general_metadata_spreadsheet=args.spreadsheet, **args.kwargs
@@ -225,11 +230,14 @@ def cli():
     else:
         output_path = pathlib.Path(os.getcwd())
 
-    write_single_subject_spreadsheets(
+    report = write_single_subject_spreadsheets(
         output_path=output_path.expanduser(),
         subject_metadata=subject,
         create_bids_tree=args.bids_tree,
+        dry_run=args.dry_run,
     )
+    if args.dry_run:
+        print(json.dumps(report, default=str))
 
     return subject
 
@@ -0,0 +1,241 @@
+"""
+An opt-in on-disk cache for parsed metadata spreadsheets. Parsing excel workbooks is the slowest step of metadata heavy
+conversions and the same workbooks (e.g. a shared scanner parameters sheet) are often read for every subject and session
+in a batch. When enabled, the dataframes read by :meth:`pypet2bids.helper_functions.open_meta_data` and the metadata
+collected from them by :meth:`pypet2bids.helper_functions.single_spreadsheet_reader` are pickled to a cache folder
+keyed by a hash of the spreadsheet's contents and the options it was read with, so an edited spreadsheet is never
+served from the cache. Entries are evicted least recently used first once the cache grows past its size limit.
+
+Independently of the on-disk cache, every process keeps the most recently parsed spreadsheets in memory (see
+parsed_spreadsheets) so that converters in the same batch never parse the same unchanged spreadsheet twice.
+
+The on-disk cache is enabled by setting SPREADSHEET_CACHE to a folder in .pet2bidsconfig or PET2BIDS_SPREADSHEET_CACHE in the
+environment, the size limit defaults to 256 MB and is set in MB with SPREADSHEET_CACHE_SIZE or
+PET2BIDS_SPREADSHEET_CACHE_SIZE. As entries are pickles the cache folder shouldn't be writable by anyone else.
+
+| *Authors: Anthony Galassi*
+| *Copyright OpenNeuroPET team*
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import dotenv
+
+config_path = Path.home() / ".pet2bidsconfig"
+
+default_max_megabytes = 256
+
+# spreadsheets are hashed once per process unless their size or modification time changes
+_content_hashes = {}
+_content_hashes_lock = threading.Lock()
+
+
+def content_hash(path) -> str:
+    """
+    Hashes the contents of a file, hashes are remembered for the life of the process until the file's size or
+    modification time changes.
+
+    :param path: path to a file
+    :return: the hash of the file's contents
+    """
+    path = Path(path).absolute()
+    stat = path.stat()
+    stamp = (str(path), stat.st_size, stat.st_mtime_ns)
+    with _content_hashes_lock:
+        known = _content_hashes.get(stamp)
+    if known:
+        return known
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as infile:
+        for block in iter(lambda: infile.read(1 << 20), b""):
+            digest.update(block)
+    with _content_hashes_lock:
+        _content_hashes[stamp] = digest.hexdigest()
+    return _content_hashes[stamp]
+
+
+class SpreadsheetCache:
+    """
+    A folder of pickled entries with least recently used eviction, see the module documentation.
+
+    :param folder: folder the entries are kept in, it's created if it doesn't exist
+    :param max_bytes: size the cache is trimmed to after every new entry
+    """
+
+    suffix = ".pickle"
+
+    def __init__(self, folder, max_bytes: int = default_max_megabytes * 1024**2):
+        self.folder = Path(folder).expanduser()
+        self.max_bytes = max_bytes
+        self.folder.mkdir(parents=True, exist_ok=True)
+
+    def key(self, path, kind: str, **options) -> str:
+        """
+        Builds the key of an entry from the contents of a spreadsheet, the kind of entry, and the options used to
+        produce it.
+
+        :param path: path to the spreadsheet
+        :param kind: what's cached, e.g. 'dataframe' or 'metadata'
+        :param options: any other values the entry depends on, must be json serializable
+        :return: the key
+        """
+        return hashlib.blake2b(
+            json.dumps(
+                [content_hash(path), kind, options], sort_keys=True, default=str
+            ).encode(),
+            digest_size=16,
+        ).hexdigest()
+
+    def get(self, key: str):
+        """
+        :param key: key of the entry
+        :return: the cached value or None if there isn't one
+        """
+        entry = self.folder / (key + self.suffix)
+        try:
+            with open(entry, "rb") as infile:
+                value = pickle.load(infile)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        # the modification time of an entry is when it was last used
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return value
+
+    def put(self, key: str, value):
+        """
+        Stores a value, entries are written to a temporary file and renamed into place so concurrent readers never see
+        a partial entry.
+
+        :param key: key of the entry
+        :param value: a picklable value
+        """
+        handle, temporary = tempfile.mkstemp(dir=self.folder, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as outfile:
+                pickle.dump(value, outfile, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self.folder / (key + self.suffix))
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+        self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache is no larger than max_bytes.
+        """
+        entries = []
+        for entry in self.folder.glob("*" + self.suffix):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self):
+        for entry in self.folder.glob("*" + self.suffix):
+            entry.unlink()
+
+
+class MemoryCache:
+    """
+    A small thread safe in-process least recently used cache of parsed spreadsheets, entries are keyed by the path,
+    size, and modification time of a spreadsheet along with the options it was read with.
+
+    :param max_entries: number of entries kept
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(path, kind: str, **options) -> tuple:
+        path = Path(path).absolute()
+        stat = path.stat()
+        return (
+            str(path),
+            stat.st_size,
+            stat.st_mtime_ns,
+            kind,
+            json.dumps(options, sort_keys=True, default=str),
+        )
+
+    def get(self, key: tuple):
+        """
+        :param key: key of the entry
+        :return: a copy of the cached value (so callers are free to modify it) or None
+        """
+        with self.lock:
+            if key not in self.entries:
+                return None
+            self.entries.move_to_end(key)
+            value = self.entries[key]
+        return value.copy()
+
+    def put(self, key: tuple, value):
+        with self.lock:
+            self.entries[key] = value.copy()
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+# spreadsheets parsed by this process
+parsed_spreadsheets = MemoryCache()
+
+
+def _configured(variable: str):
+    value = os.getenv(f"PET2BIDS_{variable}")
+    if value is None and config_path.is_file():
+        value = dotenv.dotenv_values(config_path).get(variable)
+    return value
+
+
+def spreadsheet_cache():
+    """
+    Opens the cache configured in the environment or .pet2bidsconfig, see the module documentation.
+
+    :return: a SpreadsheetCache or None if caching isn't enabled
+    """
+    folder = _configured("SPREADSHEET_CACHE")
+    if not folder:
+        return None
+    try:
+        max_megabytes = float(
+            _configured("SPREADSHEET_CACHE_SIZE") or default_max_megabytes
+        )
+    except ValueError:
+        max_megabytes = default_max_megabytes
+    try:
+        return SpreadsheetCache(folder, max_bytes=int(max_megabytes * 1024**2))
+    except OSError as err:
+        logging.getLogger("pypet2bids").warning(
+            f"Unable to use spreadsheet cache at {folder}, {err}"
+        )
+        return None
@@ -0,0 +1,455 @@
+"""
+Creates synthetic ECAT files of arbitrary size for testing and benchmarking along with the image arrays that a correct
+conversion to NIfTI is expected to produce. Pixel data is generated deterministically one frame at a time from a seed,
+so any frame can be regenerated independently of the others and files much larger than available memory can be
+written (and later verified) by streaming frames to and from disk.
+
+Example:
+
+.. code-block:: python
+
+    from pypet2bids.synthetic_ecat import SyntheticEcat
+
+    synthetic = SyntheticEcat(dimensions=(128, 128, 63), number_of_frames=62, data_type=6, version=73, seed=42)
+    synthetic.write("synthetic.v")
+
+    for index, expected_frame in enumerate(synthetic.expected_nifti_frames()):
+        ...
+
+| *Authors: Anthony Galassi*
+| *Copyright OpenNeuroPET team*
+"""
+
+import argparse
+import pathlib
+from math import ceil
+
+import numpy
+
+try:
+    import helper_functions
+    from read_ecat import ecat_header_maps
+    from write_ecat import pack_header
+except ModuleNotFoundError:
+    import pypet2bids.helper_functions as helper_functions
+    from pypet2bids.read_ecat import ecat_header_maps
+    from pypet2bids.write_ecat import pack_header
+
+logger = helper_functions.logger("pypet2bids")
+
+# number of frames a single 512 byte directory block can reference
+FRAMES_PER_DIRECTORY_BLOCK = 31
+
+# ECAT 7 matrix numbers store the frame number in 9 bits
+MAX_FRAMES = 511
+
+# pixel data types as recorded in the DATA_TYPE field of image subheaders, see read_ecat.read_ecat
+pixel_data_types = {5: numpy.dtype(">f4"), 6: numpy.dtype(">i2")}
+
+# main header values copied from the skeleton ECAT used to create the golden ECAT, see golden_ecat.py
+default_main_header = {
+    "ORIGINAL_FILE_NAME": "SyntheticECAT",
+    "SYSTEM TYPE": 328,
+    "FILE_TYPE": 7,
+    "SERIAL_NUMBER": "HRRT",
+    "SCAN_START_TIME": 1556622282,
+    "ISOTOPE_NAME": "C-11",
+    "ISOTOPE_HALFLIFE": 1224.0,
+    "RADIOPHARMACEUTICAL": "unknown",
+    "TRANSM_SOURCE_TYPE": 3,
+    "DISTANCE_SCANNED": 25.2281,
+    "TRANSAXIAL_FOV": 31.2,
+    "ANGULAR_COMPRESSION": 3,
+    "COIN_SAMP_MODE": 2,
+    "ECAT_CALIBRATION_FACTOR": 1.0,
+    "CALIBRATION_UNITS": 1,
+    "CALIBRATION_UNITS_LABEL": 1,
+    "STUDY_TYPE": "Synthetic",
+    "PATIENT_ID": "PerfectPatient",
+    "PATIENT_NAME": "Majesty",
+    "PATIENT_SEX": "U",
+    "PATIENT_DEXTERITY": "U",
+    "ACQUISITION_TYPE": 4,
+    "PATIENT_ORIENTATION": 8,
+    "FACILITY_NAME": "Virtual",
+    "NUM_GATES": 1,
+    "PLANE_SEPARATION": 0.121875,
+    "LWR_TRUE_THRES": 400,
+    "UPR_TRUE_THRES": 650,
+    "BIN_SIZE": 0.121875,
+    "BRANCHING_FRACTION": 0.9976,
+    "DOSE_START_TIME": 1556622282,
+    "DOSAGE": 2.1,
+    "DATA_UNITS": "Bq/ml",
+    "SEPTA_STATE": 1,
+}
+
+# image subheader values copied from the same skeleton ECAT
+default_subheader = {
+    "NUM_DIMENSIONS": 3,
+    "X_PIXEL_SIZE": 0.121875,
+    "Y_PIXEL_SIZE": 0.121875,
+    "Z_PIXEL_SIZE": 0.121875,
+    "NUM_R_ELEMENTS": 256.0,
+    "NUM_ANGLES": 288.0,
+    "DECAY_CORR_FCTR": 1.0028342,
+    "PROCESSING_CODE": 899,
+    "SCATTER_TYPE": 2,
+    "RECON_TYPE": 99,
+    "PROMPT_RATE": 1124046.75,
+    "RANDOM_RATE": 964749.0,
+    "SINGLES_RATE": 24152.0,
+    "SCATTER_FRACTION": 0.606394,
+}
+
+
+class SyntheticEcat:
+    """
+    Describes a synthetic ECAT image, frames of pixel data are generated on demand and never held in memory together.
+
+    :param dimensions: x, y, and z dimensions of each frame
+    :param number_of_frames: number of frames, ECATs with more than 31 frames require more than one directory block
+    :param data_type: ECAT DATA_TYPE of the pixel data, 6 for 16 bit integers or 5 for 32 bit floats
+    :param version: ECAT version to write, 72 or 73
+    :param seed: seed used to generate the pixel data of every frame
+    :param scale_factor: SCALE_FACTOR written into each subheader
+    :param frame_duration: duration of each frame in seconds
+    :param pattern: 'random' for seeded random pixel values, 'ramp' for pixel values increasing along the file
+    :param ramp_step: amount the pixel values of a 'ramp' increase by from one pixel to the next
+    :param main_header: additional values to write into the main header
+    """
+
+    def __init__(
+        self,
+        dimensions: tuple = (16, 16, 16),
+        number_of_frames: int = 4,
+        data_type: int = 6,
+        version: int = 73,
+        seed: int = 0,
+        scale_factor: float = 1.0,
+        frame_duration: float = 10.0,
+        pattern: str = "random",
+        ramp_step: int = 1,
+        main_header: dict = {},
+    ):
+        if len(dimensions) != 3 or min(dimensions) < 1:
+            raise ValueError(
+                f"dimensions must be 3 positive integers, got {dimensions}"
+            )
+        if not 1 <= number_of_frames <= MAX_FRAMES:
+            raise ValueError(
+                f"number_of_frames must be between 1 and {MAX_FRAMES}, got {number_of_frames}"
+            )
+        if data_type not in pixel_data_types:
+            raise ValueError(
+                f"data_type must be one of {list(pixel_data_types)}, got {data_type}"
+            )
+        if str(version) not in ("72", "73"):
+            raise ValueError(f"version must be 72 or 73, got {version}")
+        if pattern not in ("random", "ramp"):
+            raise ValueError(f"pattern must be 'random' or 'ramp', got {pattern}")
+        if ramp_step < 1:
+            raise ValueError(f"ramp_step must be a positive integer, got {ramp_step}")
+
+        self.dimensions = tuple(int(d) for d in dimensions)
+        self.number_of_frames = number_of_frames
+        self.data_type = data_type
+        self.version = str(version)
+        self.seed = seed
+        self.scale_factor = scale_factor
+        self.frame_duration = frame_duration
+        self.pattern = pattern
+        self.ramp_step = int(ramp_step)
+        self.pixel_data_type = pixel_data_types[data_type]
+
+        self.mainheader_schema = ecat_header_maps["ecat_headers"][self.version][
+            "mainheader"
+        ]
+        self.subheader_schema = ecat_header_maps["ecat_headers"][self.version]["7"]
+
+        self.main_header = dict(default_main_header)
+        self.main_header.update(
+            {
+                "MAGIC_NUMBER": f"MATRIX{self.version}v",
+                "SW_VERSION": int(self.version),
+                "NUM_PLANES": self.dimensions[2],
+                "NUM_FRAMES": self.number_of_frames,
+            }
+        )
+        self.main_header.update(main_header)
+
+    @property
+    def frame_byte_size(self) -> int:
+        return int(numpy.prod(self.dimensions)) * self.pixel_data_type.itemsize
+
+    @property
+    def frame_block_count(self) -> int:
+        return ceil(self.frame_byte_size / 512)
+
+    def frame(self, index: int) -> numpy.ndarray:
+        """
+        Generates the pixel data of a single frame exactly as it is stored in the ECAT (before any scaling).
+
+        :param index: 0 based index of the frame
+        :return: an array of shape dimensions and dtype determined by data_type
+        """
+        volume = int(numpy.prod(self.dimensions))
+        if self.pattern == "ramp":
+            values = (
+                numpy.arange(index * volume, (index + 1) * volume, dtype=numpy.int64)
+                * self.ramp_step
+            )
+            if self.data_type == 6:
+                values = values % 32767
+            else:
+                values = values * 0.5
+        else:
+            rng = numpy.random.default_rng([self.seed, index])
+            if self.data_type == 6:
+                values = rng.integers(0, 32767, size=volume, dtype=numpy.int16)
+            else:
+                values = rng.random(volume, dtype=numpy.float32) * 1000
+        return values.astype(self.pixel_data_type.newbyteorder("=")).reshape(
+            self.dimensions, order="F"
+        )
+
+    def frames(self):
+        """
+        Yields the pixel data of each frame in order, see frame.
+        """
+        for index in range(self.number_of_frames):
+            yield self.frame(index)
+
+    def subheader(self, index: int, frame: numpy.ndarray = None) -> dict:
+        """
+        Creates the image subheader of a single frame.
+
+        :param index: 0 based index of the frame
+        :param frame: the pixel data of the frame, generated if not supplied
+        :return: subheader values with times in seconds, as they are returned by read_ecat
+        """
+        if frame is None:
+            frame = self.frame(index)
+        subheader = dict(default_subheader)
+        subheader.update(
+            {
+                "DATA_TYPE": self.data_type,
+                "X_DIMENSION": self.dimensions[0],
+                "Y_DIMENSION": self.dimensions[1],
+                "Z_DIMENSION": self.dimensions[2],
+                "SCALE_FACTOR": self.scale_factor,
+                "IMAGE_MIN": int(numpy.clip(numpy.floor(frame.min()), -32768, 32767)),
+                "IMAGE_MAX": int(numpy.clip(numpy.ceil(frame.max()), -32768, 32767)),
+                "FRAME_START_TIME": index * self.frame_duration,
+                "FRAME_DURATION": self.frame_duration,
+                "ANNOTATION": f"Synthetic frame {index + 1}",
+            }
+        )
+        return subheader
+
+    def expected_nifti_frame(self, index: int) -> numpy.ndarray:
+        """
+        The frame as it is expected to appear in a NIfTI converted from this ECAT: scaled by SCALE_FACTOR (and
+        ECAT_CALIBRATION_FACTOR when CALIBRATION_UNITS is 1) and flipped along all three axes, see ecat2nii.ecat2nii.
+        Note that ecat2nii rescales the image into 16 bits, so converted values may differ from these by about half of
+        that rescaling step.
+
+        :param index: 0 based index of the frame
+        :return: a float32 array of shape dimensions
+        """
+        expected = self.frame(index).astype(numpy.float64) * self.scale_factor
+        if self.main_header.get("CALIBRATION_UNITS") == 1:
+            expected = expected * self.main_header["ECAT_CALIBRATION_FACTOR"]
+        return numpy.flip(expected, axis=(0, 1, 2)).astype(numpy.float32)
+
+    def expected_nifti_frames(self):
+        """
+        Yields the expected NIfTI array of each frame in order, see expected_nifti_frame.
+        """
+        for index in range(self.number_of_frames):
+            yield self.expected_nifti_frame(index)
+
+    def expected_nifti_array(self, output_path=None) -> numpy.ndarray:
+        """
+        Assembles the expected 4D NIfTI array. If an output path is supplied the array is streamed into a .npy file
+        backed by a memory map instead of being held in memory.
+
+        :param output_path: optional path to a .npy file to write the array to
+        :return: an array of shape (x, y, z, number_of_frames)
+        """
+        shape = (*self.dimensions, self.number_of_frames)
+        if output_path:
+            expected = numpy.lib.format.open_memmap(
+                output_path, mode="w+", dtype=numpy.float32, shape=shape
+            )
+        else:
+            expected = numpy.zeros(shape, dtype=numpy.float32)
+        for index, frame in enumerate(self.expected_nifti_frames()):
+            expected[..., index] = frame
+        if output_path:
+            expected.flush()
+        return expected
+
+    def directory_blocks(self) -> list:
+        """
+        Determines where each directory block, subheader, and frame of pixel data lives in the file. Block numbers
+        follow the ECAT convention of counting 512 byte blocks starting at 1, the main header occupies block 1 and
+        the first directory block is block 2. Each directory block references up to 31 frames, additional directory
+        blocks are placed directly after the last frame referenced by the previous directory block.
+
+        :return: a list of (block number, 4 x 32 directory table) tuples
+        """
+        tables, block_numbers = [], []
+        next_free_block = 3
+        for chunk_start in range(0, self.number_of_frames, FRAMES_PER_DIRECTORY_BLOCK):
+            chunk = range(
+                chunk_start,
+                min(chunk_start + FRAMES_PER_DIRECTORY_BLOCK, self.number_of_frames),
+            )
+            if chunk_start == 0:
+                block_numbers.append(2)
+            else:
+                block_numbers.append(next_free_block)
+                next_free_block += 1
+
+            table = numpy.zeros((4, 32), dtype=">i4")
+            table[0, 0] = FRAMES_PER_DIRECTORY_BLOCK - len(chunk)
+            table[3, 0] = len(chunk)
+            for column, frame_index in enumerate(chunk, start=1):
+                # matrix number for frame, plane 1, gate 1, data 0, bed 0
+                table[0, column] = (frame_index + 1) | (1 << 16) | (1 << 24)
+                table[1, column] = next_free_block
+                table[2, column] = next_free_block + self.frame_block_count
+                table[3, column] = 1
+                next_free_block += self.frame_block_count + 1
+            tables.append(table)
+
+        # directory blocks form a circular linked list, the last block points back to the first at block 2
+        for i, table in enumerate(tables):
+            table[1, 0] = block_numbers[(i + 1) % len(tables)]
+            table[2, 0] = block_numbers[i - 1]
+
+        return list(zip(block_numbers, tables))
+
+    def write(self, ecat_file) -> pathlib.Path:
+        """
+        Writes the synthetic ECAT to disk, frames are generated and written one at a time.
+
+        :param ecat_file: path to write the ECAT to
+        :return: the path of the written file
+        """
+        ecat_file = pathlib.Path(ecat_file)
+        frame_padding = bytes(self.frame_block_count * 512 - self.frame_byte_size)
+
+        with open(ecat_file, "wb") as outfile:
+            outfile.write(pack_header(self.mainheader_schema, self.main_header))
+            for block_number, table in self.directory_blocks():
+                if outfile.tell() != (block_number - 1) * 512:
+                    raise Exception(
+                        f"Directory block {block_number} misplaced at byte {outfile.tell()} of {ecat_file}"
+                    )
+                outfile.write(table.T.tobytes())
+                for column in range(1, table[3, 0] + 1):
+                    frame_index = (table[0, column] & 0x1FF) - 1
+                    frame = self.frame(frame_index)
+                    outfile.write(
+                        pack_header(
+                            self.subheader_schema, self.subheader(frame_index, frame)
+                        )
+                    )
+                    outfile.write(frame.astype(self.pixel_data_type).tobytes(order="F"))
+                    outfile.write(frame_padding)
+
+        logger.info(
+            f"Wrote synthetic ECAT {self.version} with {self.number_of_frames} frames of "
+            f"{self.dimensions} to {ecat_file}"
+        )
+        return ecat_file
+
+
+def cli():
+    parser = argparse.ArgumentParser(
+        description="Create a synthetic ECAT file of arbitrary size along with the array a NIfTI converted from it "
+        "is expected to contain."
+    )
+    parser.add_argument("ecat_file", type=str, help="path to write the ECAT file to")
+    parser.add_argument(
+        "--dimensions",
+        "-d",
+        type=int,
+        nargs=3,
+        default=[16, 16, 16],
+        metavar=("X", "Y", "Z"),
+        help="dimensions of each frame, default is 16 16 16",
+    )
+    parser.add_argument(
+        "--frames", "-f", type=int, default=4, help="number of frames, default is 4"
+    )
+    parser.add_argument(
+        "--data-type",
+        type=int,
+        choices=sorted(pixel_data_types),
+        default=6,
+        help="ECAT DATA_TYPE, 6 for int16 or 5 for float32 pixel data, default is 6",
+    )
+    parser.add_argument(
+        "--ecat-version",
+        type=int,
+        choices=[72, 73],
+        default=73,
+        help="ECAT version to write, default is 73",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="seed for the pixel data, default is 0"
+    )
+    parser.add_argument(
+        "--scale-factor",
+        type=float,
+        default=1.0,
+        help="SCALE_FACTOR written to each subheader, default is 1.0",
+    )
+    parser.add_argument(
+        "--pattern",
+        choices=["random", "ramp"],
+        default="random",
+        help="random pixel values or values increasing along the file, default is random",
+    )
+    parser.add_argument(
+        "--ramp-step",
+        type=int,
+        default=1,
+        help="amount pixel values increase by from one pixel to the next with --pattern ramp, default is 1",
+    )
+    parser.add_argument(
+        "--expected-nifti",
+        type=str,
+        default=None,
+        help="optional path to a .npy file to write the expected NIfTI array to",
+    )
+    parser.add_argument(
+        "--main-header",
+        nargs="*",
+        action=helper_functions.ParseKwargs,
+        default={},
+        help="additional main header values, e.g. PATIENT_NAME=Nobody",
+    )
+    args = parser.parse_args()
+
+    synthetic = SyntheticEcat(
+        dimensions=args.dimensions,
+        number_of_frames=args.frames,
+        data_type=args.data_type,
+        version=args.ecat_version,
+        seed=args.seed,
+        scale_factor=args.scale_factor,
+        pattern=args.pattern,
+        ramp_step=args.ramp_step,
+        main_header=args.main_header,
+    )
+    synthetic.write(args.ecat_file)
+    if args.expected_nifti:
+        synthetic.expected_nifti_array(args.expected_nifti)
+
+
+if __name__ == "__main__":
+    cli()
@@ -3,7 +3,11 @@
 from pathlib import Path
 from os.path import join
 from os import listdir
+import os
+import copy
 import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from json_maj.main import JsonMAJ, load_json_or_dict
 import re
 from dateutil import parser
@@ -15,15 +19,9 @@ from pandas import Timestamp
 
 try:
     import helper_functions
-    # The import of is_pet is deferred to get_metadata_from_spreadsheet() to 
-    # prevent circular import
-    #import is_pet
     import pet_metadata as metadata
 except ModuleNotFoundError:
     import pypet2bids.helper_functions as helper_functions
-    # The import of is_pet is deferred to get_metadata_from_spreadsheet() to 
-    # prevent circular import
-    #import pypet2bids.is_pet as is_pet
     import pypet2bids.pet_metadata as metadata
 
 # import logging
@@ -55,7 +53,8 @@ def check_json(
 
     :param spreadsheet_metadata:
     :type spreadsheet_metadata:
-    :param path_to_json: path to a json file e.g. a BIDS sidecar file created after running dcm2niix
+    :param path_to_json: path to a json file e.g. a BIDS sidecar file created after running dcm2niix, or the contents of
+           that json as a dictionary
     :param items_to_check: a dictionary with items to check for within that json. If None is supplied defaults to the
            PET_metadata imported from pet_metadata.PET_metadata
     :param silent: Raises warnings or errors to stdout if this flag is set to True
@@ -70,10 +69,18 @@ def check_json(
     else:
         logger.disabled = False
 
-    # check if path exists
-    path_to_json = Path(path_to_json)
-    if not path_to_json.exists():
-        raise FileNotFoundError(path_to_json)
+    # a sidecar that's already been loaded can be checked as is
+    if isinstance(path_to_json, dict):
+        json_to_check = path_to_json
+        path_to_json = "sidecar"
+    else:
+        # check if path exists
+        path_to_json = Path(path_to_json)
+        if not path_to_json.exists():
+            raise FileNotFoundError(path_to_json)
+        # open the json
+        with open(path_to_json, "r") as in_file:
+            json_to_check = json.load(in_file)
 
     # check for default argument for dictionary of items to check
     if items_to_check is None:
@@ -82,10 +89,6 @@ def check_json(
         if items_to_check.get("blood_recording_fields", None):
             items_to_check.pop("blood_recording_fields")
 
-    # open the json
-    with open(path_to_json, "r") as in_file:
-        json_to_check = json.load(in_file)
-
     # initialize warning colors and warning storage dictionary
     storage = {}
     flattened_spreadsheet_metadata = {}
@@ -160,8 +163,8 @@ def update_json_with_dicom_value(
 ):
     """
     We go through all the missing values or keys that we find in the sidecar json and attempt to extract those
-    missing entities from the dicom source. This function relies on many heuristics a.k.a. many unique conditionals and
-    simply is what it is, hate the game not the player.
+    missing entities from the dicom source. See add_dicom_values for the details, this loads the sidecar, adds the
+    values found in the dicom header and writes it back out once.
 
     :param path_to_json: path to the sidecar json to check
     :param missing_values: dictionary output from check_json indicating missing fields and/or values
@@ -176,13 +179,42 @@ def update_json_with_dicom_value(
     if silent:
         logger.disabled = True
 
-    json_sidecar_path = Path(path_to_json)
-    if not json_sidecar_path.exists():
-        with open(path_to_json, "w") as outfile:
-            json.dump({}, outfile)
+    sidecar = SidecarBuilder(path_to_json)
+    add_dicom_values(
+        sidecar,
+        missing_values,
+        dicom_header,
+        dicom2bids_json=dicom2bids_json,
+        ezbids=ezbids,
+        **additional_arguments,
+    )
+    sidecar.write()
+    return sidecar.layers["header"]
 
-    # load the sidecar json
-    sidecar_json = load_json_or_dict(str(path_to_json))
+
+def add_dicom_values(
+    sidecar,
+    missing_values,
+    dicom_header,
+    dicom2bids_json=None,
+    ezbids=False,
+    **additional_arguments,
+):
+    """
+    Fills the header layer of a SidecarBuilder with values extracted from the dicom header for any fields check_json
+    found missing. This function relies on many heuristics a.k.a. many unique conditionals and simply is what it is,
+    hate the game not the player.
+
+    :param sidecar: the SidecarBuilder of the sidecar being created
+    :param missing_values: dictionary output from check_json indicating missing fields and/or values
+    :param dicom_header: the dicom or dicoms that may contain information not picked up by dcm2niix
+    :param dicom2bids_json: a json file that maps dicom header entities to their corresponding BIDS entities
+    :param ezbids: boolean to supply additional data that ezbids or other software requires, defaults to false. When
+    true the sidecar json will be updated with AcquisitionDate, AcquisitionTime, and AcquisitionDateTime
+    :return: the updated SidecarBuilder
+    """
+    # the sidecar as it was before any dicom values were added
+    sidecar_json = sidecar.data
 
     # purely to clean up the generated read the docs page from sphinx, otherwise the entire json appears in the
     # read the docs page.
@@ -195,12 +227,10 @@ def update_json_with_dicom_value(
         try:
             # Units is missing, check to see if Unit is present
             if sidecar_json.get("Unit", None):
-                temp = JsonMAJ(
-                    path_to_json, {"Units": sidecar_json.get("Unit")}, bids_null=True
-                )
-                temp.remove("Unit")
+                sidecar.update("header", {"Units": sidecar_json.get("Unit")})
+                sidecar.remove("Unit")
             else:  # we source the Units value from the dicom header and update the json
-                JsonMAJ(path_to_json, {"Units": dicom_header.Units}, bids_null=True)
+                sidecar.update("header", {"Units": dicom_header.Units})
         except AttributeError:
             logger.error(
                 f"Dicom is missing Unit(s) field, are you sure this is a PET dicom?"
@@ -220,7 +250,6 @@ def update_json_with_dicom_value(
 
     logger.info("Attempting to locate missing BIDS fields in dicom header")
     # go through missing fields and reach into dicom to pull out values
-    json_updater = JsonMAJ(json_path=path_to_json, bids_null=True)
     for key, value in paired_fields.items():
         missing_bids_field = missing_values.get(key, None)
         # if field is missing look into dicom
@@ -239,19 +268,19 @@ def update_json_with_dicom_value(
             if dicom_field and value in regex_cases:
                 # if it exists get rid of it, we don't want no part of it.
                 if sidecar_json.get("ReconMethodName", None):
-                    json_updater.remove("ReconstructionMethod")
+                    sidecar.remove("ReconstructionMethod")
                 if dicom_header.get("ReconstructionMethod", None):
                     reconstruction_method = dicom_header.ReconstructionMethod
-                    json_updater.remove("ReconstructionMethod")
+                    sidecar.remove("ReconstructionMethod")
                     reconstruction_method = helper_functions.get_recon_method(
                         reconstruction_method
                     )
 
-                    json_updater.update(reconstruction_method)
+                    sidecar.update("header", reconstruction_method)
 
             elif dicom_field:
                 # update json
-                json_updater.update({key: dicom_field})
+                sidecar.update("header", {key: dicom_field})
 
     # Additional Heuristics are included below
 
@@ -275,9 +304,9 @@ def update_json_with_dicom_value(
                     .strftime("%H:%M:%S")
                 )
 
-            json_updater.update({"TimeZero": acquisition_time})
-            json_updater.remove("AcquisitionTime")
-            json_updater.update({"ScanStart": 0})
+            sidecar.update("header", {"TimeZero": acquisition_time})
+            sidecar.remove("AcquisitionTime")
+            sidecar.update("header", {"ScanStart": 0})
         else:
             pass
 
@@ -286,26 +315,25 @@ def update_json_with_dicom_value(
             missing_values.get("ScanStart")["key"] is False
             or missing_values.get("ScanStart")["value"] is False
         ):
-            json_updater.update({"ScanStart": 0})
+            sidecar.update("header", {"ScanStart": 0})
     if missing_values.get("InjectionStart", None):
         if (
             missing_values.get("InjectionStart")["key"] is False
             or missing_values.get("InjectionStart")["value"] is False
         ):
-            json_updater.update({"InjectionStart": 0})
+            sidecar.update("header", {"InjectionStart": 0})
 
     # check to see if units are BQML
-    json_updater = JsonMAJ(str(path_to_json), bids_null=True)
-    if json_updater.get("Units") == "BQML":
-        json_updater.update({"Units": "Bq/mL"})
+    if sidecar.get("Units") == "BQML":
+        sidecar.update("header", {"Units": "Bq/mL"})
 
     # Add radionuclide to json
     Radionuclide = get_radionuclide(dicom_header)
     if Radionuclide:
-        json_updater.update({"TracerRadionuclide": Radionuclide})
+        sidecar.update("header", {"TracerRadionuclide": Radionuclide})
 
     # remove scandate if it exists
-    json_updater.remove("ScanDate")
+    sidecar.remove("ScanDate")
 
     # lastly if ezbids is true update the sidecar with acquisition data
     if ezbids:
@@ -317,16 +345,17 @@ def update_json_with_dicom_value(
             )
         else:
             acquisition_datetime = "0000-00-00T00:00:00"
-        json_updater.update(
+        sidecar.update(
+            "header",
             {
                 "AcquisitionDate": f"{acquisition_date.date()}",
                 "AcquisitionTime": f"{acquisition_time.time()}",
                 "AcquisitionDateTime": f"{acquisition_datetime.isoformat()}",
-            }
+            },
         )
 
     # after updating raise warnings to user if values in json don't match values in dicom headers, only warn!
-    updated_values = json.load(open(path_to_json, "r"))
+    updated_values = sidecar.data
     for key, value in paired_fields.items():
         try:
             json_field = updated_values.get(key)
@@ -339,6 +368,8 @@ def update_json_with_dicom_value(
         except AttributeError:
             pass
 
+    return sidecar
+
 
 def update_json_with_dicom_value_cli():
     """
@@ -746,6 +777,250 @@ def check_meta_radio_inputs(kwargs: dict, logger="pypet2bids") -> dict:
     return data_out
 
 
+# sources of sidecar values ordered from lowest to highest precedence
+sidecar_layers = ["base", "header", "derived", "spreadsheet", "kwargs"]
+
+
+def _bids_null(value):
+    # BIDS wants the string none where json would have a null
+    if value is None:
+        return "none"
+    elif isinstance(value, dict):
+        return {key: _bids_null(item) for key, item in value.items()}
+    elif isinstance(value, list):
+        return [_bids_null(item) for item in value]
+    return value
+
+
+def write_sidecar(path: Union[str, Path], sidecar: dict, indent: int = 4) -> Path:
+    """
+    Writes a sidecar dictionary to a json file atomically, the json is written to a temporary file next to the
+    destination and then renamed over it so the destination is never left partially written.
+
+    :param path: path to the json file
+    :param sidecar: the sidecar dictionary to write
+    :param indent: indentation of the written json
+    :return: the path of the written file
+    """
+    path = Path(path)
+    descriptor, temporary_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(descriptor, "w") as outfile:
+            json.dump(sidecar, outfile, indent=indent, default=str)
+        os.replace(temporary_path, path)
+    except BaseException:
+        Path(temporary_path).unlink(missing_ok=True)
+        raise
+    return path
+
+
+def sidecar_changes(before: dict, after: dict) -> dict:
+    """
+    Lists the fields added to and changed in a sidecar.
+
+    :param before: the sidecar before an update
+    :param after: the sidecar after an update
+    :return: a dictionary of added fields and their values and of changed fields with their [old, new] values
+    """
+    return {
+        "added": {key: value for key, value in after.items() if key not in before},
+        "changed": {
+            key: [before[key], value]
+            for key, value in after.items()
+            if key in before and before[key] != value
+        },
+    }
+
+
+def _update_sidecar(path: Path, updates: list, dry_run: bool, bids_null: bool, indent):
+    try:
+        with open(path, "r") as infile:
+            before = json.load(infile)
+        created = False
+    except FileNotFoundError:
+        before, created = {}, True
+    except ValueError:
+        # unreadable jsons are replaced, as JsonMAJ does
+        before, created = {}, False
+
+    merged = dict(before)
+    for values in updates:
+        merged.update(values)
+    if bids_null:
+        merged = _bids_null(merged)
+    # compare what would be written rather than python values e.g. dates are written as strings
+    merged = json.loads(json.dumps(merged, default=str))
+
+    report = {"path": str(path), "created": created, **sidecar_changes(before, merged)}
+    report["written"] = False
+    if not dry_run and (created or report["added"] or report["changed"]):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_sidecar(path, merged, indent=indent)
+        report["written"] = True
+    return report
+
+
+def write_sidecars(
+    updates,
+    n_jobs: int = None,
+    dry_run: bool = False,
+    bids_null: bool = False,
+    indent: int = 4,
+) -> list:
+    """
+    Updates many sidecars at once, e.g. when pushing a spreadsheet into an existing BIDS dataset. Updates are grouped
+    by file so each sidecar is read, merged, and written atomically (see write_sidecar) exactly once, with files
+    updated in parallel by a pool of threads. Sidecars that wouldn't change aren't rewritten.
+
+    :param updates: iterable of (path, values) pairs, values for the same path are applied in order
+    :param n_jobs: number of threads, defaults to the number of cpus + 4 up to 32
+    :param dry_run: report what would change without writing anything
+    :param bids_null: replace null values with "none"
+    :param indent: indentation of the written json
+    :return: a report per sidecar with its path, whether it's created, the fields added and changed, and whether it
+        was written, in the order the sidecars first appear in updates
+    """
+    grouped = {}
+    for path, values in updates:
+        grouped.setdefault(Path(path), []).append(values)
+
+    n_jobs = n_jobs or min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        reports = list(
+            executor.map(
+                lambda item: _update_sidecar(
+                    item[0], item[1], dry_run, bids_null, indent
+                ),
+                grouped.items(),
+            )
+        )
+    return reports
+
+
+class SidecarBuilder:
+    """
+    Assembles a BIDS sidecar in memory from layers of values, where each layer overrides the ones before it:
+
+        - base: the json written by dcm2niix or an empty template
+        - header: values collected from the dicom or ecat header
+        - derived: values inferred by this library e.g. radio inputs or filter sizes
+        - spreadsheet: values from a metadata spreadsheet
+        - kwargs: values supplied by the user
+
+    Nothing is written until write is called, at which point the merged sidecar is written once.
+
+    :param base: a path to a json to load as the base layer or a dictionary
+    :param bids_null: replace null values with "none" when building the sidecar
+    """
+
+    def __init__(self, base: Union[str, Path, dict] = None, bids_null: bool = True):
+        self.json_path = None
+        if isinstance(base, (str, Path)):
+            self.json_path = Path(base)
+            base = load_json_or_dict(str(base))
+        self.layers = {layer: {} for layer in sidecar_layers}
+        # templates are shared module level dictionaries, a copy keeps them clean
+        self.layers["base"] = copy.deepcopy(base) if base else {}
+        self.bids_null = bids_null
+        self.normalizers = []
+
+    def update(self, layer: str, values: dict):
+        """
+        :param layer: one of sidecar_layers
+        :param values: values to add to or replace in that layer
+        """
+        if layer not in self.layers:
+            raise ValueError(f"layer must be one of {sidecar_layers}, got {layer}")
+        if values:
+            self.layers[layer].update(values)
+
+    def remove(self, *keys):
+        """
+        Removes keys from the base, header, and derived layers, values supplied by a user via a spreadsheet or kwargs
+        are never removed.
+        """
+        for layer in sidecar_layers[: sidecar_layers.index("spreadsheet")]:
+            for key in keys:
+                self.layers[layer].pop(key, None)
+
+    def get(self, key, default=None):
+        for layer in reversed(sidecar_layers):
+            if key in self.layers[layer]:
+                return self.layers[layer][key]
+        return default
+
+    @property
+    def data(self) -> dict:
+        """
+        :return: the merged layers, without normalizers applied
+        """
+        merged = {}
+        for layer in sidecar_layers:
+            merged.update(self.layers[layer])
+        return merged
+
+    def add_normalizer(self, normalizer):
+        """
+        Registers a function that is run on the fully merged sidecar when it's built, these are for adjustments that
+        must apply regardless of which layer a value came from e.g. forcing a value into a list.
+
+        :param normalizer: a function accepting the merged sidecar and returning a dictionary of values to update it with
+        """
+        self.normalizers.append(normalizer)
+
+    def apply_radio_inputs(self):
+        """
+        Runs check_meta_radio_inputs over the merged sidecar and stores the result in the derived layer.
+        """
+        self.update("derived", check_meta_radio_inputs(self.data))
+
+    def build(self) -> dict:
+        """
+        :return: the merged sidecar with normalizers applied
+        """
+        sidecar = self.data
+        for normalizer in self.normalizers:
+            sidecar.update(normalizer(sidecar) or {})
+        if self.bids_null:
+            sidecar = _bids_null(sidecar)
+        return sidecar
+
+    def prune(self, keep: list = []) -> list:
+        """
+        Removes fields that have no value (None, an empty string, or a list of Nones) from every layer.
+
+        :param keep: fields to keep even if they have no value e.g. required fields
+        :return: the values of the removed fields
+        """
+        removed = []
+        for field, value in self.build().items():
+            if field in keep:
+                continue
+            if (
+                value is None
+                or value == ""
+                or (isinstance(value, list) and value.count(None) == len(value))
+            ):
+                removed.append(value)
+                for layer in self.layers.values():
+                    layer.pop(field, None)
+        return removed
+
+    def write(self, path: Union[str, Path] = None, indent: int = 4) -> Path:
+        """
+        :param path: where to write the sidecar, defaults to the json the base layer was loaded from
+        :return: the path of the written file
+        """
+        path = path or self.json_path
+        if path is None:
+            raise ValueError(
+                "a path is required when the sidecar wasn't loaded from a file"
+            )
+        return write_sidecar(path, self.build(), indent=indent)
+
+
 def get_metadata_from_spreadsheet(
     metadata_path: Union[str, Path],
     image_folder,
@@ -767,12 +1042,6 @@ def get_metadata_from_spreadsheet(
     :return: dictionary of metadata
     :rtype: dict
     """
-    # Import is_pet here to avoid circular import
-    try:
-        import is_pet
-    except ModuleNotFoundError:
-        import pypet2bids.is_pet as is_pet
-
     spreadsheet_metadata = {"nifti_json": {}, "blood_json": {}, "blood_tsv": {}}
     spreadsheet_values = {}
     if Path(metadata_path).is_file():
@@ -790,15 +1059,23 @@ def get_metadata_from_spreadsheet(
             metadata_path = image_folder
 
         spreadsheets = helper_functions.collect_spreadsheets(metadata_path)
-        pet_spreadsheets = [
-            spreadsheet for spreadsheet in spreadsheets if is_pet.pet_file(spreadsheet)
+        pet_fields = [
+            field
+            for field_level in metadata.PET_metadata.values()
+            for field in field_level
         ]
-        spread_sheet_values = {}
 
-        for pet_spreadsheet in pet_spreadsheets:
+        for spreadsheet in spreadsheets:
+            # each spreadsheet is parsed once, it's classified by its columns here and single_spreadsheet_reader
+            # collects its metadata from the same parsed dataframe (see spreadsheet_cache.parsed_spreadsheets)
+            columns = helper_functions.open_meta_data(
+                spreadsheet, usecols=pet_fields
+            ).columns
+            if not set(pet_fields) & set(columns):
+                continue
             spreadsheet_values.update(
                 helper_functions.single_spreadsheet_reader(
-                    path_to_spreadsheet=pet_spreadsheet,
+                    path_to_spreadsheet=spreadsheet,
                     dicom_metadata=image_header_dict,
                     **additional_arguments,
                 )
@@ -0,0 +1,414 @@
+"""
+Validates the PET and blood sidecars of a BIDS dataset against the BIDS PET schema bundled in pet_metadata. The schema
+definition of every metadata field is compiled once per process into a validator that checks the field's type,
+format (e.g. units and times), enumerated values, numeric limits, and array lengths, and the arrays that hold a value
+per frame (FrameDuration, FrameTimesStart, ScaleFactor, etc.) are checked against the number of frames in the
+sidecar's image. Sidecars are validated in a pool of processes and the results are written out as a machine-readable
+json report.
+
+Example:
+
+.. code-block:: bash
+
+    pet2bids-validate /data/bids_dataset --report validation.json --njobs 8
+
+| *Authors: Anthony Galassi*
+| *Copyright OpenNeuroPET team*
+"""
+
+import argparse
+import functools
+import json
+import os
+import pathlib
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import nibabel
+
+try:
+    import helper_functions
+    import pet_metadata as metadata
+except ModuleNotFoundError:
+    import pypet2bids.helper_functions as helper_functions
+    import pypet2bids.pet_metadata as metadata
+
+logger = helper_functions.logger("pypet2bids")
+
+# suffixes of the sidecars that are validated and the kind of each sidecar
+SIDECAR_SUFFIXES = {"_pet.json": "pet", "_blood.json": "blood"}
+
+# fields holding a value for each frame of a PET image
+FRAME_FIELDS = [
+    "FrameTimesStart",
+    "FrameDuration",
+    "ScaleFactor",
+    "ScatterFraction",
+    "DecayCorrectionFactor",
+    "PromptRate",
+    "RandomRate",
+    "SinglesRate",
+]
+
+# folders that aren't part of the raw dataset
+SKIPPED_FOLDERS = {"derivatives", "sourcedata", "code", ".git"}
+
+FORMATS = {
+    "time": re.compile(r"^\d{2}:\d{2}:\d{2}(\.\d+)?$"),
+    "date": re.compile(r"^\d{4}-\d{2}-\d{2}$"),
+    "datetime": re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?$"),
+    "unit": re.compile(r"^\S+$"),
+}
+
+TYPES = {
+    "string": lambda value: isinstance(value, str),
+    "number": lambda value: isinstance(value, (int, float))
+    and not isinstance(value, bool),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "array": lambda value: isinstance(value, list),
+    "object": lambda value: isinstance(value, dict),
+}
+
+
+def compile_field(name: str, properties: dict):
+    """
+    Compiles the schema definition of a metadata field into a validator.
+
+    :param name: name of the field, used in error messages
+    :param properties: the field's definition from schema["objects"]["metadata"] or one of its items or alternatives
+    :return: a callable taking a value and returning a list of errors, the list is empty for valid values
+    """
+    if "anyOf" in properties:
+        alternatives = [compile_field(name, option) for option in properties["anyOf"]]
+
+        def any_of(value):
+            errors = []
+            for alternative in alternatives:
+                alternative_errors = alternative(value)
+                if not alternative_errors:
+                    return []
+                errors.extend(alternative_errors)
+            return [f"{name} doesn't match any allowed form: {'; '.join(errors)}"]
+
+        return any_of
+
+    expected_type = properties.get("type")
+    is_type = TYPES.get(expected_type, lambda value: True)
+    checks = []
+    if "enum" in properties:
+        allowed = properties["enum"]
+        checks.append(
+            lambda value: (
+                None
+                if value in allowed
+                else f"{name} is {value!r}, expected one of {allowed}"
+            )
+        )
+    if "minimum" in properties:
+        minimum = properties["minimum"]
+        checks.append(
+            lambda value: (
+                None
+                if value >= minimum
+                else f"{name} is {value}, expected at least {minimum}"
+            )
+        )
+    if "exclusiveMinimum" in properties:
+        minimum = properties["exclusiveMinimum"]
+        checks.append(
+            lambda value: (
+                None
+                if value > minimum
+                else f"{name} is {value}, expected more than {minimum}"
+            )
+        )
+    if "maximum" in properties:
+        maximum = properties["maximum"]
+        checks.append(
+            lambda value: (
+                None
+                if value <= maximum
+                else f"{name} is {value}, expected at most {maximum}"
+            )
+        )
+    if "minItems" in properties:
+        min_items = properties["minItems"]
+        checks.append(
+            lambda value: (
+                None
+                if len(value) >= min_items
+                else f"{name} has {len(value)} items, expected at least {min_items}"
+            )
+        )
+    if "maxItems" in properties:
+        max_items = properties["maxItems"]
+        checks.append(
+            lambda value: (
+                None
+                if len(value) <= max_items
+                else f"{name} has {len(value)} items, expected at most {max_items}"
+            )
+        )
+    if properties.get("format") in FORMATS:
+        pattern, format_name = FORMATS[properties["format"]], properties["format"]
+        checks.append(
+            lambda value: (
+                None
+                if pattern.match(value)
+                else f"{name} is {value!r}, expected a {format_name}"
+            )
+        )
+    item_validator = None
+    if "items" in properties:
+        item_validator = compile_field(f"{name} item", properties["items"])
+
+    def validate(value):
+        if value is None:
+            return [f"{name} has no value"]
+        if not is_type(value):
+            return [f"{name} is {value!r}, expected a {expected_type}"]
+        errors = [error for error in (check(value) for check in checks) if error]
+        if item_validator:
+            for index, item in enumerate(value):
+                errors.extend(
+                    f"{error} (index {index})" for error in item_validator(item)
+                )
+        return errors
+
+    return validate
+
+
+@functools.lru_cache(maxsize=None)
+def field_validators() -> dict:
+    """
+    Compiles every metadata field in the BIDS schema, fields are compiled once per process.
+
+    :return: a dictionary of field names and their validators
+    """
+    return {
+        name: compile_field(name, properties)
+        for name, properties in metadata.schema["objects"]["metadata"].items()
+    }
+
+
+def required_fields(kind: str, sidecar: dict) -> list:
+    """
+    Lists the fields a sidecar is required to have, groups of fields nested in the list of mandatory fields are only
+    required when the field preceding them is true (e.g. MetaboliteMethod when MetaboliteAvail is true).
+
+    :param kind: 'pet' or 'blood'
+    :param sidecar: the contents of the sidecar
+    :return: list of required field names
+    """
+    if kind == "blood":
+        mandatory = metadata.blood_metadata["mandatory"]
+    else:
+        mandatory = metadata.PET_metadata["mandatory"]
+    required = []
+    for index, entry in enumerate(mandatory):
+        if isinstance(entry, list):
+            if index > 0 and sidecar.get(mandatory[index - 1]) is True:
+                required.extend(entry)
+        else:
+            required.append(entry)
+    return required
+
+
+def image_frames(sidecar_path: pathlib.Path):
+    """
+    Reads the number of frames from the header of the image a PET sidecar describes, only the header is read.
+
+    :param sidecar_path: path to a _pet.json sidecar
+    :return: the number of frames or None if there's no readable image next to the sidecar
+    """
+    stem = sidecar_path.name[: -len(".json")]
+    for extension in (".nii.gz", ".nii"):
+        image_path = sidecar_path.with_name(stem + extension)
+        if image_path.is_file():
+            try:
+                shape = nibabel.load(image_path).header.get_data_shape()
+            except Exception:
+                return None
+            return shape[3] if len(shape) > 3 else 1
+    return None
+
+
+def validate_sidecar(sidecar_path) -> dict:
+    """
+    Validates a _pet.json or _blood.json sidecar.
+
+    :param sidecar_path: path to the sidecar
+    :return: a dictionary with the path, kind of sidecar, number of frames, missing required fields, errors (each with
+        the field and a message), and whether the sidecar is valid
+    """
+    sidecar_path = pathlib.Path(sidecar_path)
+    kind = next(
+        (
+            kind
+            for suffix, kind in SIDECAR_SUFFIXES.items()
+            if sidecar_path.name.endswith(suffix)
+        ),
+        "pet",
+    )
+    result = {
+        "path": str(sidecar_path),
+        "kind": kind,
+        "frames": None,
+        "missing": [],
+        "errors": [],
+        "valid": False,
+    }
+    try:
+        with open(sidecar_path, "r") as infile:
+            sidecar = json.load(infile)
+    except (OSError, ValueError) as err:
+        result["errors"].append(
+            {"field": None, "message": f"unreadable sidecar: {err}"}
+        )
+        return result
+    if not isinstance(sidecar, dict):
+        result["errors"].append({"field": None, "message": "sidecar isn't an object"})
+        return result
+
+    result["missing"] = [
+        field
+        for field in required_fields(kind, sidecar)
+        if sidecar.get(field) in (None, "")
+    ]
+
+    validators = field_validators()
+    for field, value in sidecar.items():
+        validator = validators.get(field)
+        if validator is None or field in result["missing"]:
+            continue
+        result["errors"].extend(
+            {"field": field, "message": message} for message in validator(value)
+        )
+
+    if kind == "pet":
+        frames = image_frames(sidecar_path)
+        if frames is None and isinstance(sidecar.get("FrameDuration"), list):
+            frames = len(sidecar["FrameDuration"])
+        result["frames"] = frames
+        for field in FRAME_FIELDS:
+            value = sidecar.get(field)
+            if frames is not None and isinstance(value, list) and len(value) != frames:
+                result["errors"].append(
+                    {
+                        "field": field,
+                        "message": f"{field} has {len(value)} values, expected one for each of the {frames} frames",
+                    }
+                )
+
+    result["valid"] = not result["missing"] and not result["errors"]
+    return result
+
+
+def collect_sidecars(bids_root) -> list:
+    """
+    Finds the PET and blood sidecars in a BIDS dataset, derivatives, sourcedata, and code folders are skipped.
+
+    :param bids_root: root of the dataset
+    :return: sorted list of sidecar paths
+    """
+    sidecars = []
+    for folder, folders, files in os.walk(bids_root):
+        folders[:] = [
+            name
+            for name in folders
+            if name not in SKIPPED_FOLDERS and not name.startswith(".")
+        ]
+        sidecars.extend(
+            os.path.join(folder, name)
+            for name in files
+            if name.endswith(tuple(SIDECAR_SUFFIXES))
+        )
+    return sorted(sidecars)
+
+
+def validate_dataset(bids_root, n_jobs: int = None) -> dict:
+    """
+    Validates every PET and blood sidecar in a BIDS dataset.
+
+    :param bids_root: root of the dataset
+    :param n_jobs: number of processes to use, defaults to the number of cpus, 1 validates in this process
+    :return: a report with a summary and the result of every sidecar (see validate_sidecar)
+    """
+    sidecars = collect_sidecars(bids_root)
+    if n_jobs == 1 or len(sidecars) < 2:
+        results = [validate_sidecar(sidecar) for sidecar in sidecars]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(
+                executor.map(
+                    validate_sidecar,
+                    sidecars,
+                    chunksize=max(1, len(sidecars) // 256),
+                )
+            )
+    invalid = [result for result in results if not result["valid"]]
+    return {
+        "root": str(bids_root),
+        "summary": {
+            "checked": len(results),
+            "valid": len(results) - len(invalid),
+            "invalid": len(invalid),
+        },
+        "sidecars": results,
+    }
+
+
+def cli(args=None):
+    parser = argparse.ArgumentParser(
+        description="Validate the _pet.json and _blood.json sidecars of a BIDS dataset against the BIDS PET schema. "
+        "Exits with a non-zero status if any sidecar is invalid."
+    )
+    parser.add_argument("bids_root", type=pathlib.Path, help="root of the BIDS dataset")
+    parser.add_argument(
+        "--report",
+        type=str,
+        default=None,
+        help="path to write the json report to, the report is printed if not supplied",
+    )
+    parser.add_argument(
+        "--invalid-only",
+        action="store_true",
+        default=False,
+        help="only include invalid sidecars in the report",
+    )
+    parser.add_argument(
+        "--njobs",
+        "-j",
+        type=int,
+        default=None,
+        help="number of processes to use, defaults to the number of cpus",
+    )
+    args = parser.parse_args(args)
+
+    if not args.bids_root.is_dir():
+        parser.error(f"{args.bids_root} is not a folder")
+
+    report = validate_dataset(args.bids_root, n_jobs=args.njobs)
+    if args.invalid_only:
+        report["sidecars"] = [
+            result for result in report["sidecars"] if not result["valid"]
+        ]
+
+    summary = report["summary"]
+    message = f"validated {summary['checked']} sidecars: {summary['valid']} valid, {summary['invalid']} invalid"
+    if args.report:
+        with open(args.report, "w") as outfile:
+            json.dump(report, outfile, indent=4)
+        logger.info(message)
+    else:
+        # the pypet2bids logger writes to stdout, keep stdout to the report alone so it can be piped
+        print(json.dumps(report, indent=4))
+        print(message, file=sys.stderr)
+    if summary["invalid"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,546 @@
+"""
+Watches a landing folder that scanner consoles export PET data into and converts each series into a BIDS dataset as
+soon as it has finished arriving, rather than waiting for a nightly batch.
+
+Every folder of dicoms, ECAT file, and zip or tar archive in the landing folder is a unit of work. A unit is ready once
+nothing in it has changed for a quiet period and it passes a completeness check: every PET series in a dicom folder
+must have all of its slices and frames (see check_series_completeness) and an ECAT must be as long as its directory
+table says it should be. Ready units are converted with Dcm2niix4PET or Ecat by a bounded pool of worker processes.
+
+Where each unit goes in the BIDS dataset is decided by rules, regular expressions with named groups that are matched
+against the path of the unit relative to the landing folder. A rule must have a sub group and may have ses, trc, rec,
+and run groups, e.g. ``(?P<sub>[^_/]+)_(?P<ses>[^_/]+)`` sends landing/PET001_baseline/ to
+bids/sub-PET001/ses-baseline/pet/sub-PET001_ses-baseline_pet.nii.gz. The first rule that matches is used and units no
+rule matches are skipped.
+
+Conversions are recorded in the ConversionManifest of the BIDS dataset so restarting the watcher doesn't convert
+anything twice. Units that fail to convert are retried, the wait between attempts doubling each time, and a failed
+unit that changes is treated as a new one. On linux changes are picked up with inotify, elsewhere (or with --poll) the landing folder is polled.
+
+Example:
+
+.. code-block:: bash
+
+    pet2bids-watch /data/landing /data/bids --rule "(?P<sub>[^_/]+)_(?P<ses>[^_/]+)" --quiet-period 120 --njobs 2
+
+| *Authors: Anthony Galassi*
+| *Copyright OpenNeuroPET team*
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import os
+import re
+import select
+import shlex
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from os import walk
+from os.path import join
+from pathlib import Path
+
+try:
+    import helper_functions
+    import read_ecat
+    from archives import is_archive
+    from conversion_manifest import ConversionManifest
+    from dcm2niix4pet import (
+        check_series_completeness,
+        convert_batch_row,
+        parse_kwargs_string,
+    )
+    from ecat import Ecat
+except ModuleNotFoundError:
+    import pypet2bids.helper_functions as helper_functions
+    import pypet2bids.read_ecat as read_ecat
+    from pypet2bids.archives import is_archive
+    from pypet2bids.conversion_manifest import ConversionManifest
+    from pypet2bids.dcm2niix4pet import (
+        check_series_completeness,
+        convert_batch_row,
+        parse_kwargs_string,
+    )
+    from pypet2bids.ecat import Ecat
+
+logger = helper_functions.logger("pypet2bids")
+
+ecat_suffixes = (".v", ".v.gz")
+archive_suffixes = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+bids_entities = ["ses", "trc", "rec", "run"]
+
+
+def ecat_is_complete(ecat_file) -> bool:
+    """
+    Checks that an ECAT has a readable main header, a directory entry for every frame, and is long enough to hold the
+    last block listed in its directory table. Gzipped ECATs can't be checked without decompressing them and are
+    considered complete.
+
+    :param ecat_file: path to an ECAT
+    :return: True if the ECAT is complete
+    """
+    ecat_file = str(ecat_file)
+    if ecat_file.endswith(".gz"):
+        return True
+    try:
+        main_header, _ = read_ecat.read_main_header(ecat_file)
+        directory = read_ecat.get_directory_data(
+            read_ecat.read_bytes(ecat_file, 512, 512), ecat_file
+        )
+    except Exception:
+        return False
+    if directory is None or directory.shape[1] < main_header["NUM_FRAMES"]:
+        return False
+    return os.path.getsize(ecat_file) >= int(directory[2].max()) * 512
+
+
+def convert_ecat(ecat_file, destination_path, kwargs: str = "", metadata_path=None):
+    """
+    Converts a single ECAT, the ECAT counterpart of dcm2niix4pet.convert_batch_row.
+
+    :param ecat_file: path to the ECAT
+    :param destination_path: path of the nifti to write
+    :param kwargs: key=value pairs as they would be given on the command line
+    :param metadata_path: path to a metadata spreadsheet
+    :return: a dictionary recording the status, error (if any), duration in seconds, and created files
+    """
+    start = time.perf_counter()
+    result = {"status": "success", "error": "", "outputs": ""}
+    try:
+        Path(destination_path).parent.mkdir(parents=True, exist_ok=True)
+        ecat = Ecat(
+            ecat_file=str(ecat_file),
+            nifti_file=str(destination_path),
+            metadata_path=metadata_path,
+            kwargs=parse_kwargs_string(kwargs),
+        )
+        ecat.convert()
+        # ECATs converted at the same time may share a destination folder, only the files this one wrote are its own
+        created = sorted(set(ecat.created_files))
+        result["outputs"] = ",".join(created)
+        if not created:
+            raise Exception(f"no files were created from {ecat_file}")
+    except (Exception, SystemExit) as err:
+        result["status"] = "failed"
+        result["error"] = f"{type(err).__name__}: {err}"
+        logger.error(f"Failed to convert {ecat_file}: {result['error']}")
+    result["duration"] = round(time.perf_counter() - start, 3)
+    return result
+
+
+class InotifyMonitor:
+    """
+    Waits for changes in a folder tree with linux's inotify, new subfolders are watched as they appear.
+
+    :param folder: the folder to watch
+    """
+
+    # IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    mask = 0x00000008 | 0x00000080 | 0x00000100 | 0x00000200
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watched = set()
+        self.add_watches()
+
+    def add_watches(self):
+        for root, dirs, files in walk(self.folder):
+            if root not in self.watched:
+                if (
+                    self.libc.inotify_add_watch(self.fd, os.fsencode(root), self.mask)
+                    >= 0
+                ):
+                    self.watched.add(root)
+
+    def wait(self, timeout: float) -> bool:
+        """
+        :param timeout: the longest time to wait in seconds
+        :return: True if something changed
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        try:
+            while os.read(self.fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+        self.add_watches()
+        return True
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingMonitor:
+    """
+    Stands in for InotifyMonitor where inotify isn't available, the landing folder is rescanned every time.
+    """
+
+    def wait(self, timeout: float) -> bool:
+        time.sleep(timeout)
+        return True
+
+    def close(self):
+        pass
+
+
+class Watcher:
+    """
+    Finds units of work in a landing folder and converts them once they're complete, see the module documentation.
+
+    :param landing_folder: the folder scanner exports arrive in
+    :param bids_folder: the root of the BIDS dataset to convert into
+    :param rules: regular expressions with named groups mapping units to subjects, sessions, etc.
+    :param quiet_period: seconds a unit must go unchanged before it's converted
+    :param n_jobs: the number of conversions to run at once
+    :param retry_delay: seconds to wait before retrying a failed conversion, doubled after each failure up to an hour
+    :param kwargs: key=value pairs passed to every conversion as they would be given on the command line
+    :param metadata_path: path to a metadata spreadsheet used for every conversion
+    :param options: keyword arguments passed to every Dcm2niix4PET object
+    """
+
+    def __init__(
+        self,
+        landing_folder,
+        bids_folder,
+        rules: list,
+        quiet_period: float = 60,
+        n_jobs: int = 1,
+        retry_delay: float = 60,
+        kwargs: str = "",
+        metadata_path=None,
+        options: dict = {},
+    ):
+        self.landing_folder = Path(landing_folder).absolute()
+        self.bids_folder = Path(bids_folder).absolute()
+        self.rules = [re.compile(rule) for rule in rules]
+        for rule in self.rules:
+            if "sub" not in rule.groupindex:
+                raise ValueError(f"rule {rule.pattern} has no sub group")
+        self.quiet_period = quiet_period
+        self.n_jobs = n_jobs
+        self.retry_delay = retry_delay
+        self.kwargs = kwargs
+        self.metadata_path = metadata_path
+        self.options = options
+        self.manifest = ConversionManifest.for_destination(self.bids_folder)
+        # the pool of worker processes is started on the first conversion
+        self.executor = None
+        # unit: (snapshot, time the snapshot was first seen)
+        self.pending = {}
+        # unit: snapshot the unit was last converted (or skipped) at
+        self.handled = {}
+        # unit: (snapshot, number of failed attempts, time of the next attempt)
+        self.failed = {}
+        # future: (unit, snapshot, manifest entry)
+        self.running = {}
+
+    def scan(self) -> dict:
+        """
+        Lists the units in the landing folder, each folder of files is one unit and each ECAT or archive is its own.
+
+        :return: a dictionary of unit path to a snapshot of the number, total size, and latest modification time of
+            its files
+        """
+        units = {}
+        for root, dirs, files in walk(self.landing_folder):
+            dirs[:] = [folder for folder in dirs if not folder.startswith(".")]
+            folder_files = []
+            for name in files:
+                if name.startswith("."):
+                    continue
+                path = Path(join(root, name))
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                if name.endswith(ecat_suffixes) or name.endswith(archive_suffixes):
+                    units[path] = (1, stat.st_size, stat.st_mtime_ns)
+                else:
+                    folder_files.append(stat)
+            if folder_files:
+                units[Path(root)] = (
+                    len(folder_files),
+                    sum(stat.st_size for stat in folder_files),
+                    max(stat.st_mtime_ns for stat in folder_files),
+                )
+        return units
+
+    def is_complete(self, unit: Path) -> bool:
+        if unit.name.endswith(ecat_suffixes):
+            return ecat_is_complete(unit)
+        if unit.name.endswith(archive_suffixes):
+            return is_archive(unit)
+        report = check_series_completeness(unit)
+        return bool(report["series"]) and report["complete"]
+
+    def destination(self, unit: Path):
+        """
+        Applies the first matching rule to a unit, ECAT and archive units are matched without their extension.
+
+        :param unit: path to the unit
+        :return: the path of the nifti to create without an extension, or None if no rule matches
+        """
+        relative = unit.relative_to(self.landing_folder).as_posix()
+        # rules are matched against file units without their extension
+        for suffix in sorted(ecat_suffixes + archive_suffixes, key=len, reverse=True):
+            if relative.endswith(suffix):
+                relative = relative[: -len(suffix)]
+                break
+        for rule in self.rules:
+            match = rule.search(relative)
+            if not match:
+                continue
+            parts = {"sub": match["sub"]}
+            for entity in bids_entities:
+                if entity in rule.groupindex and match[entity]:
+                    parts[entity] = match[entity]
+            folder = self.bids_folder / f"sub-{parts['sub']}"
+            if "ses" in parts:
+                folder = folder / f"ses-{parts['ses']}"
+            name = "_".join(f"{key}-{value}" for key, value in parts.items())
+            return folder / "pet" / f"{name}_pet"
+        return None
+
+    def pool(self) -> ProcessPoolExecutor:
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.n_jobs)
+        return self.executor
+
+    def close(self):
+        """
+        Shuts down the pool of worker processes, waiting for running conversions to finish.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    def submit(self, unit: Path, destination: Path):
+        if unit.name.endswith(ecat_suffixes):
+            return self.pool().submit(
+                convert_ecat,
+                unit,
+                str(destination) + ".nii",
+                self.kwargs,
+                self.metadata_path,
+            )
+        row = {
+            "folder": str(unit),
+            "destination_path": str(destination) + ".nii.gz",
+            "metadata_path": self.metadata_path,
+            "translation_script_path": None,
+            "kwargs": self.kwargs,
+            "trc": None,
+            "run": None,
+            "rec": None,
+        }
+        return self.pool().submit(convert_batch_row, row, self.options)
+
+    def step(self) -> list:
+        """
+        Runs one pass over the landing folder, converts units that have become ready and collects the results of
+        conversions that have finished.
+
+        :return: the results of the conversions that finished during this pass as (unit, result) pairs
+        """
+        now = time.monotonic()
+        running_units = {unit for unit, _, _ in self.running.values()}
+        for unit, snapshot in self.scan().items():
+            if unit in running_units or self.handled.get(unit) == snapshot:
+                continue
+            failed = self.failed.get(unit)
+            if failed is not None and failed[0] != snapshot:
+                # the unit has changed since it failed, treat it as new
+                del self.failed[unit]
+                failed = None
+            if failed is not None:
+                if now < failed[2]:
+                    continue
+            else:
+                pending = self.pending.get(unit)
+                if pending is None or pending[0] != snapshot:
+                    self.pending[unit] = (snapshot, now)
+                    continue
+                if now - pending[1] < self.quiet_period:
+                    continue
+                if not self.is_complete(unit):
+                    # still incomplete after a quiet period, wait for another one
+                    logger.info(
+                        f"{unit} has stopped changing but is incomplete, waiting"
+                    )
+                    self.pending[unit] = (snapshot, now)
+                    continue
+                del self.pending[unit]
+
+            destination = self.destination(unit)
+            if destination is None:
+                logger.warning(f"No rule matches {unit}, skipping it")
+                self.handled[unit] = snapshot
+                continue
+            entry = self.manifest.describe(
+                unit,
+                self.metadata_path,
+                {
+                    "kwargs": self.kwargs,
+                    "destination_path": str(destination),
+                    "options": self.options,
+                },
+            )
+            if self.manifest.is_up_to_date(entry):
+                logger.info(f"{unit} has already been converted, skipping it")
+                self.handled[unit] = snapshot
+                self.failed.pop(unit, None)
+                continue
+            logger.info(f"Converting {unit} to {destination}")
+            self.running[self.submit(unit, destination)] = (unit, snapshot, entry)
+
+        finished = []
+        for future in [future for future in self.running if future.done()]:
+            unit, snapshot, entry = self.running.pop(future)
+            try:
+                result = future.result()
+            except Exception as err:
+                result = {
+                    "status": "failed",
+                    "error": f"{type(err).__name__}: {err}",
+                    "outputs": "",
+                    "duration": None,
+                }
+                logger.error(f"Failed to convert {unit}: {result['error']}")
+                if isinstance(err, BrokenProcessPool) and self.executor is not None:
+                    # a worker died, start a new pool for the next conversion
+                    self.executor.shutdown(wait=False)
+                    self.executor = None
+            if result["status"] == "success":
+                self.manifest.record(entry, result["outputs"].split(","))
+                self.handled[unit] = snapshot
+                self.failed.pop(unit, None)
+                logger.info(f"Converted {unit} in {result['duration']} seconds")
+            else:
+                attempts = self.failed.get(unit, (None, 0, None))[1] + 1
+                delay = min(self.retry_delay * 2 ** (attempts - 1), 3600)
+                self.failed[unit] = (snapshot, attempts, time.monotonic() + delay)
+                logger.warning(
+                    f"Conversion of {unit} failed {attempts} time(s), retrying in {delay} seconds"
+                )
+            finished.append((unit, result))
+        return finished
+
+    def run(self, poll_interval: float = 5, use_inotify: bool = True, stop=None):
+        """
+        Watches the landing folder until interrupted.
+
+        :param poll_interval: the longest time in seconds between passes over the landing folder
+        :param use_inotify: wake up as soon as something changes where inotify is available
+        :param stop: optional callable, the watcher stops once it returns True
+        """
+        monitor = PollingMonitor()
+        if use_inotify and sys.platform.startswith("linux"):
+            try:
+                monitor = InotifyMonitor(self.landing_folder)
+            except (OSError, AttributeError, TypeError):
+                logger.info("inotify is unavailable, polling for changes instead")
+        logger.info(f"Watching {self.landing_folder} for PET data")
+        try:
+            while not (stop and stop()):
+                self.step()
+                monitor.wait(min(poll_interval, self.quiet_period or poll_interval))
+        except KeyboardInterrupt:
+            logger.info("Stopped watching")
+        finally:
+            monitor.close()
+            self.close()
+
+
+def cli():
+    parser = argparse.ArgumentParser(
+        description="Watch a landing folder and convert PET dicom series, ECATs, and archives into a BIDS dataset "
+        "once they have finished arriving."
+    )
+    parser.add_argument("landing_folder", type=str, help="folder to watch")
+    parser.add_argument(
+        "bids_folder", type=str, help="root of the BIDS dataset to convert into"
+    )
+    parser.add_argument(
+        "--rule",
+        action="append",
+        required=True,
+        help="regular expression with a named sub group and optional ses, trc, rec, and run groups, matched against "
+        "the path of each unit relative to the landing folder, may be given more than once",
+    )
+    parser.add_argument(
+        "--quiet-period",
+        type=float,
+        default=60,
+        help="seconds a unit must go unchanged before it's converted, default is 60",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=5,
+        help="longest time in seconds between scans of the landing folder, default is 5",
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        default=False,
+        help="poll the landing folder instead of using inotify",
+    )
+    parser.add_argument(
+        "--njobs",
+        type=int,
+        default=1,
+        help="number of conversions to run at once, default is 1",
+    )
+    parser.add_argument(
+        "--retry-delay",
+        type=float,
+        default=60,
+        help="seconds to wait before retrying a failed conversion, doubled after each failure, default is 60",
+    )
+    parser.add_argument(
+        "--metadata-path",
+        "-m",
+        type=str,
+        default=None,
+        help="path to a PET metadata spreadsheet used for every conversion",
+    )
+    parser.add_argument(
+        "--kwargs",
+        "-k",
+        nargs="*",
+        default=[],
+        help="key=value pairs added to every sidecar, e.g. TimeZero=12:12:12",
+    )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        choices=["dcm2niix", "native"],
+        default="dcm2niix",
+        help="converter to use for dicoms, see dcm2niix4pet --engine",
+    )
+    args = parser.parse_args()
+
+    watcher = Watcher(
+        landing_folder=helper_functions.expand_path(args.landing_folder),
+        bids_folder=helper_functions.expand_path(args.bids_folder),
+        rules=args.rule,
+        quiet_period=args.quiet_period,
+        n_jobs=args.njobs,
+        retry_delay=args.retry_delay,
+        kwargs=" ".join(shlex.quote(pair) for pair in args.kwargs),
+        metadata_path=helper_functions.expand_path(args.metadata_path),
+        options={"engine": args.engine, "check_completeness": True, "silent": True},
+    )
+    watcher.run(poll_interval=args.poll_interval, use_inotify=not args.poll)
+
+
+if __name__ == "__main__":
+    cli()
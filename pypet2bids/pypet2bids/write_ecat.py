@@ -3,21 +3,21 @@ This program will create an ecat file if provided an ecat schema and a dictionar
 with.
 
 First this program collects the same schemas that read_ecat.py does, from read_ecat import ecat_header_maps.
-Next this program selects one of the header maps as specified by some input e.g. if given: ecat7.3 it would 
-select the standard image matrix at: ecat_header_maps['ecat_headers']['73']['mainheader'] 
-and the subheader map at: ecat_header_maps['ecat_headers']['73']['11'] or whatever number is corresponding to 
+Next this program selects one of the header maps as specified by some input e.g. if given: ecat7.3 it would
+select the standard image matrix at: ecat_header_maps['ecat_headers']['73']['mainheader']
+and the subheader map at: ecat_header_maps['ecat_headers']['73']['11'] or whatever number is corresponding to
 the type of ecat header you wish to write. Perhaps these should belong in a reverse sort of dictionary going to
-need to create the directory byte block(s) for an ecat. Basically, reverse the process of reading the 
-directory in lines 227 through 257 in ecat_read. 
-    
+need to create the directory byte block(s) for an ecat. Basically, reverse the process of reading the
+directory in lines 227 through 257 in ecat_read.
+
     determine the number of frames in the image/pixel data
-    create empty table(s) of dtype >i4 dimensions of 4 rows by 64 columns 
+    create empty table(s) of dtype >i4 dimensions of 4 rows by 64 columns
     fill empty tables w/ zeros
-    place the number 2 in the second row, first column of the table if it's the only directory table or the last 
+    place the number 2 in the second row, first column of the table if it's the only directory table or the last
     directory
     table.
     final output should be a bytes: 1024 type object.
-    
+
 After generating the table you should then be able to write the main header, write the directory table,
 then write each subheader and corresponding pixel data
 
@@ -29,7 +29,12 @@ then write each subheader and corresponding pixel data
 
 import struct
 from math import ceil, floor
-from pypet2bids.read_ecat import ecat_header_maps, get_buffer_size
+from pypet2bids.read_ecat import (
+    ecat_header_maps,
+    get_buffer_size,
+    compile_header_schema,
+    MAIN_HEADER_SIZE,
+)
 import numpy
 from pathlib import Path
 
@@ -108,6 +113,32 @@ def write_header(
     return byte_width + byte_position
 
 
+def pack_header(schema: list, values: dict = {}, header_size: int = MAIN_HEADER_SIZE):
+    """
+    Packs a dictionary of header values into a block of bytes using the byte positions recorded in the schema, unlike
+    write_header this respects any gaps between fields in the schema. Fields missing from values are left as zeros
+    and fields recorded in msec in the schema are expected in seconds (as returned by read_ecat) and converted back.
+    :param schema: dictionary schema of the ecat header
+    :param values: dictionary of values corresponding to the 'variable_name' entries in the schema dictionary
+    :param header_size: size of the header block in bytes, ECAT headers occupy a single 512 byte block
+    :return: the packed header as bytes
+    """
+    header_bytes = bytearray(header_size)
+    for field in compile_header_schema(schema):
+        value = values.get(field["variable_name"], None)
+        if value is None:
+            continue
+        if "s" in field["fmt"]:
+            value = [bytes(str(value), "ascii")]
+        else:
+            if type(value) not in (list, tuple):
+                value = [value]
+            if field["msec"]:
+                value = [round(v * 1000) for v in value]
+        field["struct"].pack_into(header_bytes, field["byte"], *value)
+    return bytes(header_bytes)
+
+
 def create_directory_table(
     num_frames: int = 0, pixel_dimensions: dict = {}, pixel_byte_size: int = 2
 ):
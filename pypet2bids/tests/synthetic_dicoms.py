@@ -0,0 +1,126 @@
+"""
+Writes small synthetic PET dicom series for tests that need to run dcm2niix without access to real (phantom) data.
+"""
+
+import pathlib
+
+import numpy
+import pydicom
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.uid import ExplicitVRLittleEndian, generate_uid
+
+PET_IMAGE_STORAGE = "1.2.840.10008.5.1.4.1.1.128"
+
+
+def write_pet_series(
+    folder,
+    number_of_slices: int = 4,
+    number_of_frames: int = 2,
+    rows: int = 8,
+    columns: int = 8,
+    series_number: int = 1,
+    series_time: str = "120000",
+    modality: str = "PT",
+    patient_id: str = "SyntheticPatient",
+    seed: int = 0,
+    skip_instances: list = [],
+) -> list:
+    """
+    Writes a dynamic PET series with one file per slice per frame.
+
+    :param folder: folder to write the dicoms to, created if it doesn't exist
+    :param skip_instances: instance numbers to leave out to create an incomplete series
+    :return: a list of the paths of the written dicoms
+    """
+    folder = pathlib.Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    rng = numpy.random.default_rng(seed)
+
+    study_uid, series_uid, frame_of_reference_uid = (
+        generate_uid(),
+        generate_uid(),
+        generate_uid(),
+    )
+    written = []
+    for frame in range(number_of_frames):
+        for slice_index in range(number_of_slices):
+            instance_number = frame * number_of_slices + slice_index + 1
+            if instance_number in skip_instances:
+                continue
+
+            file_meta = FileMetaDataset()
+            file_meta.MediaStorageSOPClassUID = PET_IMAGE_STORAGE
+            file_meta.MediaStorageSOPInstanceUID = generate_uid()
+            file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+
+            ds = Dataset()
+            ds.file_meta = file_meta
+            ds.SOPClassUID = PET_IMAGE_STORAGE
+            ds.SOPInstanceUID = file_meta.MediaStorageSOPInstanceUID
+            ds.Modality = modality
+            ds.Manufacturer = "SIEMENS"
+            ds.ManufacturerModelName = "Biograph64_mCT"
+            ds.InstitutionName = "Synthetic Institution"
+            ds.PatientID = patient_id
+            ds.PatientName = "Synthetic^Patient"
+            ds.StudyInstanceUID = study_uid
+            ds.SeriesInstanceUID = series_uid
+            ds.FrameOfReferenceUID = frame_of_reference_uid
+            ds.SeriesNumber = series_number
+            ds.AcquisitionNumber = frame + 1
+            ds.InstanceNumber = instance_number
+            ds.SeriesDescription = f"PET Synthetic Series {series_number}"
+            ds.ProtocolName = "PET Synthetic"
+            ds.StudyDate = ds.SeriesDate = ds.AcquisitionDate = "20220101"
+            ds.StudyTime = "115900"
+            ds.SeriesTime = series_time
+            ds.AcquisitionTime = f"{12 + frame // 60:02d}{frame % 60:02d}00"
+            ds.ImageType = ["ORIGINAL", "PRIMARY"]
+            ds.Units = "BQML"
+            ds.DecayCorrection = "START"
+            ds.CorrectedImage = ["DECY", "ATTN", "SCAT", "DTIM", "RAN", "NORM"]
+            ds.ReconstructionMethod = "OSEM3D 3i21s"
+            ds.ConvolutionKernel = "XYZ Gauss2.00"
+            ds.AttenuationCorrectionMethod = "measured"
+            ds.NumberOfSlices = number_of_slices
+            ds.NumberOfTimeSlices = number_of_frames
+            ds.ImageIndex = instance_number
+            ds.FrameReferenceTime = frame * 60000 + 30000
+            ds.ActualFrameDuration = 60000
+            ds.SliceThickness = 2.0
+            ds.PixelSpacing = [2.0, 2.0]
+            ds.ImageOrientationPatient = [1, 0, 0, 0, 1, 0]
+            ds.ImagePositionPatient = [0, 0, 2.0 * slice_index]
+            ds.SliceLocation = 2.0 * slice_index
+            ds.PatientPosition = "HFS"
+
+            radiopharmaceutical = Dataset()
+            radiopharmaceutical.Radiopharmaceutical = "Fluorodeoxyglucose"
+            radiopharmaceutical.RadiopharmaceuticalStartTime = "115500"
+            radiopharmaceutical.RadionuclideTotalDose = 370000000
+            radiopharmaceutical.RadionuclideHalfLife = 6586.2
+            radiopharmaceutical.RadionuclidePositronFraction = 0.97
+            radionuclide_code = Dataset()
+            radionuclide_code.CodeValue = "C-111A1"
+            radionuclide_code.CodingSchemeDesignator = "SRT"
+            radionuclide_code.CodeMeaning = "^18^Fluorine"
+            radiopharmaceutical.RadionuclideCodeSequence = [radionuclide_code]
+            ds.RadiopharmaceuticalInformationSequence = [radiopharmaceutical]
+
+            pixels = rng.integers(0, 1000, size=(rows, columns), dtype=numpy.int16)
+            ds.Rows, ds.Columns = rows, columns
+            ds.SamplesPerPixel = 1
+            ds.PhotometricInterpretation = "MONOCHROME2"
+            ds.BitsAllocated = 16
+            ds.BitsStored = 16
+            ds.HighBit = 15
+            ds.PixelRepresentation = 1
+            ds.RescaleSlope = 1.0
+            ds.RescaleIntercept = 0.0
+            ds.PixelData = pixels.tobytes()
+
+            path = folder / f"{series_number:03d}_{instance_number:05d}.dcm"
+            ds.save_as(path, enforce_file_format=True)
+            written.append(path)
+
+    return written
@@ -0,0 +1,107 @@
+import gzip
+import tarfile
+import zipfile
+
+import pytest
+
+from pypet2bids.archives import (
+    extract_ecat,
+    extract_pet_dicoms,
+    find_ecat_members,
+    is_archive,
+)
+from pypet2bids.dcm2niix4pet import Dcm2niix4PET
+from pypet2bids.ecat import Ecat
+from pypet2bids.synthetic_ecat import SyntheticEcat
+from tests.synthetic_dicoms import write_pet_series
+
+
+def write_dicom_archive(tmp_path, archive_path):
+    pet = write_pet_series(tmp_path / "dicoms" / "pet")
+    ct = write_pet_series(tmp_path / "dicoms" / "ct", series_number=2, modality="CT")
+    (tmp_path / "dicoms" / "notes.txt").write_text("not a dicom")
+    files = pet + ct + [tmp_path / "dicoms" / "notes.txt"]
+    if archive_path.suffix == ".zip":
+        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for path in files:
+                archive.write(path, path.relative_to(tmp_path))
+    else:
+        with tarfile.open(archive_path, "w:gz") as archive:
+            for path in files:
+                archive.add(path, str(path.relative_to(tmp_path)))
+    return pet
+
+
+@pytest.mark.parametrize("archive_name", ["dicoms.zip", "dicoms.tar.gz"])
+def test_extract_pet_dicoms(tmp_path, archive_name):
+    pet = write_dicom_archive(tmp_path, tmp_path / archive_name)
+    assert is_archive(tmp_path / archive_name)
+    assert not is_archive(pet[0])
+
+    extracted = extract_pet_dicoms(tmp_path / archive_name, tmp_path / "extracted")
+
+    assert sorted(path.name for path in extracted) == sorted(path.name for path in pet)
+    assert all(
+        path.parent == tmp_path / "extracted" / "dicoms" / "pet" for path in extracted
+    )
+    assert (
+        extracted[0].read_bytes()
+        == (tmp_path / "dicoms" / "pet" / extracted[0].name).read_bytes()
+    )
+
+
+def test_members_stay_inside_destination(tmp_path):
+    pet = write_pet_series(tmp_path / "dicoms", number_of_frames=1, number_of_slices=1)
+    with zipfile.ZipFile(tmp_path / "unsafe.zip", "w") as archive:
+        archive.write(pet[0], "../../outside.dcm")
+
+    extracted = extract_pet_dicoms(tmp_path / "unsafe.zip", tmp_path / "extracted")
+
+    assert extracted == [tmp_path / "extracted" / "outside.dcm"]
+
+
+def test_convert_dicom_archive(tmp_path, monkeypatch):
+    monkeypatch.setenv("PET2BIDS_TELEMETRY_ENABLED", "false")
+    write_dicom_archive(tmp_path, tmp_path / "dicoms.zip")
+
+    converter = Dcm2niix4PET(
+        tmp_path / "dicoms.zip",
+        destination_path=tmp_path / "sub-01" / "pet",
+        engine="native",
+        silent=True,
+    )
+    converter.run_dcm2niix()
+
+    assert len(list((tmp_path / "sub-01" / "pet").glob("*.nii.gz"))) == 1
+
+
+def test_ecat_from_archive(tmp_path):
+    ecat_file = SyntheticEcat(dimensions=(5, 4, 3), number_of_frames=2).write(
+        tmp_path / "synthetic.v"
+    )
+    with gzip.open(tmp_path / "synthetic.v.gz", "wb") as outfile:
+        outfile.write(ecat_file.read_bytes())
+    with tarfile.open(tmp_path / "ecats.tar", "w") as archive:
+        archive.add(tmp_path / "synthetic.v.gz", "scans/synthetic.v.gz")
+        archive.add(tmp_path / "synthetic.v", "scans/copy.v")
+
+    assert find_ecat_members(tmp_path / "ecats.tar") == [
+        "scans/synthetic.v.gz",
+        "scans/copy.v",
+    ]
+    with pytest.raises(ValueError, match="more than one ECAT"):
+        extract_ecat(tmp_path / "ecats.tar", tmp_path / "extracted")
+    extracted = extract_ecat(
+        tmp_path / "ecats.tar", tmp_path / "extracted", member="scans/synthetic.v.gz"
+    )
+    assert extracted == tmp_path / "extracted" / "scans" / "synthetic.v"
+    assert extracted.read_bytes() == ecat_file.read_bytes()
+
+    ecat = Ecat(
+        tmp_path / "ecats.tar",
+        archive_member="scans/copy.v",
+        collect_pixel_data=False,
+    )
+    assert ecat.ecat_header["NUM_FRAMES"] == 2
+    # the nifti is written next to the archive rather than into the temporary directory
+    assert ecat.nifti_file == str(tmp_path / "copy.nii")
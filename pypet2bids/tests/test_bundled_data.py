@@ -0,0 +1,56 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from pypet2bids.bundled_data import LazyJson, LazyMapping, write_snapshot
+
+
+def test_snapshot_round_trip(tmp_path):
+    values = {
+        "version": "1.0",
+        "schema": {
+            "objects": {"metadata": {"TracerName": {"type": "string"}}},
+            "meta": [1],
+        },
+        "fields": ["TracerName"],
+    }
+    write_snapshot(values, tmp_path / "snapshot", split={"schema": {"objects": {}}})
+    assert (tmp_path / "snapshot" / "schema" / "objects" / "metadata.json").is_file()
+
+    snapshot = LazyMapping(tmp_path / "snapshot")
+    assert list(snapshot) == ["version", "schema", "fields"]
+    assert snapshot == values and values == snapshot
+    with pytest.raises(KeyError):
+        snapshot["missing"]
+    assert snapshot.get("missing") is None
+
+    # keys are only read from disk when they're first used
+    snapshot = LazyMapping(tmp_path / "snapshot")
+    assert snapshot["schema"]["objects"]["metadata"]["TracerName"]["type"] == "string"
+    assert list(snapshot._loaded) == ["schema"]
+    assert list(snapshot["schema"]._loaded) == ["objects"]
+
+
+def test_lazy_json(tmp_path):
+    path = tmp_path / "headers.json"
+    headers = LazyJson(path)
+    path.write_text(json.dumps({"ecat_headers": {"73": {}}}))
+    assert headers["ecat_headers"] == {"73": {}}
+
+
+def test_bundled_data_is_loaded_on_first_use():
+    loaded = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import pypet2bids.update_json_pet_file, pypet2bids.read_ecat as read_ecat;"
+            "import pypet2bids.pet_metadata as metadata;"
+            "print(sorted(metadata.schema._loaded), read_ecat.ecat_header_maps._data is None)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.splitlines()[-1]
+    assert loaded == "[] True"
@@ -0,0 +1,133 @@
+import os
+
+import pandas
+
+from pypet2bids.conversion_manifest import (
+    ConversionManifest,
+    dataset_root,
+    fingerprint,
+    manifest_name,
+)
+from pypet2bids.dcm2niix4pet import run_batch
+from tests.synthetic_dicoms import write_pet_series
+
+
+def test_fingerprint_changes_with_input(tmp_path):
+    dicoms = write_pet_series(tmp_path / "dicoms")
+    first = fingerprint(tmp_path / "dicoms")
+    assert first == fingerprint(tmp_path / "dicoms")
+    assert first["files"] == len(dicoms)
+
+    os.utime(dicoms[0], ns=(0, 0))
+    assert fingerprint(tmp_path / "dicoms")["hash"] != first["hash"]
+
+
+def test_dataset_root(tmp_path):
+    assert dataset_root(tmp_path / "bids" / "sub-01" / "ses-01" / "pet") == (
+        tmp_path / "bids"
+    )
+    (tmp_path / "bids" / "derivatives").mkdir(parents=True)
+    (tmp_path / "bids" / "derivatives" / "dataset_description.json").write_text("{}")
+    assert dataset_root(tmp_path / "bids" / "derivatives" / "sub-01" / "pet") == (
+        tmp_path / "bids" / "derivatives"
+    )
+    assert dataset_root(tmp_path / "output" / "scan.nii") == tmp_path / "output"
+
+
+def test_record_and_provenance(tmp_path):
+    write_pet_series(tmp_path / "dicoms")
+    output = tmp_path / "bids" / "sub-01" / "pet" / "sub-01_pet.nii.gz"
+    output.parent.mkdir(parents=True)
+    output.write_bytes(b"")
+
+    manifest = ConversionManifest.for_destination(output.parent)
+    entry = manifest.describe(tmp_path / "dicoms", settings={"kwargs": "A=1"})
+    assert not manifest.is_up_to_date(entry)
+    manifest.record(entry, [output])
+
+    reloaded = ConversionManifest(tmp_path / "bids" / manifest_name)
+    assert reloaded.is_up_to_date(entry)
+    assert reloaded.entries[entry["input"]]["outputs"] == [
+        "sub-01/pet/sub-01_pet.nii.gz"
+    ]
+    assert reloaded.provenance(output)["input"] == str(tmp_path / "dicoms")
+    assert not reloaded.is_up_to_date(
+        reloaded.describe(tmp_path / "dicoms", settings={"kwargs": "A=2"})
+    )
+    output.unlink()
+    assert not reloaded.is_up_to_date(entry)
+
+
+def test_outputs_inside_the_input_folder(tmp_path):
+    # without a destination, outputs and the manifest are written next to the dicoms
+    write_pet_series(tmp_path / "dicoms")
+    manifest = ConversionManifest.for_destination(tmp_path / "dicoms")
+    assert manifest.path == tmp_path / "dicoms" / manifest_name
+    entry = manifest.describe(tmp_path / "dicoms")
+    output = tmp_path / "dicoms" / "sub-01_pet.nii.gz"
+    output.write_bytes(b"")
+    manifest.record(entry, [output])
+
+    reloaded = ConversionManifest(manifest.path)
+    assert reloaded.describe(tmp_path / "dicoms") == entry
+    assert reloaded.is_up_to_date(reloaded.describe(tmp_path / "dicoms"))
+
+
+def test_incremental_batch(tmp_path, monkeypatch):
+    monkeypatch.setenv("PET2BIDS_TELEMETRY_ENABLED", "false")
+    write_pet_series(tmp_path / "dicoms" / "first", series_number=1)
+    write_pet_series(tmp_path / "dicoms" / "second", series_number=2)
+    manifest = tmp_path / "manifest.tsv"
+    pandas.DataFrame(
+        [
+            {
+                "folder": str(tmp_path / "dicoms" / "first"),
+                "destination_path": str(tmp_path / "bids" / "sub-01" / "pet"),
+            },
+            {
+                "folder": str(tmp_path / "dicoms" / "second"),
+                "destination_path": str(tmp_path / "bids" / "sub-02" / "pet"),
+            },
+        ]
+    ).to_csv(manifest, sep="\t", index=False)
+    options = {"engine": "native", "silent": True}
+
+    results = run_batch(manifest, options=options, incremental=True)
+    assert list(results["status"]) == ["success", "success"]
+    assert (tmp_path / "bids" / manifest_name).is_file()
+
+    # an interrupted batch leaves some rows unconverted, only those are converted again
+    for output in (tmp_path / "bids" / "sub-02" / "pet").iterdir():
+        output.unlink()
+    results = run_batch(manifest, options=options, incremental=True)
+    assert list(results["status"]) == ["skipped", "success"]
+    assert results["outputs"][0]
+
+    results = run_batch(
+        manifest, options={**options, "tempdir_location": None}, incremental=True
+    )
+    assert list(results["status"]) == ["skipped", "skipped"]
+    results = run_batch(manifest, options={**options, "ezbids": True}, incremental=True)
+    assert "skipped" not in list(results["status"])
+
+
+def test_incremental_batch_without_destination(tmp_path, monkeypatch):
+    # outputs are written next to freshly copied dicoms, neither should stop the row from being skipped next time
+    monkeypatch.setenv("PET2BIDS_TELEMETRY_ENABLED", "false")
+    dicoms = write_pet_series(tmp_path / "dicoms")
+    manifest = tmp_path / "manifest.tsv"
+    pandas.DataFrame(
+        [{"folder": str(tmp_path / "dicoms"), "destination_path": ""}]
+    ).to_csv(manifest, sep="\t", index=False)
+    options = {"engine": "native", "silent": True}
+
+    results = run_batch(manifest, options=options, incremental=True)
+    assert list(results["status"]) == ["success"]
+    assert not set(map(str, dicoms)) & set(results["outputs"][0].split(","))
+    results = run_batch(manifest, options=options, incremental=True)
+    assert list(results["status"]) == ["skipped"]
+
+    # the dicoms are still fingerprinted
+    os.utime(dicoms[0], ns=(0, 0))
+    results = run_batch(manifest, options=options, incremental=True)
+    assert list(results["status"]) == ["success"]
@@ -0,0 +1,120 @@
+import json
+from pathlib import Path
+
+import pandas
+import pytest
+
+from pypet2bids.dcm2niix4pet import (
+    Dcm2niix4PET,
+    convert_batch_row,
+    read_batch_manifest,
+    run_batch,
+)
+from tests.synthetic_dicoms import write_pet_series
+
+requires_dcm2niix = pytest.mark.skipif(
+    not Dcm2niix4PET.check_posix(), reason="dcm2niix is not available"
+)
+
+
+def write_manifest(path, rows):
+    pandas.DataFrame(rows).to_csv(path, sep="\t", index=False)
+
+
+def test_read_batch_manifest(tmp_path):
+    manifest = tmp_path / "manifest.tsv"
+    write_manifest(
+        manifest,
+        [
+            {"folder": "a", "kwargs": 'TimeZero="12:12:12" InjectedRadioactivity=1'},
+            {"folder": "b", "kwargs": ""},
+        ],
+    )
+    rows = read_batch_manifest(manifest)
+
+    assert [row["folder"] for row in rows] == ["a", "b"]
+    assert rows[0]["kwargs"] == 'TimeZero="12:12:12" InjectedRadioactivity=1'
+    assert rows[1]["kwargs"] is None
+    assert rows[1]["destination_path"] is None
+
+
+@requires_dcm2niix
+def test_run_batch(tmp_path, monkeypatch):
+    monkeypatch.setenv("PET2BIDS_TELEMETRY_ENABLED", "false")
+    write_pet_series(tmp_path / "dicoms" / "first", series_number=1)
+    write_pet_series(tmp_path / "dicoms" / "second", series_number=2)
+    manifest = tmp_path / "manifest.tsv"
+    write_manifest(
+        manifest,
+        [
+            {
+                "folder": str(tmp_path / "dicoms" / "first"),
+                "destination_path": str(tmp_path / "bids" / "sub-01" / "pet"),
+                "kwargs": 'TimeZero="12:12:12" InjectedMass=1',
+                "trc": "FDG",
+            },
+            {
+                "folder": str(tmp_path / "dicoms" / "second"),
+                "destination_path": str(tmp_path / "bids" / "sub-02" / "pet"),
+            },
+            {
+                "folder": str(tmp_path / "dicoms" / "missing"),
+                "destination_path": str(tmp_path / "bids" / "sub-03" / "pet"),
+            },
+        ],
+    )
+
+    results = run_batch(manifest, n_jobs=2)
+
+    assert list(results["status"]) == ["success", "success", "failed"]
+    assert results["error"][2]
+    written = pandas.read_csv(
+        tmp_path / "manifest_results.tsv", sep="\t", keep_default_na=False
+    )
+    assert list(written["status"]) == ["success", "success", "failed"]
+
+    sidecar = tmp_path / "bids" / "sub-01" / "pet" / "sub-01_trc-FDG_pet.json"
+    assert str(sidecar) in results["outputs"][0].split(",")
+    with open(sidecar) as infile:
+        assert json.load(infile)["TimeZero"] == "12:12:12"
+    assert (tmp_path / "bids" / "sub-02" / "pet" / "sub-02_pet.nii.gz").exists()
+
+
+def test_batch_row_outputs_are_only_its_own(tmp_path, monkeypatch):
+    monkeypatch.setenv("PET2BIDS_TELEMETRY_ENABLED", "false")
+    write_pet_series(tmp_path / "dicoms")
+    destination = tmp_path / "bids" / "sub-01" / "pet"
+    other_row_output = destination / "sub-01_trc-other_pet.nii.gz"
+
+    # another row converting into the same folder finishes while this one runs
+    post_dcm2niix = Dcm2niix4PET.post_dcm2niix
+
+    def post_dcm2niix_alongside_another_row(converter):
+        post_dcm2niix(converter)
+        other_row_output.write_bytes(b"")
+
+    monkeypatch.setattr(
+        Dcm2niix4PET, "post_dcm2niix", post_dcm2niix_alongside_another_row
+    )
+    result = convert_batch_row(
+        {
+            "folder": str(tmp_path / "dicoms"),
+            "destination_path": str(destination),
+            "metadata_path": None,
+            "translation_script_path": None,
+            "kwargs": "TimeZero=12:00:00",
+            "trc": "FDG",
+            "run": None,
+            "rec": None,
+        },
+        {"engine": "native", "silent": True},
+    )
+
+    assert result["status"] == "success", result["error"]
+    outputs = result["outputs"].split(",")
+    assert other_row_output.is_file()
+    assert str(other_row_output) not in outputs
+    assert sorted(Path(output).name for output in outputs) == [
+        "sub-01_trc-FDG_pet.json",
+        "sub-01_trc-FDG_pet.nii.gz",
+    ]
@@ -0,0 +1,162 @@
+import json
+
+import pydicom
+import pytest
+
+from pypet2bids.dcm2niix4pet import (
+    Dcm2niix4PET,
+    group_dicoms_by_series,
+    read_dicom_header,
+)
+from tests.synthetic_dicoms import write_pet_series
+
+requires_dcm2niix = pytest.mark.skipif(
+    not Dcm2niix4PET.check_posix(), reason="dcm2niix is not available"
+)
+
+
+def test_read_dicom_header_skips_unused_elements(tmp_path):
+    dicom_path = write_pet_series(tmp_path, number_of_frames=1)[0]
+    dicom = pydicom.dcmread(dicom_path)
+    dicom.add_new((0x0029, 0x1010), "OB", b"\x00" * 100000)
+    dicom.save_as(dicom_path)
+    (tmp_path / "not_a_dicom.txt").write_text("hello")
+
+    header = read_dicom_header(dicom_path)
+
+    assert header.SeriesInstanceUID == dicom.SeriesInstanceUID
+    assert header.Units == "BQML"
+    assert header.RadiopharmaceuticalInformationSequence[0].RadionuclideHalfLife
+    assert (0x0029, 0x1010) not in header
+    assert "PixelData" not in header
+    assert read_dicom_header(tmp_path / "not_a_dicom.txt") is None
+
+
+@requires_dcm2niix
+def test_extract_dicom_headers_per_series(tmp_path, monkeypatch):
+    monkeypatch.setenv("PET2BIDS_TELEMETRY_ENABLED", "false")
+    write_pet_series(tmp_path / "dicoms" / "a", series_number=1)
+    write_pet_series(tmp_path / "dicoms" / "b", series_number=2)
+
+    converter = Dcm2niix4PET(tmp_path / "dicoms", tmp_path / "out")
+    assert len(converter.dicom_headers) == 1
+
+    converter = Dcm2niix4PET(
+        tmp_path / "dicoms", tmp_path / "out", headers_per_series=3
+    )
+    series_numbers = sorted(
+        int(header.SeriesNumber) for header in converter.dicom_headers.values()
+    )
+    assert series_numbers == [1, 1, 1, 2, 2, 2]
+
+
+def test_extract_dicom_headers_reads_only_what_it_needs(tmp_path, monkeypatch):
+    monkeypatch.setenv("PET2BIDS_TELEMETRY_ENABLED", "false")
+    write_pet_series(tmp_path / "dicoms", number_of_slices=8, number_of_frames=4)
+    converter = Dcm2niix4PET(tmp_path / "dicoms", tmp_path / "out")
+
+    read = []
+
+    def counting_read_dicom_header(dicom_path, *args, **kwargs):
+        read.append(dicom_path)
+        return read_dicom_header(dicom_path, *args, **kwargs)
+
+    monkeypatch.setattr(
+        "pypet2bids.dcm2niix4pet.read_dicom_header", counting_read_dicom_header
+    )
+    assert len(converter.extract_dicom_headers()) == 1
+    assert len(read) == 1
+
+    # files that aren't dicoms are skipped over
+    for index in range(3):
+        (tmp_path / "dicoms" / f"notes_{index}.txt").write_text("not a dicom")
+    read.clear()
+    assert len(converter.extract_dicom_headers(depth=2)) == 2
+    assert len(read) < 16
+
+
+@requires_dcm2niix
+def test_headers_are_matched_by_series(tmp_path, monkeypatch):
+    monkeypatch.setenv("PET2BIDS_TELEMETRY_ENABLED", "false")
+    dicom_folder = tmp_path / "dicoms"
+    # both series share a study date and time so their file names can't tell them apart
+    first = write_pet_series(dicom_folder, series_number=1, number_of_frames=1)
+    second = write_pet_series(dicom_folder, series_number=2, number_of_frames=1)
+    converter = Dcm2niix4PET(dicom_folder, tmp_path / "out")
+    converter.dicom_headers = {
+        path.name: pydicom.dcmread(path, stop_before_pixels=True)
+        for path in (first[0], second[0])
+    }
+
+    output = tmp_path / "dcm2niix"
+    output.mkdir()
+    sidecars = {
+        "PET_Synthetic_20220101115900_1": {"SeriesNumber": 1},
+        "PET_Synthetic_20220101115900_2": {"SeriesNumber": 2},
+        "PET_Synthetic_20220101115900_7": {
+            "SeriesNumber": 7,
+            "SeriesInstanceUID": str(
+                converter.dicom_headers[second[0].name].SeriesInstanceUID
+            ),
+        },
+        "PET_Synthetic_20220101115900_9": {},
+        "unrelated": {"SeriesNumber": 5},
+    }
+    for stem, sidecar in sidecars.items():
+        (output / f"{stem}.json").write_text(json.dumps(sidecar))
+        (output / f"{stem}.nii.gz").write_bytes(b"")
+
+    matched = converter.match_dicom_headers_to_files(destination_path=output)
+
+    expected = {
+        "PET_Synthetic_20220101115900_1": first[0].name,
+        "PET_Synthetic_20220101115900_2": second[0].name,
+        "PET_Synthetic_20220101115900_7": second[0].name,
+        # no identifiers in the json, falls back to the study date time in the file name
+        "PET_Synthetic_20220101115900_9": first[0].name,
+    }
+    assert matched == {
+        str(output / f"{stem}{suffix}"): header
+        for stem, header in expected.items()
+        for suffix in (".json", ".nii.gz")
+    }
+    assert sorted(
+        converter.match_dicom_header_to_file(destination_path=output)[second[0].name]
+    ) == sorted(
+        str(output / f"{stem}{suffix}")
+        for stem in list(expected)[1:3]
+        for suffix in (".json", ".nii.gz")
+    )
+
+
+@requires_dcm2niix
+def test_series_are_converted_separately(tmp_path, monkeypatch):
+    monkeypatch.setenv("PET2BIDS_TELEMETRY_ENABLED", "false")
+    dicom_folder = tmp_path / "dicoms"
+    write_pet_series(dicom_folder, series_number=1)
+    write_pet_series(dicom_folder, series_number=2, number_of_frames=3)
+    write_pet_series(dicom_folder / "ct", series_number=3, modality="CT")
+
+    series = group_dicoms_by_series(dicom_folder)
+    assert sorted(group["modality"] for group in series.values()) == ["CT", "PT", "PT"]
+    assert sorted(len(group["files"]) for group in series.values()) == [8, 8, 12]
+
+    converter = Dcm2niix4PET(dicom_folder, tmp_path / "out", split_series=True)
+    output = tmp_path / "dcm2niix"
+    output.mkdir()
+    result = converter.run_dcm2niix_per_series(output)
+
+    assert result["returncode"] == 0
+    sidecars = [json.loads(path.read_text()) for path in output.glob("*.json")]
+    assert sorted(sidecar["SeriesNumber"] for sidecar in sidecars) == [1, 2]
+    assert len(list(output.glob("*.nii*"))) == 2
+    # the staged links are cleaned up and nothing in the image folder is touched
+    assert sorted(path.name for path in output.iterdir() if path.is_dir()) == []
+    assert len(list(dicom_folder.rglob("*.dcm"))) == 28
+    # every converted series is matched with its own header
+    matched = converter.match_dicom_headers_to_files(destination_path=output)
+    assert sorted(
+        int(converter.dicom_headers[key].SeriesNumber)
+        for path, key in matched.items()
+        if path.endswith(".json")
+    ) == [1, 2]
@@ -0,0 +1,122 @@
+import asyncio
+import sys
+import time
+
+import pytest
+
+from pypet2bids.dcm2niix4pet import (
+    Dcm2niix4PET,
+    merge_dcm2niix_results,
+    run_dcm2niix_process,
+)
+from tests.synthetic_dicoms import write_pet_series
+
+
+def python_command(code):
+    return [sys.executable, "-c", code]
+
+
+def test_output_and_resources_are_recorded():
+    result = run_dcm2niix_process(
+        python_command(
+            "import sys; print('Chris Rorden dcm2niiX'); print('Warning: odd', file=sys.stderr)"
+        )
+    )
+
+    assert result["returncode"] == 0
+    assert "dcm2niiX" in result["stdout"]
+    assert "Warning: odd" in result["stderr"]
+    assert result["fatal_message"] is None
+    assert not result["timed_out"]
+    assert result["wall_time"] > 0
+    if sys.platform != "win32":
+        assert result["cpu_time"] > 0
+    if sys.platform.startswith("linux"):
+        assert result["peak_rss"] > 0
+
+
+def test_timeout_stops_process():
+    start = time.perf_counter()
+    result = run_dcm2niix_process(
+        python_command("import time; time.sleep(60)"), timeout=0.5
+    )
+
+    assert result["timed_out"]
+    assert result["returncode"] != 0
+    assert time.perf_counter() - start < 30
+
+
+def test_fatal_message_stops_process_early():
+    code = (
+        "import sys, time; "
+        "print('Error: Missing images. Expected 47 images, but instance number is 48', file=sys.stderr, flush=True); "
+        "time.sleep(60)"
+    )
+    start = time.perf_counter()
+    result = run_dcm2niix_process(python_command(code))
+
+    assert "Missing images" in result["fatal_message"]
+    assert "Missing images" in result["stderr"]
+    assert not result["timed_out"]
+    assert time.perf_counter() - start < 30
+
+    # errors can be ignored, in which case dcm2niix is left to finish
+    result = run_dcm2niix_process(
+        python_command(code.replace("time.sleep(60)", "time.sleep(0.5)")),
+        stop_on_fatal=False,
+    )
+    assert result["returncode"] == 0
+    assert result["fatal_message"]
+
+
+def test_merged_results_take_cpu_time_measured_around_all_runs():
+    runs = [
+        run_dcm2niix_process(python_command("print('series %d')" % index))
+        for index in range(2)
+    ]
+    merged = merge_dcm2niix_results(runs, cpu_time=1.5)
+    assert merged["cpu_time"] == 1.5
+    assert merged["stdout"] == "series 0\nseries 1\n"
+    assert merged["wall_time"] == max(run["wall_time"] for run in runs)
+    assert merge_dcm2niix_results(runs)["cpu_time"] is None
+
+
+def test_errors_inside_an_event_loop_are_not_hidden(monkeypatch):
+    async def failing_stream(*args, **kwargs):
+        raise RuntimeError("dcm2niix went wrong")
+
+    async def run_inside_loop():
+        return run_dcm2niix_process(python_command("print('hi')"))
+
+    monkeypatch.setattr("pypet2bids.dcm2niix4pet._stream_dcm2niix", failing_stream)
+    with pytest.raises(RuntimeError, match="dcm2niix went wrong"):
+        asyncio.run(run_inside_loop())
+
+
+@pytest.mark.parametrize(
+    "message, error",
+    [
+        (
+            "Error: Missing images. Expected 47 images, but instance number is 48",
+            FileNotFoundError,
+        ),
+        ("Error: Check sorted order", RuntimeError),
+    ],
+)
+def test_fatal_messages_on_stdout_stop_the_conversion(
+    tmp_path, monkeypatch, message, error
+):
+    write_pet_series(tmp_path / "dicoms")
+    converter = Dcm2niix4PET(
+        tmp_path / "dicoms", destination_path=tmp_path / "bids", engine="native"
+    )
+    # dcm2niix prints its errors on stdout
+    code = f"import time; print({message!r}, flush=True); time.sleep(60)"
+    monkeypatch.setattr(
+        converter,
+        "run_dcm2niix_on_folder",
+        lambda image_folder, output_folder: run_dcm2niix_process(python_command(code)),
+    )
+    with pytest.raises(error, match=message.replace("Error: ", "")[:20]):
+        converter.run_dcm2niix()
+    assert not (tmp_path / "bids").exists()
@@ -0,0 +1,158 @@
+import json
+import subprocess
+from pathlib import Path
+
+import nibabel
+import numpy
+import pydicom
+import pytest
+
+from pypet2bids.dcm2niix4pet import Dcm2niix4PET
+from pypet2bids.dicom2nii import dicom2nii, read_pet_series
+from tests.synthetic_dicoms import write_pet_series
+
+requires_dcm2niix = pytest.mark.skipif(
+    not Dcm2niix4PET.check_posix(), reason="dcm2niix is not available"
+)
+
+# fields where the native engine deliberately differs from dcm2niix, e.g. dcm2niix leaves the dose in Bq
+differing_fields = [
+    "AcquisitionTime",
+    "InjectedRadioactivity",
+    "ReconMethodName",
+    "BidsGuess",
+    "ConversionSoftware",
+    "ConversionSoftwareVersion",
+]
+
+
+def convert_with_both(dicom_folder, tmp_path):
+    dcm2niix_output = tmp_path / "dcm2niix"
+    dcm2niix_output.mkdir()
+    subprocess.run(
+        [
+            Dcm2niix4PET.check_posix(),
+            "-b",
+            "y",
+            "-w",
+            "1",
+            "-z",
+            "y",
+            "-f",
+            "%p_%i_%t_%s",
+            "-o",
+            str(dcm2niix_output),
+            str(dicom_folder),
+        ],
+        capture_output=True,
+        check=True,
+    )
+    dicom2nii(dicom_folder, tmp_path / "native")
+    return dcm2niix_output, tmp_path / "native"
+
+
+@requires_dcm2niix
+def test_native_matches_dcm2niix(tmp_path):
+    write_pet_series(tmp_path / "dicoms", number_of_slices=5, number_of_frames=3)
+    dcm2niix_output, native_output = convert_with_both(tmp_path / "dicoms", tmp_path)
+
+    # the files are named the same way
+    assert sorted(p.name for p in native_output.iterdir()) == sorted(
+        p.name for p in dcm2niix_output.iterdir()
+    )
+    expected = nibabel.load(next(dcm2niix_output.glob("*.nii.gz")))
+    actual = nibabel.load(next(native_output.glob("*.nii.gz")))
+    assert actual.shape == expected.shape == (8, 8, 5, 3)
+    assert numpy.allclose(actual.affine, expected.affine)
+    assert numpy.array_equal(actual.get_fdata(), expected.get_fdata())
+    assert actual.header.get_zooms() == expected.header.get_zooms()
+
+    expected_sidecar = json.loads(next(dcm2niix_output.glob("*.json")).read_text())
+    actual_sidecar = json.loads(next(native_output.glob("*.json")).read_text())
+    for field, value in expected_sidecar.items():
+        if field not in differing_fields:
+            assert actual_sidecar[field] == value, field
+    assert actual_sidecar["InjectedRadioactivity"] == 370
+    assert actual_sidecar["InjectedRadioactivityUnits"] == "MBq"
+
+
+@requires_dcm2niix
+def test_native_applies_rescale_slope_per_slice(tmp_path):
+    for index, dicom_path in enumerate(write_pet_series(tmp_path / "dicoms")):
+        dicom = pydicom.dcmread(dicom_path)
+        dicom.RescaleSlope = 0.5 + index * 0.25
+        dicom.RescaleIntercept = index
+        dicom.save_as(dicom_path)
+    dcm2niix_output, native_output = convert_with_both(tmp_path / "dicoms", tmp_path)
+
+    expected = nibabel.load(next(dcm2niix_output.glob("*.nii.gz")))
+    actual = nibabel.load(next(native_output.glob("*.nii.gz")))
+    assert actual.get_data_dtype() == numpy.float32
+    assert numpy.allclose(actual.get_fdata(), expected.get_fdata())
+
+
+def test_native_slices_are_sorted_by_position(tmp_path):
+    dicom_paths = write_pet_series(tmp_path / "dicoms", number_of_frames=1)
+    # reverse the instance numbers so the file order no longer follows the slice order
+    for dicom_path in dicom_paths:
+        dicom = pydicom.dcmread(dicom_path)
+        dicom.InstanceNumber = len(dicom_paths) - dicom.InstanceNumber + 1
+        dicom.save_as(dicom_path)
+
+    nifti_path = dicom2nii(tmp_path / "dicoms", tmp_path / "native")[0]
+    volume = nibabel.load(nifti_path).get_fdata()
+    for slice_index, dicom_path in enumerate(dicom_paths):
+        pixels = pydicom.dcmread(dicom_path).pixel_array
+        assert numpy.array_equal(volume[:, ::-1, slice_index], pixels.T)
+
+
+def test_native_missing_images(tmp_path):
+    write_pet_series(tmp_path / "dicoms", skip_instances=[3])
+    with pytest.raises(ValueError, match="Missing images"):
+        dicom2nii(tmp_path / "dicoms", tmp_path / "native")
+
+
+def test_native_reads_pixel_data_of_pet_dicoms_only(tmp_path, monkeypatch):
+    write_pet_series(tmp_path / "dicoms", number_of_frames=1)
+    write_pet_series(tmp_path / "dicoms" / "ct", series_number=2, modality="CT")
+
+    full_reads = []
+    dcmread = pydicom.dcmread
+
+    def counting_dcmread(path, *args, **kwargs):
+        if not kwargs.get("stop_before_pixels"):
+            full_reads.append(path)
+        return dcmread(path, *args, **kwargs)
+
+    monkeypatch.setattr(pydicom, "dcmread", counting_dcmread)
+    series = read_pet_series(tmp_path / "dicoms")
+
+    assert len(series) == 1
+    assert len(next(iter(series.values()))) == 4
+    assert len(full_reads) == 4
+    assert not any("ct" in Path(path).parent.name for path in full_reads)
+
+
+def test_native_engine_conversion(tmp_path, monkeypatch):
+    monkeypatch.setenv("PET2BIDS_TELEMETRY_ENABLED", "false")
+    write_pet_series(tmp_path / "dicoms")
+    write_pet_series(tmp_path / "dicoms", series_number=2, modality="CT")
+
+    converter = Dcm2niix4PET(
+        tmp_path / "dicoms",
+        destination_path=tmp_path / "sub-01" / "pet",
+        dcm2niix_options="-b y -z n",
+        engine="native",
+        silent=True,
+    )
+    converter.run_dcm2niix()
+
+    created = sorted(p.name for p in (tmp_path / "sub-01" / "pet").iterdir())
+    assert len(created) == 2
+    assert created[1].endswith(".nii")
+    sidecar = json.loads((tmp_path / "sub-01" / "pet" / created[0]).read_text())
+    assert sidecar["ConversionSoftware"] == ["pydicom", "pypet2bids"]
+    assert sidecar["FrameDuration"] == [60, 60]
+
+    with pytest.raises(ValueError):
+        Dcm2niix4PET(tmp_path / "dicoms", tmp_path / "out", engine="unknown")
@@ -0,0 +1,55 @@
+import nibabel
+import numpy
+
+from pypet2bids.ecat2nii import ecat2nii
+from pypet2bids.ecat_fidelity import check_ecat_nifti_fidelity, iter_nifti_frames
+from pypet2bids.synthetic_ecat import SyntheticEcat
+
+
+def convert_synthetic_ecat(tmp_path, nifti_name="synthetic.nii.gz", **kwargs):
+    synthetic = SyntheticEcat(dimensions=(6, 5, 4), seed=11, **kwargs)
+    ecat_file = str(synthetic.write(tmp_path / "synthetic.v"))
+    nifti_file = str(tmp_path / nifti_name)
+    ecat2nii(ecat_file=ecat_file, nifti_file=nifti_file)
+    return synthetic, ecat_file, nifti_file
+
+
+def test_iter_nifti_frames_matches_nibabel(tmp_path):
+    synthetic, ecat_file, nifti_file = convert_synthetic_ecat(
+        tmp_path, number_of_frames=5
+    )
+    loaded = nibabel.load(nifti_file).get_fdata()
+    frames = list(iter_nifti_frames(nifti_file))
+
+    assert len(frames) == 5
+    for index, frame in enumerate(frames):
+        assert numpy.array_equal(frame, loaded[..., index])
+
+
+def test_converted_ecat_passes(tmp_path):
+    for data_type, number_of_frames in [(6, 3), (5, 33)]:
+        _, ecat_file, nifti_file = convert_synthetic_ecat(
+            tmp_path,
+            nifti_name=f"synthetic_{data_type}.nii",
+            number_of_frames=number_of_frames,
+            data_type=data_type,
+            scale_factor=0.25,
+        )
+        report = check_ecat_nifti_fidelity(ecat_file, nifti_file)
+
+        assert report["passed"]
+        assert len(report["frames"]) == number_of_frames
+        assert all(frame["correlation"] > 0.9999 for frame in report["frames"])
+
+
+def test_altered_nifti_fails(tmp_path):
+    _, ecat_file, nifti_file = convert_synthetic_ecat(tmp_path, number_of_frames=3)
+    nifti = nibabel.load(nifti_file)
+    data = nifti.get_fdata()
+    data[1, 2, 3, 1] += 1000
+    nibabel.save(nibabel.Nifti1Image(data, nifti.affine), nifti_file)
+
+    report = check_ecat_nifti_fidelity(ecat_file, nifti_file)
+
+    assert not report["passed"]
+    assert [frame["mismatched_voxels"] for frame in report["frames"]] == [0, 1, 0]
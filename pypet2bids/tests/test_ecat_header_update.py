@@ -0,0 +1,78 @@
+import gzip
+import shutil
+import pathlib
+
+from pypet2bids.read_ecat import read_ecat, read_main_header
+from pypet2bids.ecat_header_update import update_ecat_header, update_ecat_headers
+
+TESTS_DIR = pathlib.Path(__file__).resolve().parent
+PET2BIDS_DIR = TESTS_DIR.parent.parent
+
+synthetic_ecat_gz = (
+    PET2BIDS_DIR / "ecat_validation" / "synthetic_ecat_integer_16x16x16x4.v.gz"
+)
+
+
+def unzip_synthetic_ecat(destination: pathlib.Path) -> pathlib.Path:
+    with gzip.open(synthetic_ecat_gz, "rb") as infile:
+        with open(destination, "wb") as outfile:
+            shutil.copyfileobj(infile, outfile)
+    return destination
+
+
+def test_update_ecat_header_only_touches_main_header(tmp_path):
+    ecat_file = unzip_synthetic_ecat(tmp_path / "synthetic.v")
+    original_bytes = ecat_file.read_bytes()
+
+    diff = update_ecat_header(
+        ecat_file,
+        {"PATIENT_NAME": "Anonymous", "PATIENT_ID": 1234, "NOT_A_FIELD": 1},
+    )
+
+    assert diff == {
+        "PATIENT_NAME": ("Majesty", "Anonymous"),
+        "PATIENT_ID": ("PerfectPatient", "1234"),
+    }
+    updated_bytes = ecat_file.read_bytes()
+    assert len(updated_bytes) == len(original_bytes)
+    assert updated_bytes[512:] == original_bytes[512:]
+
+    main_header, version = read_main_header(str(ecat_file))
+    assert version == "73"
+    assert main_header["PATIENT_NAME"] == "Anonymous"
+    assert main_header["PATIENT_ID"] == "1234"
+
+    # the file should still be readable in its entirety
+    full_main_header, _, _ = read_ecat(str(ecat_file), collect_pixel_data=False)
+    assert full_main_header == main_header
+
+
+def test_update_ecat_header_rejects_mismatched_types(tmp_path):
+    ecat_file = unzip_synthetic_ecat(tmp_path / "synthetic.v")
+    original_bytes = ecat_file.read_bytes()
+
+    diff = update_ecat_header(ecat_file, {"NUM_FRAMES": "many", "NUM_PLANES": 1.5})
+
+    assert diff == {}
+    assert ecat_file.read_bytes() == original_bytes
+
+
+def test_dry_run_and_batch_update(tmp_path):
+    ecat_files = [
+        str(unzip_synthetic_ecat(tmp_path / f"synthetic_{i}.v")) for i in range(3)
+    ]
+    original_bytes = pathlib.Path(ecat_files[0]).read_bytes()
+
+    dry_run = update_ecat_headers(
+        ecat_files, {"PATIENT_NAME": "Anonymous"}, n_jobs=2, dry_run=True
+    )
+    assert all(
+        diff == {"PATIENT_NAME": ("Majesty", "Anonymous")} for diff in dry_run.values()
+    )
+    for ecat_file in ecat_files:
+        assert pathlib.Path(ecat_file).read_bytes() == original_bytes
+
+    results = update_ecat_headers(ecat_files, {"PATIENT_NAME": "Anonymous"}, n_jobs=2)
+    assert results == dry_run
+    for ecat_file in ecat_files:
+        assert read_main_header(ecat_file)[0]["PATIENT_NAME"] == "Anonymous"
@@ -188,6 +188,20 @@ def test_transform_row_to_dict():
     ] == helper_functions.transform_row_to_dict(0, simpler_df)["FrameTimesStart"]
 
 
+def test_evaluate_cells():
+    many_subjects_dataframe = pandas.read_excel(multi_subject_metadata_file)
+    evaluated = helper_functions.evaluate_cells(many_subjects_dataframe)
+    for index in range(len(many_subjects_dataframe)):
+        expected = helper_functions.transform_row_to_dict(
+            many_subjects_dataframe.iloc[index]
+        )
+        for key, value in evaluated.iloc[index].items():
+            if pandas.api.types.is_scalar(value) and pandas.isna(value):
+                assert pandas.isna(expected[key])
+            else:
+                assert value == expected[key]
+
+
 def test_get_coordinates_containing():
     given_data = {
         "columnA": ["string1", "string2", "string3", "muchlongerstringVALUE"],
@@ -337,6 +351,24 @@ def test_read_multi_sheet():
     assert multi_spreadsheet["TracerName"][0] == "OverrideTracerNameIn0thSheet"
 
 
+def test_open_metadata_usecols():
+    open_metadata = helper_functions.open_meta_data
+    multi_spreadsheet = open_metadata(
+        multi_sheet_metadata_file, usecols=["TimeZero", "TracerName", "NotAColumn"]
+    )
+    assert sorted(multi_spreadsheet.columns) == ["TimeZero", "TracerName"]
+    assert multi_spreadsheet["TracerName"][0] == "OverrideTracerNameIn0thSheet"
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        wide_csv = Path(tempdir) / "wide.csv"
+        wide = pandas.DataFrame({f"lab_{column}": [column] for column in range(200)})
+        wide["TracerName"] = "FDG"
+        wide.to_csv(wide_csv, index=False)
+        pruned = open_metadata(wide_csv, usecols={"TracerName", "InjectedMass"})
+        assert list(pruned.columns) == ["TracerName"]
+        assert pruned["TracerName"][0] == "FDG"
+
+
 def test_collect_pet_spreadsheets():
     pet_spreadsheet_dir = Path(single_subject_metadata_file).parent
     pet_spreadsheets = helper_functions.collect_spreadsheets(pet_spreadsheet_dir)
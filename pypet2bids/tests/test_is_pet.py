@@ -0,0 +1,113 @@
+import gzip
+import json
+import sys
+from pathlib import Path
+
+import pandas
+import pytest
+
+from pypet2bids.is_pet import (
+    iter_pet_files,
+    main,
+    pet_file,
+    pet_folder,
+    sniff_dicom_modality,
+    scan_files,
+    sniff_ecat_version,
+    spreadsheet_header,
+)
+from pypet2bids.synthetic_ecat import SyntheticEcat
+from tests.synthetic_dicoms import write_pet_series
+
+
+@pytest.mark.parametrize("sniff", [True, False])
+def test_pet_file(tmp_path, sniff):
+    pet = write_pet_series(tmp_path / "pet")
+    ct = write_pet_series(tmp_path / "ct", series_number=2, modality="CT")
+    ecat_file = SyntheticEcat(dimensions=(5, 4, 3), number_of_frames=2).write(
+        tmp_path / "synthetic.v"
+    )
+    pandas.DataFrame({"TracerName": ["FDG"], "InjectedRadioactivity": [1]}).to_csv(
+        tmp_path / "metadata.tsv", sep="\t", index=False
+    )
+    pandas.DataFrame({"Weight": [70]}).to_excel(tmp_path / "other.xlsx", index=False)
+    (tmp_path / "notes.txt").write_text("not a pet file")
+
+    assert pet_file(pet[0], sniff=sniff) == (True, "DICOM")
+    assert pet_file(ct[0], sniff=sniff) == (False, "")
+    assert pet_file(ecat_file, sniff=sniff) == (True, "ECAT")
+    assert pet_file(tmp_path / "metadata.tsv", sniff=sniff) == (True, "SPREADSHEET")
+    assert pet_file(tmp_path / "other.xlsx", sniff=sniff) == (False, "")
+    assert pet_file(tmp_path / "notes.txt", sniff=sniff) == (False, "")
+    assert pet_folder(tmp_path, sniff=sniff) == {tmp_path, tmp_path / "pet"}
+
+
+def test_sniffing_reads_only_headers(tmp_path):
+    pet = write_pet_series(tmp_path / "pet", rows=64, columns=64)
+    # without its pixel data the dicom can only be classified from its header
+    truncated_dicom = tmp_path / "truncated.dcm"
+    truncated_dicom.write_bytes(pet[0].read_bytes()[:2048])
+    assert sniff_dicom_modality(truncated_dicom) == "PT"
+    assert pet_file(truncated_dicom) == (True, "DICOM")
+
+    ecat_file = SyntheticEcat(dimensions=(5, 4, 3), number_of_frames=2).write(
+        tmp_path / "synthetic.v"
+    )
+    truncated_ecat = tmp_path / "truncated.v"
+    truncated_ecat.write_bytes(ecat_file.read_bytes()[:512])
+    assert sniff_ecat_version(truncated_ecat) == "73"
+    with gzip.open(tmp_path / "synthetic.v.gz", "wb") as outfile:
+        outfile.write(ecat_file.read_bytes())
+    assert sniff_ecat_version(tmp_path / "synthetic.v.gz") == "73"
+
+    not_an_ecat = tmp_path / "not_an_ecat.v"
+    not_an_ecat.write_bytes(b"\x00" * 1024)
+    assert sniff_ecat_version(not_an_ecat) is None
+    assert sniff_dicom_modality(not_an_ecat) is None
+
+
+def test_spreadsheet_header(tmp_path):
+    with pandas.ExcelWriter(tmp_path / "sheets.xlsx") as writer:
+        pandas.DataFrame({"TracerName": ["FDG"]}).to_excel(
+            writer, sheet_name="first", index=False
+        )
+        pandas.DataFrame({"ModeOfAdministration": ["bolus"]}).to_excel(
+            writer, sheet_name="second", index=False
+        )
+    assert spreadsheet_header(tmp_path / "sheets.xlsx") == [
+        "TracerName",
+        "ModeOfAdministration",
+    ]
+    (tmp_path / "sheet.csv").write_text("TracerName,TimeZero\nFDG,12:00:00\n")
+    assert spreadsheet_header(tmp_path / "sheet.csv") == ["TracerName", "TimeZero"]
+
+
+def test_iter_pet_files(tmp_path, monkeypatch, capsys):
+    write_pet_series(tmp_path / "sub-01" / "pet", number_of_frames=4)
+    write_pet_series(tmp_path / "sub-01" / "ct", series_number=2, modality="CT")
+    write_pet_series(tmp_path / "sub-02", series_number=3)
+    (tmp_path / "sub-02" / "notes").write_text("not a pet file")
+    (tmp_path / "empty").mkdir()
+
+    assert len(list(scan_files(tmp_path))) == 4 * 4 + 8 + 8 + 1
+    # only a single pet file is reported for each folder
+    found = list(iter_pet_files(tmp_path, njobs=2))
+    assert sorted(path.parent for path, _ in found) == [
+        tmp_path / "sub-01" / "pet",
+        tmp_path / "sub-02",
+    ]
+    assert all(file_type == "DICOM" for _, file_type in found)
+    assert len(list(iter_pet_files(tmp_path, skim=True))) == 2
+
+    monkeypatch.setattr(sys, "argv", ["ispet", str(tmp_path), "--jsonl"])
+    main()
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert sorted(line["folder"] for line in lines) == [
+        str(tmp_path / "sub-01" / "pet"),
+        str(tmp_path / "sub-02"),
+    ]
+    assert all(Path(line["path"]).is_file() for line in lines)
+
+    monkeypatch.setattr(sys, "argv", ["ispet", str(tmp_path / "empty")])
+    with pytest.raises(SystemExit):
+        main()
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import pandas
+
+from pypet2bids.multiple_spreadsheets import read_multi_subject_spreadsheets
+
+many_subjects_folder = (
+    Path(__file__).parent.parent.parent
+    / "spreadsheet_conversion"
+    / "many_subjects_sheet"
+)
+scanner_metadata_file = many_subjects_folder / "scanner_metadata_example.xlsx"
+
+
+def test_subjects_get_their_own_metadata():
+    subjects = read_multi_subject_spreadsheets(
+        scanner_metadata_file,
+        many_subjects_folder / "subjects_metadata_example.xlsx",
+        TimeZero="12:00:00",
+    )
+    assert len(subjects) == 9
+    assert subjects["sub-01"]["InjectedRadioactivity"] == 397
+    assert subjects["sub-02"]["InjectedRadioactivity"] == 551
+    assert len(set(id(metadata) for metadata in subjects.values())) == 9
+    # array like cells are parsed into lists and empty cells fall back to the general metadata
+    assert "DecayCorrectionFactor" not in subjects["sub-01"]
+    assert subjects["sub-03"]["DecayCorrectionFactor"][0] == 1.017132639884949
+    assert subjects["sub-01"]["FrameTimesStart"][:3] == [0, 10, 20]
+    # spreadsheet values take precedence over kwargs
+    assert subjects["sub-01"]["TimeZero"] != "12:00:00"
+    assert subjects["sub-01"]["TracerName"] == "CIMBI-36"
+
+
+def test_large_cohort(tmp_path):
+    number_of_subjects = 2000
+    pandas.DataFrame(
+        {
+            "participant_id": [
+                f"/data/sub-{subject:05d}/ses-baseline/pet"
+                for subject in range(number_of_subjects)
+            ],
+            "InjectedRadioactivity": range(number_of_subjects),
+            "FrameDuration": ["10,10,20,60"] * number_of_subjects,
+        }
+    ).to_csv(tmp_path / "subjects.csv", index=False)
+
+    subjects = read_multi_subject_spreadsheets(
+        scanner_metadata_file, tmp_path / "subjects.csv"
+    )
+
+    assert len(subjects) == number_of_subjects
+    assert subjects["sub-01999"]["InjectedRadioactivity"] == 1999
+    assert subjects["sub-01999"]["FrameDuration"] == [10, 10, 20, 60]
+    assert subjects["sub-01999"]["session_id"] == "ses-baseline"
+    subjects["sub-00000"]["FrameDuration"].append(0)
+    assert subjects["sub-00001"]["FrameDuration"] == [10, 10, 20, 60]
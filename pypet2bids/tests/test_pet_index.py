@@ -0,0 +1,96 @@
+import json
+import os
+import sys
+
+import pytest
+
+from pypet2bids.is_pet import main
+from pypet2bids.pet_index import PetIndex, examine_file
+from pypet2bids.synthetic_ecat import SyntheticEcat
+from tests.synthetic_dicoms import write_pet_series
+
+
+def write_archive(archive):
+    write_pet_series(archive / "first", patient_id="PET001", number_of_frames=3)
+    write_pet_series(archive / "first_ct", patient_id="PET001", modality="CT")
+    write_pet_series(archive / "second", patient_id="PET002", series_number=2)
+    (archive / "ecats").mkdir()
+    SyntheticEcat(dimensions=(5, 4, 3), number_of_frames=2).write(
+        archive / "ecats" / "scan.v"
+    )
+
+
+def test_examine_file(tmp_path):
+    pet = write_pet_series(tmp_path / "pet", patient_id="PET001", number_of_frames=3)
+    record = examine_file(pet[0])
+    assert record["type"] == "DICOM"
+    assert record["patient_id"] == "PET001"
+    assert record["series_instance_uid"]
+    assert record["frames"] == 3
+
+    ecat_file = SyntheticEcat(dimensions=(5, 4, 3), number_of_frames=2).write(
+        tmp_path / "scan.v"
+    )
+    record = examine_file(ecat_file)
+    assert (record["type"], record["sw_version"], record["frames"]) == ("ECAT", "73", 2)
+
+    (tmp_path / "notes.txt").write_text("not a pet file")
+    assert examine_file(tmp_path / "notes.txt")["type"] == ""
+
+
+def test_refresh_only_examines_changed_files(tmp_path):
+    archive = tmp_path / "archive"
+    write_archive(archive)
+
+    with PetIndex(tmp_path / "index.sqlite") as index:
+        counts = index.refresh(archive)
+        assert counts == {"examined": 4 * 3 + 8 + 8 + 1, "unchanged": 0, "removed": 0}
+        series = index.pet_series()
+        assert [entry["input"] for entry in series] == [
+            str(archive / "ecats" / "scan.v"),
+            str(archive / "first"),
+            str(archive / "second"),
+        ]
+        assert series[1]["files"] == 12 and series[1]["frames"] == 3
+        assert [entry["input"] for entry in index.pet_series(patient_id="PET002")] == [
+            str(archive / "second")
+        ]
+
+    touched = next((archive / "first").iterdir())
+    os.utime(touched, ns=(0, 0))
+    for removed in (archive / "second").iterdir():
+        removed.unlink()
+
+    with PetIndex(tmp_path / "index.sqlite") as index:
+        counts = index.refresh(archive)
+        assert counts == {"examined": 1, "unchanged": 4 * 3 + 8, "removed": 8}
+        assert index.pet_series(patient_id="PET002") == []
+
+
+def test_index_command_line(tmp_path, monkeypatch, capsys):
+    archive = tmp_path / "archive"
+    write_archive(archive)
+    database = str(archive / "index.sqlite")
+
+    monkeypatch.setattr(sys, "argv", ["ispet", str(archive), "--index", database])
+    main()
+    assert capsys.readouterr().out.splitlines() == [
+        str(archive / "ecats" / "scan.v"),
+        str(archive / "first"),
+        str(archive / "second"),
+    ]
+
+    monkeypatch.setattr(
+        sys, "argv", ["ispet", "--index", database, "--subject", "PET001", "--jsonl"]
+    )
+    main()
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(line["type"], line["input"]) for line in lines] == [
+        ("DICOM", str(archive / "first"))
+    ]
+
+    monkeypatch.setattr(
+        sys, "argv", ["ispet", "--index", database, "--subject", "nobody"]
+    )
+    with pytest.raises(SystemExit):
+        main()
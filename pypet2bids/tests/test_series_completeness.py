@@ -0,0 +1,116 @@
+import shutil
+import sys
+
+import pandas
+import pydicom
+import pytest
+
+from pypet2bids.dcm2niix4pet import (
+    Dcm2niix4PET,
+    check_series_completeness,
+    main,
+    run_batch,
+)
+from tests.synthetic_dicoms import write_pet_series
+
+
+def test_complete_series(tmp_path):
+    write_pet_series(tmp_path, number_of_slices=4, number_of_frames=3)
+    write_pet_series(tmp_path, series_number=2, modality="CT", skip_instances=[1])
+
+    report = check_series_completeness(tmp_path)
+
+    assert report["complete"]
+    # only PET series are checked
+    assert len(report["series"]) == 1
+    series_report = list(report["series"].values())[0]
+    assert series_report["expected_images"] == series_report["found_images"] == 12
+    assert series_report["missing"] == series_report["duplicates"] == []
+
+
+def test_incomplete_series(tmp_path):
+    dicom_paths = write_pet_series(
+        tmp_path, number_of_slices=4, number_of_frames=3, skip_instances=[6, 12]
+    )
+    shutil.copy(dicom_paths[0], tmp_path / "copy_of_first.dcm")
+    dicom = pydicom.dcmread(dicom_paths[1])
+    dicom.ImageIndex = 40
+    dicom.save_as(dicom_paths[1])
+
+    report = check_series_completeness(tmp_path)
+
+    assert not report["complete"]
+    series_report = list(report["series"].values())[0]
+    assert series_report["missing"] == [
+        {"slice": 2, "frame": 1},
+        {"slice": 2, "frame": 2},
+        {"slice": 4, "frame": 3},
+    ]
+    assert series_report["duplicates"][0]["slice"] == 1
+    assert len(series_report["duplicates"][0]["files"]) == 2
+    assert series_report["unexpected"][0]["image_index"] == 40
+
+
+@pytest.mark.parametrize("tag", ["NumberOfTimeSlices", "ImageIndex"])
+def test_series_that_cant_be_checked_are_left_to_dcm2niix(tmp_path, tag):
+    for dicom_path in write_pet_series(
+        tmp_path, number_of_slices=4, number_of_frames=2
+    ):
+        dicom = pydicom.dcmread(dicom_path)
+        delattr(dicom, tag)
+        # instance numbers aren't guaranteed to run from 1 within a series
+        dicom.InstanceNumber += 100
+        dicom.save_as(dicom_path)
+
+    report = check_series_completeness(tmp_path)
+
+    assert report["complete"]
+    series_report = list(report["series"].values())[0]
+    assert series_report["complete"] is None
+    assert tag in series_report["error"]
+    assert series_report["unexpected"] == series_report["missing"] == []
+
+
+def test_incomplete_series_are_not_converted(tmp_path, monkeypatch):
+    monkeypatch.setenv("PET2BIDS_TELEMETRY_ENABLED", "false")
+    write_pet_series(tmp_path / "dicoms" / "partial", skip_instances=[8])
+    write_pet_series(tmp_path / "dicoms" / "whole", series_number=2)
+
+    converter = Dcm2niix4PET(
+        tmp_path / "dicoms" / "partial",
+        destination_path=tmp_path / "single",
+        engine="native",
+        check_completeness=True,
+    )
+    with pytest.raises(FileNotFoundError, match="has 7 of 8 images"):
+        converter.run_dcm2niix()
+    assert not (tmp_path / "single").exists()
+
+    manifest = tmp_path / "manifest.tsv"
+    pandas.DataFrame(
+        [
+            {"folder": str(tmp_path / "dicoms" / "partial")},
+            {"folder": str(tmp_path / "dicoms" / "whole")},
+        ]
+    ).to_csv(manifest, sep="\t", index=False)
+    results = run_batch(
+        manifest, options={"engine": "native", "check_completeness": True}
+    )
+
+    assert list(results["status"]) == ["deferred", "success"]
+    assert "missing from frames [2]" in results["error"][0]
+
+    # deferred rows don't make the batch exit with an error
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "dcm2niix4pet",
+            "--batch",
+            str(manifest),
+            "--engine",
+            "native",
+            "--check-completeness",
+        ],
+    )
+    main()
@@ -0,0 +1,122 @@
+import json
+
+import pytest
+
+from pypet2bids.multiple_spreadsheets import write_multi_subject_spreadsheets
+from pypet2bids.update_json_pet_file import SidecarBuilder, check_json, write_sidecars
+
+
+def test_layers_are_applied_in_order(tmp_path):
+    json_path = tmp_path / "sub-01_pet.json"
+    json_path.write_text(
+        json.dumps({"Units": "BQML", "TracerName": "dcm2niix", "Modality": "PT"})
+    )
+    sidecar = SidecarBuilder(json_path)
+    sidecar.update("kwargs", {"TracerName": "kwargs"})
+    sidecar.update("spreadsheet", {"TracerName": "spreadsheet", "InjectedMass": 5})
+    sidecar.update("header", {"TracerName": "header", "Units": "Bq/mL"})
+    sidecar.update("derived", {"InjectedMass": 1, "BodyPart": None})
+
+    assert sidecar.get("TracerName") == "kwargs"
+    assert sidecar.get("InjectedMass") == 5
+    assert sidecar.get("Units") == "Bq/mL"
+
+    # removing never touches values supplied by the user
+    sidecar.remove("TracerName", "Modality")
+    assert sidecar.get("TracerName") == "kwargs"
+    assert "Modality" not in sidecar.data
+
+    sidecar.add_normalizer(lambda data: {"TracerName": data["TracerName"].upper()})
+    # nothing is written until write is called
+    assert json.loads(json_path.read_text())["TracerName"] == "dcm2niix"
+    sidecar.write()
+
+    written = json.loads(json_path.read_text())
+    assert written == {
+        "Units": "Bq/mL",
+        "TracerName": "KWARGS",
+        "InjectedMass": 5,
+        "BodyPart": "none",
+    }
+    assert list(tmp_path.iterdir()) == [json_path]
+
+    with pytest.raises(ValueError):
+        sidecar.update("dicom", {})
+
+
+def test_radio_inputs_and_prune():
+    template = {"TimeZero": "", "BodyPart": "", "FrameDuration": [None, None]}
+    sidecar = SidecarBuilder(template, bids_null=False)
+    sidecar.update("kwargs", {"InjectedRadioactivity": 100, "InjectedMass": 10})
+    sidecar.apply_radio_inputs()
+
+    assert sidecar.get("SpecificRadioactivity") == 10
+    assert sidecar.get("InjectedMassUnits") == "ug"
+
+    removed = sidecar.prune(keep=["TimeZero"])
+    assert sorted(map(str, removed)) == ["", "[None, None]"]
+    assert "TimeZero" in sidecar.data and "BodyPart" not in sidecar.data
+    # the template handed to the builder is left as it was
+    assert template == {"TimeZero": "", "BodyPart": "", "FrameDuration": [None, None]}
+
+
+def test_check_json_accepts_loaded_sidecar(tmp_path):
+    sidecar = {"Manufacturer": "Siemens", "Units": "Bq/mL"}
+    json_path = tmp_path / "sidecar.json"
+    json_path.write_text(json.dumps(sidecar))
+
+    assert check_json(sidecar, silent=True) == check_json(json_path, silent=True)
+
+
+def test_write_sidecars(tmp_path):
+    existing = tmp_path / "sub-01_pet.json"
+    existing.write_text(json.dumps({"TracerName": "FDG", "Units": "Bq/mL"}))
+
+    updates = [
+        (existing, {"TracerName": "FLT"}),
+        (tmp_path / "sub-02_pet.json", {"TracerName": "FDG"}),
+        (existing, {"InjectedMass": 1.5}),
+    ]
+    reports = write_sidecars(updates, dry_run=True)
+    assert [report["path"] for report in reports] == [
+        str(existing),
+        str(tmp_path / "sub-02_pet.json"),
+    ]
+    assert reports[0]["changed"] == {"TracerName": ["FDG", "FLT"]}
+    assert reports[0]["added"] == {"InjectedMass": 1.5}
+    assert reports[1]["created"]
+    assert not any(report["written"] for report in reports)
+    assert json.loads(existing.read_text())["TracerName"] == "FDG"
+    assert not (tmp_path / "sub-02_pet.json").exists()
+
+    reports = write_sidecars(updates)
+    assert all(report["written"] for report in reports)
+    assert json.loads(existing.read_text()) == {
+        "TracerName": "FLT",
+        "Units": "Bq/mL",
+        "InjectedMass": 1.5,
+    }
+    # nothing left to change so nothing is rewritten
+    assert not any(report["written"] for report in write_sidecars(updates))
+
+
+def test_write_multi_subject_spreadsheets(tmp_path):
+    subjects = {
+        "sub-01": {"TracerName": "FDG", "session_id": "ses-01"},
+        "sub-02": {"TracerName": "FLT"},
+    }
+    reports = write_multi_subject_spreadsheets(
+        subjects, tmp_path, create_bids_tree=True
+    )
+    assert len(reports) == 2
+    assert (
+        json.loads(
+            (
+                tmp_path / "sub-01" / "ses-01" / "pet" / "sub-01_ses-01_pet.json"
+            ).read_text()
+        )["TracerName"]
+        == "FDG"
+    )
+    write_multi_subject_spreadsheets(subjects, tmp_path)
+    assert (tmp_path / "sub-01_ses-01_pet.json").is_file()
+    assert (tmp_path / "sub-02_pet.json").is_file()
@@ -0,0 +1,108 @@
+import os
+import time
+from pathlib import Path
+
+import pandas
+import pytest
+
+import pypet2bids.helper_functions as helper_functions
+from pypet2bids.spreadsheet_cache import (
+    SpreadsheetCache,
+    parsed_spreadsheets,
+    spreadsheet_cache,
+)
+from pypet2bids.update_json_pet_file import get_metadata_from_spreadsheet
+
+
+def write_sheet(path, tracer="FDG"):
+    pandas.DataFrame(
+        {"TracerName": [tracer], "TimeZero": ["12:00:00"], "Unrelated": [1]}
+    ).to_excel(path, index=False)
+
+
+def test_cache_is_opt_in(tmp_path, monkeypatch):
+    monkeypatch.delenv("PET2BIDS_SPREADSHEET_CACHE", raising=False)
+    monkeypatch.setattr(
+        "pypet2bids.spreadsheet_cache.config_path", tmp_path / "missing"
+    )
+    assert spreadsheet_cache() is None
+    monkeypatch.setenv("PET2BIDS_SPREADSHEET_CACHE", str(tmp_path / "cache"))
+    monkeypatch.setenv("PET2BIDS_SPREADSHEET_CACHE_SIZE", "1")
+    cache = spreadsheet_cache()
+    assert cache.folder == tmp_path / "cache"
+    assert cache.max_bytes == 1024**2
+
+
+def test_cached_spreadsheets(tmp_path, monkeypatch):
+    monkeypatch.setenv("PET2BIDS_SPREADSHEET_CACHE", str(tmp_path / "cache"))
+    sheet = tmp_path / "metadata.xlsx"
+    write_sheet(sheet)
+
+    first = helper_functions.open_meta_data(sheet)
+    metadata = helper_functions.single_spreadsheet_reader(sheet)
+    assert metadata["TracerName"] == "FDG"
+
+    def fail(*args, **kwargs):
+        pytest.fail("read a cached spreadsheet again")
+
+    # both the dataframe and the metadata collected from it come from the cache
+    with monkeypatch.context() as patched:
+        patched.setattr(helper_functions, "read_excel", fail)
+        patched.setattr(helper_functions, "open_meta_data", fail)
+        assert helper_functions.single_spreadsheet_reader(sheet) == metadata
+    with monkeypatch.context() as patched:
+        patched.setattr(helper_functions, "read_excel", fail)
+        pandas.testing.assert_frame_equal(helper_functions.open_meta_data(sheet), first)
+
+    # an edited spreadsheet is read again
+    write_sheet(sheet, tracer="FLT")
+    assert helper_functions.single_spreadsheet_reader(sheet)["TracerName"] == "FLT"
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    sheet = tmp_path / "metadata.xlsx"
+    write_sheet(sheet)
+    cache = SpreadsheetCache(tmp_path / "cache", max_bytes=2500)
+    keys = [cache.key(sheet, "test", number=number) for number in range(3)]
+
+    cache.put(keys[0], b"0" * 1000)
+    cache.put(keys[1], b"1" * 1000)
+    # using the first entry makes the second the least recently used
+    past = time.time() - 60
+    os.utime(cache.folder / (keys[1] + cache.suffix), (past, past))
+    assert cache.get(keys[0]) == b"0" * 1000
+    cache.put(keys[2], b"2" * 1000)
+
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+
+
+def test_spreadsheets_are_parsed_once_per_process(tmp_path, monkeypatch):
+    monkeypatch.delenv("PET2BIDS_SPREADSHEET_CACHE", raising=False)
+    monkeypatch.setattr(
+        "pypet2bids.spreadsheet_cache.config_path", tmp_path / "missing"
+    )
+    parsed_spreadsheets.clear()
+    write_sheet(tmp_path / "metadata.xlsx")
+    pandas.DataFrame({"Unrelated": [1]}).to_excel(tmp_path / "other.xlsx", index=False)
+
+    parsed = []
+    read_excel = helper_functions.read_excel
+
+    def counting_read_excel(path, *args, **kwargs):
+        parsed.append(Path(path).name)
+        return read_excel(path, *args, **kwargs)
+
+    monkeypatch.setattr(helper_functions, "read_excel", counting_read_excel)
+    # every converter collecting metadata from the folder shares the parsed spreadsheets
+    for _ in range(3):
+        values = get_metadata_from_spreadsheet(tmp_path, tmp_path)
+        assert values["nifti_json"]["TracerName"] == "FDG"
+    assert sorted(parsed) == ["metadata.xlsx", "other.xlsx"]
+
+    # modified spreadsheets are parsed again
+    write_sheet(tmp_path / "metadata.xlsx", tracer="FLUORO")
+    values = get_metadata_from_spreadsheet(tmp_path, tmp_path)
+    assert values["nifti_json"]["TracerName"] == "FLUORO"
+    assert sorted(parsed) == ["metadata.xlsx", "metadata.xlsx", "other.xlsx"]
@@ -0,0 +1,133 @@
+import json
+
+import nibabel
+import numpy
+import pytest
+
+import pypet2bids.pet_metadata as metadata
+from pypet2bids.validate import cli, compile_field, validate_dataset, validate_sidecar
+
+
+def valid_sidecar(frames=3):
+    sidecar = {field: "value" for field in metadata.PET_metadata["mandatory"]}
+    sidecar.update(
+        {
+            "Units": "Bq/mL",
+            "InjectedRadioactivity": 185.0,
+            "InjectedRadioactivityUnits": "MBq",
+            "InjectedMass": "n/a",
+            "InjectedMassUnits": "n/a",
+            "SpecificRadioactivity": "n/a",
+            "SpecificRadioactivityUnits": "n/a",
+            "TimeZero": "12:00:00",
+            "ScanStart": 0,
+            "InjectionStart": 0,
+            "FrameTimesStart": [60.0 * frame for frame in range(frames)],
+            "FrameDuration": [60.0] * frames,
+            "ImageDecayCorrected": True,
+            "ImageDecayCorrectionTime": 0,
+            "ReconMethodParameterLabels": ["subsets", "iterations"],
+            "ReconMethodParameterUnits": ["none", "none"],
+            "ReconMethodParameterValues": [21, 3],
+            "ReconFilterType": "none",
+            "ReconFilterSize": 0,
+        }
+    )
+    return sidecar
+
+
+def write_pet(folder, sidecar, frames=3):
+    folder.mkdir(parents=True, exist_ok=True)
+    with open(folder / "sub-01_pet.json", "w") as outfile:
+        json.dump(sidecar, outfile)
+    nibabel.save(
+        nibabel.Nifti1Image(
+            numpy.zeros((2, 2, 2, frames), numpy.float32), numpy.eye(4)
+        ),
+        folder / "sub-01_pet.nii.gz",
+    )
+    return folder / "sub-01_pet.json"
+
+
+def test_compile_field():
+    purity = compile_field("Purity", metadata.schema["objects"]["metadata"]["Purity"])
+    assert purity(99.5) == []
+    assert purity(101) and purity("99") and purity(True) and purity(None)
+
+    injected_mass = compile_field(
+        "InjectedMass", metadata.schema["objects"]["metadata"]["InjectedMass"]
+    )
+    assert injected_mass(5.0) == [] and injected_mass("n/a") == []
+    assert injected_mass("unknown")
+
+    labels = compile_field(
+        "ReconMethodParameterLabels",
+        metadata.schema["objects"]["metadata"]["ReconMethodParameterLabels"],
+    )
+    assert labels(["subsets"]) == []
+    assert labels(["subsets", 3]) == [
+        "ReconMethodParameterLabels item is 3, expected a string (index 1)"
+    ]
+
+
+def test_validate_sidecar(tmp_path):
+    assert validate_sidecar(write_pet(tmp_path / "valid", valid_sidecar()))["valid"]
+
+    sidecar = valid_sidecar()
+    del sidecar["TracerName"]
+    sidecar["TimeZero"] = "noon"
+    sidecar["ImageDecayCorrected"] = "yes"
+    result = validate_sidecar(write_pet(tmp_path / "invalid", sidecar, frames=4))
+    assert not result["valid"]
+    assert result["missing"] == ["TracerName"]
+    assert result["frames"] == 4
+    assert sorted(error["field"] for error in result["errors"]) == [
+        "FrameDuration",
+        "FrameTimesStart",
+        "ImageDecayCorrected",
+        "TimeZero",
+    ]
+
+    blood = tmp_path / "sub-01_recording-manual_blood.json"
+    blood.write_text(
+        json.dumps(
+            {
+                "PlasmaAvail": True,
+                "WholeBloodAvail": False,
+                "MetaboliteAvail": True,
+                "DispersionCorrected": False,
+            }
+        )
+    )
+    assert validate_sidecar(blood)["missing"] == [
+        "MetaboliteMethod",
+        "MetaboliteRecoveryCorrectionApplied",
+    ]
+
+
+def test_validate_dataset(tmp_path, capsys):
+    write_pet(tmp_path / "sub-01" / "pet", valid_sidecar())
+    sidecar = valid_sidecar()
+    sidecar["InjectedRadioactivity"] = "lots"
+    write_pet(tmp_path / "sub-02" / "pet", sidecar)
+    # derivatives aren't part of the raw dataset
+    write_pet(tmp_path / "derivatives" / "sub-01" / "pet", {})
+
+    for n_jobs in (1, 2):
+        report = validate_dataset(tmp_path, n_jobs=n_jobs)
+        assert report["summary"] == {"checked": 2, "valid": 1, "invalid": 1}
+
+    with pytest.raises(SystemExit):
+        cli([str(tmp_path), "--invalid-only"])
+    # stdout only holds the report
+    output = capsys.readouterr()
+    report = json.loads(output.out)
+    assert "1 invalid" in output.err
+    assert [result["errors"] for result in report["sidecars"]] == [
+        [
+            {
+                "field": "InjectedRadioactivity",
+                "message": "InjectedRadioactivity is 'lots', expected a number",
+            }
+        ]
+    ]
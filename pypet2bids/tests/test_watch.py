@@ -0,0 +1,189 @@
+import sys
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+from pypet2bids.conversion_manifest import manifest_name
+from pypet2bids.synthetic_ecat import SyntheticEcat
+from pypet2bids.watch import InotifyMonitor, Watcher, convert_ecat, ecat_is_complete
+from tests.synthetic_dicoms import write_pet_series
+
+rule = r"(?P<sub>[^_/]+)_(?P<ses>[^_/]+)"
+
+
+def test_ecat_is_complete(tmp_path):
+    ecat_file = SyntheticEcat(dimensions=(5, 4, 3), number_of_frames=3).write(
+        tmp_path / "complete.v"
+    )
+    assert ecat_is_complete(ecat_file)
+
+    truncated = tmp_path / "truncated.v"
+    truncated.write_bytes(ecat_file.read_bytes()[:-512])
+    assert not ecat_is_complete(truncated)
+
+
+def test_convert_ecat_outputs_are_only_its_own(tmp_path, monkeypatch):
+    monkeypatch.setenv("PET2BIDS_TELEMETRY_ENABLED", "false")
+    destination = tmp_path / "bids" / "sub-01" / "pet"
+    results = {}
+    for tracer in ("fdg", "raclopride"):
+        ecat_file = SyntheticEcat(dimensions=(5, 4, 3), number_of_frames=2).write(
+            tmp_path / f"{tracer}.v"
+        )
+        results[tracer] = convert_ecat(
+            ecat_file,
+            destination / f"sub-01_trc-{tracer}_pet.nii",
+            "TimeZero=12:00:00",
+        )
+
+    # both ECATs are converted into the same folder, each only records what it wrote
+    for tracer, result in results.items():
+        assert result["status"] == "success", result["error"]
+        assert sorted(Path(output).name for output in result["outputs"].split(",")) == [
+            f"sub-01_trc-{tracer}_pet.json",
+            f"sub-01_trc-{tracer}_pet.nii.gz",
+        ]
+
+
+def test_destination_rules(tmp_path):
+    watcher = Watcher(
+        tmp_path / "landing",
+        tmp_path / "bids",
+        rules=[r"^(?P<sub>\d+)/(?P<trc>[a-z]+)", rule],
+    )
+    assert watcher.destination(tmp_path / "landing" / "PET001_baseline" / "ct") == (
+        tmp_path
+        / "bids"
+        / "sub-PET001"
+        / "ses-baseline"
+        / "pet"
+        / "sub-PET001_ses-baseline_pet"
+    )
+    assert watcher.destination(tmp_path / "landing" / "007" / "fdg") == (
+        tmp_path / "bids" / "sub-007" / "pet" / "sub-007_trc-fdg_pet"
+    )
+    assert watcher.destination(tmp_path / "landing" / "unmatched") is None
+    with pytest.raises(ValueError):
+        Watcher(tmp_path / "landing", tmp_path / "bids", rules=["(?P<ses>.*)"])
+    # no worker processes are started until something is converted
+    assert watcher.executor is None
+
+
+def test_failed_conversions_are_retried(tmp_path, monkeypatch):
+    monkeypatch.setenv("PET2BIDS_TELEMETRY_ENABLED", "false")
+    landing = tmp_path / "landing"
+    landing.mkdir()
+    SyntheticEcat(dimensions=(5, 4, 3), number_of_frames=2).write(
+        landing / "PET001_baseline.v"
+    )
+    watcher = Watcher(
+        landing, tmp_path / "bids", rules=[rule], quiet_period=0, retry_delay=0
+    )
+
+    outcomes = [
+        BrokenProcessPool("a worker died"),
+        {"status": "failed", "error": "Exception: nope", "outputs": ""},
+    ]
+    submitted = []
+
+    def submit(unit, destination):
+        submitted.append(unit)
+        future = Future()
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            future.set_exception(outcome)
+        else:
+            future.set_result(outcome)
+        return future
+
+    monkeypatch.setattr(watcher, "submit", submit)
+    watcher.step()
+    # a broken pool is logged rather than stopping the watcher
+    assert [result["status"] for _, result in watcher.step()] == ["failed"]
+    assert landing / "PET001_baseline.v" not in watcher.handled
+    assert [result["status"] for _, result in watcher.step()] == ["failed"]
+    assert watcher.failed[landing / "PET001_baseline.v"][1] == 2
+
+    # after a failure the unit waits retry_delay, doubled for every earlier failure, before it's tried again
+    watcher.retry_delay = 600
+    outcomes.append({"status": "failed", "error": "Exception: nope", "outputs": ""})
+    watcher.step()
+    assert watcher.failed[landing / "PET001_baseline.v"][1] == 3
+    assert watcher.failed[landing / "PET001_baseline.v"][2] > time.monotonic() + 2000
+    watcher.step()
+    assert len(submitted) == 3
+
+
+def test_watcher_converts_complete_units(tmp_path, monkeypatch):
+    monkeypatch.setenv("PET2BIDS_TELEMETRY_ENABLED", "false")
+    landing = tmp_path / "landing"
+    write_pet_series(landing / "PET001_baseline")
+    write_pet_series(landing / "PET002_baseline", skip_instances=[3])
+    landing.mkdir(exist_ok=True)
+    SyntheticEcat(dimensions=(5, 4, 3), number_of_frames=2).write(
+        landing / "PET003_followup.v"
+    )
+
+    watcher = Watcher(
+        landing,
+        tmp_path / "bids",
+        rules=[rule],
+        quiet_period=0,
+        options={"engine": "native", "silent": True},
+        kwargs="TimeZero=12:00:00",
+    )
+    # the first pass only records what's in the landing folder, the incomplete series is never converted
+    watcher.step()
+    results = []
+    deadline = time.monotonic() + 60
+    while len(results) < 2 and time.monotonic() < deadline:
+        results.extend(watcher.step())
+        time.sleep(0.1)
+
+    assert sorted(unit.name for unit, _ in results) == [
+        "PET001_baseline",
+        "PET003_followup.v",
+    ]
+    assert all(result["status"] == "success" for _, result in results)
+    assert list(
+        (tmp_path / "bids" / "sub-PET001" / "ses-baseline" / "pet").glob("*.nii.gz")
+    )
+    assert list(
+        (tmp_path / "bids" / "sub-PET003" / "ses-followup" / "pet").glob("*.nii*")
+    )
+    assert not (tmp_path / "bids" / "sub-PET002").exists()
+    assert landing / "PET002_baseline" in watcher.pending
+    assert (tmp_path / "bids" / manifest_name).is_file()
+
+    # a restarted watcher finds everything already converted
+    restarted = Watcher(
+        landing,
+        tmp_path / "bids",
+        rules=[rule],
+        quiet_period=0,
+        options={"engine": "native", "silent": True},
+        kwargs="TimeZero=12:00:00",
+    )
+    monkeypatch.setattr(
+        restarted, "submit", lambda *args: pytest.fail("converted a unit again")
+    )
+    restarted.step()
+    restarted.step()
+    assert landing / "PET001_baseline" in restarted.handled
+    watcher.close()
+    restarted.close()
+
+
+def test_inotify_monitor(tmp_path):
+    if not sys.platform.startswith("linux"):
+        pytest.skip("inotify is only available on linux")
+    monitor = InotifyMonitor(tmp_path)
+    assert not monitor.wait(0.01)
+    (tmp_path / "new").mkdir()
+    assert monitor.wait(1)
+    (tmp_path / "new" / "file.dcm").write_bytes(b"")
+    assert monitor.wait(1)
+    monitor.close()